@@ -1,4 +1,4 @@
-from shiftd.engine import Engine
+from shiftd.engine import BatchError, Engine
 from shiftd.schema import TableModel
 
-__all__ = ["Engine", "TableModel"]
+__all__ = ["BatchError", "Engine", "TableModel"]
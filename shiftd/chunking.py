@@ -0,0 +1,128 @@
+"""Split large text files into record-aligned byte ranges and parse them in a pool.
+
+Used by the line-oriented parsers (CSV, TSV, JSONL): ranges are cut on newlines that
+end a record, parsed by module-level functions in worker processes or threads, and
+their results are handed back in file order.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+from shiftd.schema import TableModel
+
+# Files at least this large are read in parallel when a parser's ``workers`` is not set.
+PARALLEL_MIN_BYTES = 64 * 2**20
+DEFAULT_CHUNK_BYTES = 8 * 2**20
+
+Executor = Literal["process", "thread"]
+
+
+class RowError(ValueError):
+    """A bad row found by a worker. Picklable, so it can leave a worker process; the
+    parent re-raises it with :meth:`shifted` so ``row`` counts from the file start."""
+
+    def __init__(self, row: int, detail: str) -> None:
+        super().__init__(row, detail)
+        self.row, self.detail = row, detail
+
+    def __str__(self) -> str:
+        return f"row {self.row}: {self.detail}"
+
+    def shifted(self, offset: int) -> RowError:
+        return RowError(self.row + offset, self.detail)
+
+
+def check_executor(executor: str) -> None:
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor: {executor}. Available: ['process', 'thread']")
+
+
+def worker_count(workers: int | None, path: Path) -> int:
+    """``workers`` if set; otherwise one per CPU for files of ``PARALLEL_MIN_BYTES`` or more."""
+    if workers is not None:
+        return max(workers, 1)
+    if path.stat().st_size < PARALLEL_MIN_BYTES:
+        return 1
+    return os.process_cpu_count() or 1
+
+
+def record_end(mm: mmap.mmap, start: int, target: int, quote: bytes | None = None) -> int:
+    """The first offset at or after ``target`` that ends a record, for a range that begins
+    on a record boundary at ``start``. The end of the file if there is none.
+
+    With ``quote``, a newline ends a record only when an even number of quote bytes
+    precede it in the range; doubled quotes count twice and keep that parity.
+    """
+    size = len(mm)
+    if target >= size:
+        return size
+    odd = quote is not None and mm[start:target].count(quote) % 2 == 1
+    pos = target
+    while True:
+        nl = mm.find(b"\n", pos)
+        if nl == -1:
+            return size
+        if quote is not None:
+            odd ^= mm[pos : nl + 1].count(quote) % 2 == 1
+        if not odd:
+            return nl + 1
+        pos = nl + 1
+
+
+def split_ranges(
+    mm: mmap.mmap, start: int, chunk_bytes: int, quote: bytes | None = None
+) -> Iterator[tuple[int, int]]:
+    """Cut ``[start, EOF)`` into byte ranges of about ``chunk_bytes`` on record boundaries."""
+    while start < len(mm):
+        end = record_end(mm, start, start + chunk_bytes, quote)
+        yield start, end
+        start = end
+
+
+def read_range(path: str, start: int, end: int) -> str:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8")
+
+
+def map_ordered(
+    fn: Callable[..., Any],
+    jobs: Iterable[tuple[Any, ...]],
+    workers: int,
+    executor: Executor = "process",
+) -> Iterator[Any]:
+    """Yield ``fn(*job)`` for each job, in order, computed in a pool of ``workers``.
+
+    At most ``2 * workers`` jobs are in flight, so memory stays bounded however far the
+    pool runs ahead of the consumer. ``fn`` must be module-level for a process pool.
+    """
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=workers) as pool:
+        pending: deque[Future[Any]] = deque()
+        try:
+            for job in jobs:
+                pending.append(pool.submit(fn, *job))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def column_batches(
+    columns: list[str], data: Sequence[Sequence[Any]], batch_size: int
+) -> Iterator[TableModel]:
+    """Columnar tables of at most ``batch_size`` rows over one worker's column lists."""
+    n = len(data[0]) if data else 0
+    for offset in range(0, n, batch_size):
+        chunk = data if n <= batch_size else [v[offset : offset + batch_size] for v in data]
+        yield TableModel.from_columns(columns, dict(zip(columns, chunk)))
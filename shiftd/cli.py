@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Any
 
-from shiftd.engine import Engine
+from shiftd.engine import BatchError, Engine
+from shiftd.query import parse_where
 
 USAGE = """\
 Usage:
-  shiftd convert [--to FORMAT] INPUT OUTPUT
-  shiftd batch   --to FORMAT   INPUT [INPUT ...] OUTPUT_DIR
+  shiftd convert [--to FORMAT] [--streaming] [QUERY] INPUT OUTPUT
+  shiftd batch   --to FORMAT   [--streaming] [--jobs N] [QUERY] INPUT [INPUT ...] OUTPUT_DIR
   shiftd formats
+
+Query options (pushed down to the reader where the format allows):
+  --columns A,B,...   keep only these columns, in this order
+  --where EXPR        keep rows matching EXPR, e.g. "age >= 18 and country in ('IT', 'FR')"
+  --limit N           keep the first N matching rows
 """
 
 
@@ -20,32 +27,66 @@ def _die(msg: str) -> None:
     sys.exit(1)
 
 
-def _pop_flag(args: list[str], flag: str) -> tuple[str | None, list[str]]:
+def _pop_flag(args: list[str], flag: str, *, lower: bool = True) -> tuple[str | None, list[str]]:
     """Extract a --flag VALUE pair from args, return (value, remaining_args)."""
     if flag not in args:
         return None, args
     idx = args.index(flag)
     if idx + 1 >= len(args):
         _die(f"{flag} requires a value")
-    value = args[idx + 1].lower()
+    value = args[idx + 1].lower() if lower else args[idx + 1]
     return value, args[:idx] + args[idx + 2 :]
 
 
+def _pop_switch(args: list[str], flag: str) -> tuple[bool, list[str]]:
+    """Extract a boolean --flag from args, return (present, remaining_args)."""
+    if flag not in args:
+        return False, args
+    return True, [a for a in args if a != flag]
+
+
+def _pop_query(args: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """Extract --columns/--where/--limit, return (Engine keyword arguments, remaining_args)."""
+    columns, args = _pop_flag(args, "--columns", lower=False)
+    where, args = _pop_flag(args, "--where", lower=False)
+    limit, args = _pop_flag(args, "--limit")
+    if limit is not None and not limit.isdigit():
+        _die("--limit requires a whole number")
+    query: dict[str, Any] = {}
+    if columns is not None:
+        query["columns"] = [c.strip() for c in columns.split(",") if c.strip()]
+    if where is not None:
+        try:
+            query["where"] = parse_where(where)
+        except ValueError as e:
+            _die(f"--where: {e}")
+    if limit is not None:
+        query["limit"] = int(limit)
+    return query, args
+
+
 def _cmd_convert(args: list[str]) -> None:
     to, args = _pop_flag(args, "--to")
+    streaming, args = _pop_switch(args, "--streaming")
+    query, args = _pop_query(args)
     if len(args) != 2:
         _die(USAGE)
     source, target = Path(args[0]), Path(args[1])
     if not source.exists():
         _die(f"Input not found: {source}")
-    Engine().convert(source, target, to=to)
+    Engine().convert(source, target, to=to, streaming=streaming, **query)
     print(f"Converted {source} -> {target}")
 
 
 def _cmd_batch(args: list[str]) -> None:
     to, args = _pop_flag(args, "--to")
+    streaming, args = _pop_switch(args, "--streaming")
+    jobs, args = _pop_flag(args, "--jobs")
+    query, args = _pop_query(args)
     if not to:
         _die("batch requires --to FORMAT")
+    if jobs is not None and not jobs.isdigit():
+        _die("--jobs requires a whole number (0 = one per CPU)")
     if len(args) < 2:
         _die("batch requires at least one INPUT and an OUTPUT_DIR")
     *inputs, output_dir = args
@@ -53,7 +94,16 @@ def _cmd_batch(args: list[str]) -> None:
     for s in sources:
         if not s.exists():
             _die(f"Input not found: {s}")
-    results = Engine().batch(sources, output_dir, to=to)
+    workers = int(jobs) if jobs is not None else 1
+    try:
+        results = Engine().batch(
+            sources, output_dir, to=to, streaming=streaming, workers=workers or None, **query
+        )
+    except BatchError as e:
+        for r in e.results:
+            if r is not None:
+                print(f"  -> {r}")
+        _die(str(e))
     for r in results:
         print(f"  -> {r}")
     print(f"Converted {len(results)} file(s)")
@@ -0,0 +1,166 @@
+"""Columnar storage for TableModel: one buffer per column, rows built on access.
+
+:class:`ArrowRows` keeps a ``pyarrow.Table`` as the buffers. It never imports pyarrow
+itself: it only calls methods of the table it is given.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from shiftd.record import Record, record_type
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# Rows converted to Python objects at a time when an Arrow table is iterated.
+_ARROW_SLICE_ROWS = 65_536
+
+
+def pack_column(values: Sequence[Any]) -> Sequence[Any]:
+    """Store a column in the most compact buffer that holds it losslessly.
+
+    Homogeneous ``int`` columns become ``array('q')`` and homogeneous ``float`` columns
+    ``array('d')``. Anything else (strings, ``None``, mixed types) stays a list.
+    """
+    if isinstance(values, array):
+        return values
+    if not isinstance(values, list):
+        values = list(values)
+    if not values:
+        return values
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        if _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+            return array("q", values)
+    elif kinds == {float}:
+        return array("d", values)
+    return values
+
+
+def extend_column(buffer: Sequence[Any], values: Sequence[Any]) -> Sequence[Any]:
+    """Append ``values`` to a column buffer, widening a typed array to a list if needed."""
+    if isinstance(buffer, array):
+        if isinstance(values, array) and values.typecode == buffer.typecode:
+            buffer.extend(values)
+            return buffer
+        buffer = buffer.tolist()
+    buffer.extend(values)  # type: ignore[attr-defined]
+    return buffer
+
+
+class ColumnarRows(Sequence[Record]):
+    """Read-only sequence of rows over per-column buffers.
+
+    Only the buffers are stored; each row is assembled as a :class:`~shiftd.record.Record`
+    when it is accessed, so ``table.rows`` keeps reading like a list of dicts.
+    """
+
+    __slots__ = ("_columns", "_buffers", "_length")
+
+    def __init__(self, columns: Sequence[str], data: Mapping[str, Sequence[Any]]) -> None:
+        columns = tuple(columns)
+        if set(data) != set(columns):
+            raise ValueError(
+                f"column data keys {sorted(data)} do not match columns {sorted(columns)}"
+            )
+        buffers = tuple(data[c] for c in columns)
+        lengths = {len(b) for b in buffers}
+        if len(lengths) > 1:
+            sizes = {c: len(b) for c, b in zip(columns, buffers)}
+            raise ValueError(f"column buffers must have equal lengths, got {sizes}")
+        self._columns = columns
+        self._buffers = buffers
+        self._length = lengths.pop() if lengths else 0
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._columns
+
+    @property
+    def data(self) -> dict[str, Sequence[Any]]:
+        """Column name -> buffer. The buffers are shared, not copied."""
+        return dict(zip(self._columns, self._buffers))
+
+    def column(self, name: str) -> Sequence[Any]:
+        """The buffer of one column, shared, not copied."""
+        return self._buffers[self._columns.index(name)]
+
+    def iter_tuples(self) -> Iterator[tuple[Any, ...]]:
+        """Yield one tuple of values per row, in column order."""
+        return zip(*self._buffers)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return ColumnarRows(self._columns, {c: b[index] for c, b in self.data.items()})
+        return record_type(self._columns)([b[index] for b in self._buffers])
+
+    def __iter__(self) -> Iterator[Record]:
+        return map(record_type(self._columns), zip(*self._buffers))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows(columns={list(self._columns)}, rows={self._length})"
+
+
+class ArrowRows(ColumnarRows):
+    """Read-only sequence of rows over a ``pyarrow.Table``.
+
+    The table stays in Arrow memory (for a memory-mapped file, on disk) until rows are
+    read: iteration converts one slice of ``_ARROW_SLICE_ROWS`` rows to Python objects
+    at a time, so Arrow-to-Arrow conversions never box a single cell.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: Any) -> None:
+        self._table = table
+        self._columns = tuple(table.column_names)
+        self._length = table.num_rows
+
+    @property
+    def table(self) -> Any:
+        """The backing ``pyarrow.Table``, shared, not copied."""
+        return self._table
+
+    @property
+    def data(self) -> dict[str, Sequence[Any]]:
+        """Column name -> list of values. Converts every column to Python objects."""
+        return self._table.to_pydict()
+
+    def column(self, name: str) -> Sequence[Any]:
+        return self._table.column(name).to_pylist()
+
+    def iter_tuples(self) -> Iterator[tuple[Any, ...]]:
+        for batch in self._table.to_batches(max_chunksize=_ARROW_SLICE_ROWS):
+            yield from zip(*(col.to_pylist() for col in batch.columns))
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return ArrowRows(self._table.slice(start, max(stop - start, 0)))
+            return ArrowRows(self._table.take(list(range(start, stop, step))))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        row = self._table.slice(index, 1)
+        return record_type(self._columns)([col[0].as_py() for col in row.columns])
+
+    def __iter__(self) -> Iterator[Record]:
+        return map(record_type(self._columns), self.iter_tuples())
+
+    def __repr__(self) -> str:
+        return f"ArrowRows(columns={list(self._columns)}, rows={self._length})"
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Literal
 
 from shiftd.parsers import get_parser, list_parser_formats
-from shiftd.schema import TableModel
+from shiftd.parsers.registry import (
+    DEFAULT_BATCH_SIZE,
+    BatchParser,
+    Parser,
+    QueryParser,
+    is_query_parser,
+)
+from shiftd.query import Expr, Query
+from shiftd.schema import TableModel, ValidationLevel, validation_level
 from shiftd.serializers import get_serializer, list_serializer_formats
+from shiftd.serializers.registry import BatchSerializer, Serializer
 
 # Extension -> format name (lowercase, without dot)
 _EXT_TO_FORMAT: dict[str, str] = {
@@ -42,6 +54,88 @@ def infer_format(path: Path | str) -> str:
     return _EXT_TO_FORMAT[ext]
 
 
+def _new_parser(format_name: str, query: Query | None) -> Parser:
+    """The format's parser, given the query when it can apply it itself."""
+    cls = get_parser(format_name)
+    if query is not None and is_query_parser(cls):
+        return cls(**query.options())  # type: ignore[call-arg]
+    return cls()
+
+
+def _read(
+    parser: Parser,
+    source: Path,
+    batch_size: int,
+    validation: ValidationLevel,
+    query: Query | None,
+) -> Iterator[TableModel]:
+    """Batches of the source with the query applied, by the parser or while streaming."""
+    batches = _iter_batches(parser, source, batch_size, validation)
+    if query is None or isinstance(parser, QueryParser):
+        return batches
+    return query.apply(batches)
+
+
+def _iter_batches(
+    parser: Parser, source: Path, batch_size: int, validation: ValidationLevel
+) -> Iterator[TableModel]:
+    """Stream from the parser, or fall back to one whole-table batch.
+
+    The validation level is set only while the parser runs, never across a ``yield``.
+    """
+    if not isinstance(parser, BatchParser):
+        with validation_level(validation):
+            table = parser.parse(source)
+        yield table
+        return
+    batches = parser.iter_batches(source, batch_size)
+    columns: list[str] | None = None
+    while True:
+        with validation_level(validation):
+            batch = next(batches, None)
+        if batch is None:
+            return
+        if columns is None:
+            columns = batch.columns
+        elif batch.columns != columns:
+            raise ValueError(f"batch columns {batch.columns} differ from {columns}")
+        yield batch
+
+
+def _write_batches(serializer: Serializer, batches: Iterable[TableModel], target: Path) -> None:
+    """Write batches as they arrive, or collect them for a whole-table serializer."""
+    if isinstance(serializer, BatchSerializer):
+        serializer.write_batches(batches, target)
+    else:
+        serializer.serialize(TableModel.concat(batches), target)
+
+
+class BatchError(Exception):
+    """Several files of an :meth:`Engine.batch` run failed; all the others were converted.
+
+    ``results`` holds the output path for each source in input order (``None`` where it
+    failed) and ``errors`` maps each failed source to its exception.
+    """
+
+    def __init__(self, results: list[Path | None], errors: dict[Path, Exception]) -> None:
+        self.results = results
+        self.errors = errors
+        details = "\n".join(f"  {src}: {type(e).__name__}: {e}" for src, e in errors.items())
+        super().__init__(f"{len(errors)} of {len(results)} file(s) failed:\n{details}")
+
+
+def _convert_one(source: Path, target: Path, options: dict[str, Any]) -> Path:
+    """Module-level so that a process pool can pickle it."""
+    return Engine().convert(source, target, **options)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
 @dataclass
 class Engine:
     """Any data to any data.
@@ -57,11 +151,29 @@ class Engine:
         target: str | Path,
         *,
         to: str | None = None,
+        streaming: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validation: ValidationLevel = "full",
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
     ) -> Path:
-        """Convert a single file. Output format inferred from extension or set with ``to``."""
+        """Convert a single file. Output format inferred from extension or set with ``to``.
+
+        With ``streaming=True`` rows flow through in batches of ``batch_size``, so memory
+        stays bounded when both formats stream. Formats that cannot stream fall back to
+        reading or writing the whole table. ``validation``, ``columns``, ``where`` and
+        ``limit`` are passed to :meth:`parse`.
+        """
         source, target = Path(source), Path(target)
-        table = get_parser(infer_format(source))().parse(source)
-        get_serializer(to or infer_format(target))().serialize(table, target)
+        query = Query.build(columns, where, limit)
+        parser = _new_parser(infer_format(source), query)
+        serializer = get_serializer(to or infer_format(target))()
+        if streaming:
+            batches = _read(parser, source, batch_size, validation, query)
+            _write_batches(serializer, batches, target)
+        else:
+            serializer.serialize(self._parse_with(parser, source, validation, query), target)
         return target
 
     def batch(
@@ -70,16 +182,118 @@ class Engine:
         output_dir: str | Path,
         *,
         to: str,
+        streaming: bool = False,
+        validation: ValidationLevel = "full",
+        workers: int | None = 1,
+        executor: Literal["process", "thread"] = "process",
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
     ) -> list[Path]:
-        """Convert multiple files to the same output format."""
+        """Convert multiple files to the same output format.
+
+        ``columns``, ``where`` and ``limit`` apply to each file (see :meth:`parse`).
+
+        With ``workers`` > 1 (``None`` = one per CPU) files are converted in parallel in a
+        process or thread pool, largest first. Results keep the input order. A failing file
+        does not stop the others: once every file has been tried, a single failure is
+        re-raised as its own exception (with a note naming the file), and several are
+        reported together by :class:`BatchError` alongside the converted paths.
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor: {executor}. Available: ['process', 'thread']")
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        return [self.convert(src, output_dir / f"{Path(src).stem}.{to}", to=to) for src in sources]
+        jobs = [(Path(src), output_dir / f"{Path(src).stem}.{to}") for src in sources]
+        query = Query.build(columns, where, limit)  # parse a text filter once, fail early
+        options: dict[str, Any] = {"to": to, "streaming": streaming, "validation": validation}
+        if query is not None:
+            options.update(query.options())
+        results: list[Path | None] = [None] * len(jobs)
+        failed: dict[int, Exception] = {}
+        workers = min(workers or os.process_cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            for i, (source, target) in enumerate(jobs):
+                try:
+                    results[i] = self.convert(source, target, **options)
+                except Exception as e:
+                    failed[i] = e
+        else:
+            # Largest first, so a big file does not start last while the other workers idle.
+            order = sorted(range(len(jobs)), key=lambda i: _file_size(jobs[i][0]), reverse=True)
+            pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+            with pool_cls(max_workers=workers) as pool:
+                futures = {pool.submit(_convert_one, *jobs[i], options): i for i in order}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        failed[i] = e
+        if len(failed) == 1:
+            [(i, error)] = failed.items()
+            others = f"; the other {len(jobs) - 1} file(s) were converted" if len(jobs) > 1 else ""
+            error.add_note(f"while converting {jobs[i][0]}{others}")
+            raise error
+        if failed:
+            raise BatchError(results, {jobs[i][0]: failed[i] for i in sorted(failed)})
+        return results  # type: ignore[return-value]
+
+    def parse(
+        self,
+        source: str | Path,
+        *,
+        format: str | None = None,
+        validation: ValidationLevel = "full",
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
+    ) -> TableModel:
+        """Read a file into a validated TableModel.
+
+        ``validation`` sets how rows of dicts are checked against the columns: ``full``
+        (every row), ``sample`` (up to 1000 spread-out rows) or ``trusted`` (none).
+        Columnar sources are shape-checked by construction and skip this step.
 
-    def parse(self, source: str | Path, *, format: str | None = None) -> TableModel:
-        """Read a file into a validated TableModel."""
+        ``columns`` keeps only those columns, in that order; ``where`` keeps the rows
+        matching a filter (see :mod:`shiftd.query`: ``col("age") >= 18`` or the text
+        ``"age >= 18"``); ``limit`` stops after that many rows. Databases, Parquet and
+        Arrow apply them while reading; other formats apply them to each batch as it
+        streams, so unselected rows are never held together.
+        """
         source = Path(source)
-        return get_parser(format or infer_format(source))().parse(source)
+        query = Query.build(columns, where, limit)
+        parser = _new_parser(format or infer_format(source), query)
+        return self._parse_with(parser, source, validation, query)
+
+    def iter_batches(
+        self,
+        source: str | Path,
+        *,
+        format: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validation: ValidationLevel = "full",
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[TableModel]:
+        """Read a file as TableModel batches of at most ``batch_size`` rows (if it streams).
+
+        ``columns``, ``where`` and ``limit`` work as in :meth:`parse`.
+        """
+        source = Path(source)
+        query = Query.build(columns, where, limit)
+        parser = _new_parser(format or infer_format(source), query)
+        return _read(parser, source, batch_size, validation, query)
+
+    @staticmethod
+    def _parse_with(
+        parser: Parser, source: Path, validation: ValidationLevel, query: Query | None
+    ) -> TableModel:
+        if query is None or isinstance(parser, QueryParser):
+            with validation_level(validation):
+                return parser.parse(source)
+        return TableModel.concat(_read(parser, source, DEFAULT_BATCH_SIZE, validation, query))
 
     def serialize(
         self,
@@ -0,0 +1,135 @@
+"""Column-wise type inference for text formats: decide a column's type once, convert in bulk.
+
+Every cell follows the same rule as :func:`coerce_value` (null marker -> None,
+``true``/``false`` -> bool, digits -> int, anything ``float()`` accepts -> float, else
+the string), so the result never depends on which path converted it. What changes is
+the cost: a sample picks the likely type, the whole column is converted in one pass
+(with NumPy when installed), and cells are only parsed one by one where that fails.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import cache
+from itertools import islice
+from typing import Any
+
+from shiftd.schema import TableModel
+
+# Cells looked at to guess a column's type before converting all of it.
+_SAMPLE_CELLS = 100
+
+# First characters of strings that float() or the bool check could accept. Any other
+# string is a string whatever follows, so string columns skip per-cell parsing.
+_TYPED_START = frozenset("0123456789+-.iInNtTfF")
+
+_BOOLS = frozenset(("true", "false"))
+
+
+@cache
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def coerce_value(v: str, nulls: frozenset[str] = frozenset()) -> Any:
+    """Coerce one cell: null marker -> None, true/false -> bool, digits -> int, float, or v.
+
+    ``nulls`` holds lowercase markers, e.g. ``{"", "null"}`` for TOON.
+    """
+    low = v.lower()
+    if low in nulls:
+        return None
+    if low in _BOOLS:
+        return low == "true"
+    if v.isdigit():
+        try:
+            return int(v)
+        except ValueError:  # digit-like characters int() rejects, e.g. superscripts
+            pass
+    try:
+        return float(v)
+    except ValueError:
+        return v
+
+
+def _maybe_typed(v: str) -> bool:
+    c = v[:1]
+    return not c or c in _TYPED_START or c.isspace() or c.isdigit()
+
+
+def _bulk(values: list[str], typecode: str, convert: type) -> Sequence[Any]:
+    np = _numpy()
+    if np is None:
+        return array(typecode, map(convert, values))
+    dtype = np.int64 if typecode == "q" else np.float64
+    out = array(typecode)
+    out.frombytes(np.fromiter(map(convert, values), dtype, len(values)).tobytes())
+    return out
+
+
+def _infer_strings(values: list[str], nulls: frozenset[str]) -> Sequence[Any]:
+    """Infer a column of strings none of which is a null marker."""
+    if not values:
+        return values
+    step = max(len(values) // _SAMPLE_CELLS, 1)
+    sample = {type(coerce_value(v, nulls)) for v in islice(values, 0, None, step)}
+    try:
+        if sample == {int} and all(map(str.isdigit, values)):
+            return _bulk(values, "q", int)
+        if sample == {float} and not any(map(str.isdigit, values)):
+            return _bulk(values, "d", float)
+    except (ValueError, OverflowError):
+        pass  # a cell of another type, or an int beyond 64 bits: go cell by cell
+    if sample == {bool}:
+        lowered = list(map(str.lower, values))
+        if _BOOLS.issuperset(lowered):
+            return [v == "true" for v in lowered]
+    if sample == {str}:
+        out = list(values)
+        for i, v in enumerate(values):
+            if _maybe_typed(v):
+                out[i] = coerce_value(v, nulls)
+        return out
+    return [coerce_value(v, nulls) for v in values]
+
+
+def infer_column(values: Iterable[Any], nulls: Iterable[str] = ()) -> Sequence[Any]:
+    """Coerce the strings of a column as :func:`coerce_value` would, column at a time.
+
+    Non-string values (``None``, nested dicts) pass through unchanged. All-int and
+    all-float columns come back as ``array('q')`` / ``array('d')``, ready for
+    :meth:`~shiftd.schema.TableModel.from_columns`.
+    """
+    values = values if isinstance(values, list) else list(values)
+    null_set = frozenset(n.lower() for n in nulls)
+    if set(map(type, values)) <= {str}:
+        if null_set and not null_set.isdisjoint(map(str.lower, values)):
+            return [coerce_value(v, null_set) for v in values]
+        return _infer_strings(values, null_set)
+    positions = [i for i, v in enumerate(values) if type(v) is str]
+    converted = infer_column([values[i] for i in positions], null_set)
+    out = list(values)
+    for i, v in zip(positions, converted):
+        out[i] = v
+    return out
+
+
+def infer_table(
+    columns: list[str], rows: Iterable[Sequence[Any]], nulls: Iterable[str] = ()
+) -> TableModel:
+    """Build a columnar table from rows of cells, inferring each column's type.
+
+    Short rows are padded with None; extra cells beyond the columns are ignored.
+    """
+    width = len(columns)
+    rows = [
+        row if len(row) == width else [*row[:width], *[None] * (width - len(row))] for row in rows
+    ]
+    buffers = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+    data = {c: infer_column(buf, nulls) for c, buf in zip(columns, buffers)}
+    return TableModel.from_columns(columns, data)
@@ -2,31 +2,77 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
+from shiftd.query import Expr, Query, scan_arrow
 from shiftd.schema import TableModel
 
 
+def _import_arrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+    except ImportError as e:
+        raise ImportError(
+            "Arrow support requires optional dependency: uv add 'shiftd[arrow]'"
+        ) from e
+    return pa, ipc
+
+
 @register_parser("arrow")
 class ArrowParser:
-    """Read Arrow IPC file into TableModel."""
+    """Read Arrow IPC file into an Arrow-backed TableModel, memory-mapped, without copying.
+
+    ``columns``, ``where`` (a :class:`~shiftd.query.Expr` or its text form) and ``limit``
+    are applied by an Arrow dataset scan, so unselected columns are never touched.
+    """
+
+    def __init__(
+        self,
+        *,
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
+    ) -> None:
+        self.columns = columns
+        self.where = where
+        self.limit = limit
 
     def parse(self, source: Path | str) -> TableModel:
-        try:
-            import pyarrow as pa
-            import pyarrow.ipc as ipc
-        except ImportError as e:
-            raise ImportError(
-                "Arrow support requires optional dependency: uv add 'shiftd[arrow]'"
-            ) from e
+        pa, ipc = _import_arrow()
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
+        if query := Query.build(self.columns, self.where, self.limit):
+            return TableModel.concat(scan_arrow(path, "ipc", query, DEFAULT_BATCH_SIZE))
         with pa.memory_map(str(path), "r") as f:
             table = ipc.open_file(f).read_all()
         if table.num_rows == 0 and table.num_columns == 0:
             return TableModel(columns=[], rows=[])
-        columns = table.column_names
-        rows = table.to_pylist()
-        return TableModel(columns=columns, rows=rows)
+        return TableModel.from_arrow(table)
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        """Slice the memory-mapped record batches; pages are only touched when converted."""
+        pa, ipc = _import_arrow()
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        if query := Query.build(self.columns, self.where, self.limit):
+            yield from scan_arrow(path, "ipc", query, batch_size)
+            return
+        with pa.memory_map(str(path), "r") as f:
+            reader = ipc.open_file(f)
+            columns = reader.schema.names
+            empty = True
+            for i in range(reader.num_record_batches):
+                record_batch = reader.get_batch(i)
+                for offset in range(0, record_batch.num_rows, batch_size):
+                    empty = False
+                    chunk = record_batch.slice(offset, batch_size)
+                    yield TableModel.from_arrow(pa.Table.from_batches([chunk]))
+            if empty and columns:
+                yield TableModel.from_arrow(reader.schema.empty_table())
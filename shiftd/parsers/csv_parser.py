@@ -1,26 +1,321 @@
 """Parse CSV into TableModel."""
 
 import csv
+import io
+import mmap
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import batched
 from pathlib import Path
+from typing import Any, Literal
 
-from shiftd.parsers.registry import register_parser
+from shiftd.chunking import (
+    DEFAULT_CHUNK_BYTES,
+    Executor,
+    RowError,
+    check_executor,
+    column_batches,
+    map_ordered,
+    read_range,
+    record_end,
+    split_ranges,
+    worker_count,
+)
+from shiftd.infer import infer_column
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
 
+def _iter_chunks(
+    reader: Iterable[list[str]], width: int, restval: Any, size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[list[list[Any]]]:
+    """Yield lists of rows with blank lines skipped and short rows padded with ``restval``."""
+    seen = 0
+    for chunk in batched(reader, size):
+        rows = [r for r in chunk if r]
+        if any(len(r) != width for r in rows):
+            rows = _fit_rows(rows, width, restval, seen)
+        seen += len(rows)
+        if rows:
+            yield rows
+
+
+def _fit_rows(rows: list[list[Any]], width: int, restval: Any, start: int) -> list[list[Any]]:
+    out: list[list[Any]] = []
+    for i, r in enumerate(rows, start):
+        if len(r) > width:
+            raise RowError(i, f"columns mismatch; {len(r)} values for {width} columns")
+        out.append(r + [restval] * (width - len(r)) if len(r) < width else r)
+    return out
+
+
+# _split_quote() result for dialects whose record ends cannot be found without parsing.
+_UNSPLITTABLE = b""
+
+
+def _split_quote(fmtparams: dict[str, Any]) -> bytes | None:
+    """The quote byte to track when looking for record ends; None if quotes are literal.
+
+    A newline ends a record when an even number of quote characters precede it in the
+    range. Doubled quotes count twice and keep that parity; an escape character does not,
+    so such dialects are read sequentially.
+    """
+    dialect = csv.reader([], **fmtparams).dialect
+    if dialect.quoting == csv.QUOTE_NONE:
+        return None
+    if dialect.escapechar or not dialect.quotechar or len(dialect.quotechar.encode()) != 1:
+        return _UNSPLITTABLE
+    return dialect.quotechar.encode()
+
+
+def _to_columns(rows: list[list[Any]], infer_types: bool) -> list[Sequence[Any]]:
+    if infer_types:
+        return [infer_column(list(values)) for values in zip(*rows)]
+    return [list(values) for values in zip(*rows)]
+
+
+def _parse_range(
+    path: str,
+    start: int,
+    end: int,
+    width: int,
+    restval: Any,
+    fmtparams: dict[str, Any],
+    infer_types: bool,
+) -> list[Sequence[Any]]:
+    """Parse one byte range into column lists. Module-level so a process pool can pickle it."""
+    text = read_range(path, start, end)
+    reader = csv.reader(io.StringIO(text, newline=""), **fmtparams)
+    rows = [r for r in reader if r]
+    if any(len(r) != width for r in rows):
+        rows = _fit_rows(rows, width, restval, 0)
+    return _to_columns(rows, infer_types)
+
+
+# csv.reader format parameters -> pyarrow.csv.ParseOptions fields.
+_ARROW_PARSE_OPTIONS = {
+    "delimiter": "delimiter",
+    "quotechar": "quote_char",
+    "doublequote": "double_quote",
+    "escapechar": "escape_char",
+}
+
+CSVEngine = Literal["auto", "python", "arrow"]
+
+
+def _import_arrow_csv():
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError as e:
+        raise ImportError(
+            "engine='arrow' requires optional dependency: uv add 'shiftd[arrow]'"
+        ) from e
+    return pa, pa_csv
+
+
 @register_parser("csv")
 class CSVParser:
-    """Read CSV file into validated TableModel."""
+    """Read CSV file into a columnar TableModel (one buffer per column).
 
-    def __init__(self, **kwargs: object) -> None:
+    ``engine`` picks the reader. ``arrow`` parses with ``pyarrow.csv`` into an
+    Arrow-backed table, every column kept as strings, so a CSV to Parquet or Arrow
+    conversion never creates a Python object per cell. ``python`` uses the ``csv``
+    module. ``auto`` (default) takes ``arrow`` when pyarrow is installed and every
+    option maps onto it, and falls back to ``python`` for files pyarrow rejects, such
+    as rows shorter than the header (padded with ``restval`` by the ``python`` reader).
+
+    The ``python`` reader splits the file into byte ranges of about ``chunk_bytes`` that
+    end on record boundaries (newlines outside quotes) and parses them in a pool of
+    ``workers`` processes (or threads, with ``executor="thread"``), in order. With
+    ``workers=None`` that happens for files of at least ``PARALLEL_MIN_BYTES`` (see
+    :mod:`shiftd.chunking`), one worker per CPU; ``workers=1`` reads sequentially.
+    ``pyarrow.csv`` has its own threads: ``workers=1`` turns them off.
+
+    Cells are read as strings. With ``infer_types=True`` the ``python`` reader coerces
+    each column like the other text formats (see :mod:`shiftd.infer`), and ``arrow``
+    uses pyarrow's own type inference.
+    """
+
+    def __init__(
+        self,
+        engine: CSVEngine = "auto",
+        *,
+        workers: int | None = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        executor: Executor = "process",
+        infer_types: bool = False,
+        **kwargs: object,
+    ) -> None:
+        if engine not in ("auto", "python", "arrow"):
+            raise ValueError(f"Unknown engine: {engine}. Available: ['auto', 'python', 'arrow']")
+        check_executor(executor)
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes must be positive")
+        self.engine = engine
+        self.workers = workers
+        self.chunk_bytes = chunk_bytes
+        self.executor = executor
+        self.infer_types = infer_types
         self.kwargs = kwargs
 
-    def parse(self, path: Path) -> TableModel:
+    def parse(self, path: Path | str) -> TableModel:
+        path = Path(path)
+        if self._use_arrow():
+            pa, _ = _import_arrow_csv()
+            try:
+                return self._read_arrow(path)
+            except pa.ArrowInvalid:
+                if self.engine == "arrow":
+                    raise
+        return TableModel.concat(self._iter_python(path, DEFAULT_BATCH_SIZE))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        """Stream batches. With the Arrow reader a malformed row found after the first
+        batch cannot fall back any more and raises ``ValueError``."""
+        path = Path(source)
+        if not self._use_arrow():
+            yield from self._iter_python(path, batch_size)
+            return
+        pa, _ = _import_arrow_csv()
+        started = False
+        try:
+            for batch in self._iter_arrow(path, batch_size):
+                started = True
+                yield batch
+        except pa.ArrowInvalid as e:
+            if started or self.engine == "arrow":
+                raise ValueError(f"{path}: {e}; use engine='python' to pad short rows") from e
+            yield from self._iter_python(path, batch_size)
+
+    def _use_arrow(self) -> bool:
+        if self.engine != "auto":
+            return self.engine == "arrow"
+        supported = {"fieldnames", "restval", *_ARROW_PARSE_OPTIONS}
+        if not set(self.kwargs) <= supported:
+            return False
+        try:
+            _import_arrow_csv()
+        except ImportError:
+            return False
+        return True
+
+    def _arrow_options(self, path: Path) -> tuple[Any, Any, Any] | None:
+        """Read, parse and convert options that keep every column a string, or None if
+        the file has no header."""
+        pa, pa_csv = _import_arrow_csv()
+        fmtparams = {k: v for k, v in self.kwargs.items() if k in _ARROW_PARSE_OPTIONS}
+        fieldnames = self.kwargs.get("fieldnames")
+        if fieldnames:
+            columns = list(fieldnames)  # type: ignore[call-overload]
+        else:
+            # pyarrow drops a UTF-8 BOM, so read the header the same way.
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                columns = next(csv.reader(f, **fmtparams), None)  # type: ignore[arg-type]
+            if not columns:
+                return None
+        read = pa_csv.ReadOptions(
+            column_names=columns if fieldnames else None, use_threads=self.workers != 1
+        )
+        parse = pa_csv.ParseOptions(
+            newlines_in_values=True,
+            **{_ARROW_PARSE_OPTIONS[k]: v for k, v in fmtparams.items()},
+        )
+        column_types = {} if self.infer_types else {c: pa.string() for c in columns}
+        convert = pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=False)
+        return read, parse, convert
+
+    def _read_arrow(self, path: Path) -> TableModel:
+        _, pa_csv = _import_arrow_csv()
         if not path.exists():
             raise FileNotFoundError(str(path))
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, **self.kwargs)
-            rows = list(reader)
-        if not rows:
+        options = self._arrow_options(path)
+        if options is None:
+            return TableModel(columns=[], rows=[])
+        read, parse, convert = options
+        table = pa_csv.read_csv(
+            path, read_options=read, parse_options=parse, convert_options=convert
+        )
+        if table.num_rows == 0:
             return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+        return TableModel.from_arrow(table)
+
+    def _iter_arrow(self, path: Path, batch_size: int) -> Iterator[TableModel]:
+        pa, pa_csv = _import_arrow_csv()
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        options = self._arrow_options(path)
+        if options is None:
+            return
+        read, parse, convert = options
+        reader = pa_csv.open_csv(
+            path, read_options=read, parse_options=parse, convert_options=convert
+        )
+        for record_batch in reader:
+            for offset in range(0, record_batch.num_rows, batch_size):
+                chunk = record_batch.slice(offset, batch_size)
+                yield TableModel.from_arrow(pa.Table.from_batches([chunk]))
+
+    def _iter_python(self, path: Path, batch_size: int) -> Iterator[TableModel]:
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        fmtparams = dict(self.kwargs)
+        fieldnames = fmtparams.pop("fieldnames", None)
+        restval = fmtparams.pop("restval", None)
+        workers = worker_count(self.workers, path)
+        if workers > 1:
+            quote = _split_quote(fmtparams)
+            if quote != _UNSPLITTABLE:
+                yield from self._iter_parallel(
+                    path, fieldnames, restval, fmtparams, quote, workers, batch_size
+                )
+                return
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f, **fmtparams)
+            columns = list(fieldnames) if fieldnames else next(reader, None)
+            if not columns:
+                return
+            for rows in _iter_chunks(reader, len(columns), restval, batch_size):
+                data = _to_columns(rows, self.infer_types)
+                yield TableModel.from_columns(columns, dict(zip(columns, data)))
+
+    def _iter_parallel(
+        self,
+        path: Path,
+        fieldnames: Any,
+        restval: Any,
+        fmtparams: dict[str, Any],
+        quote: bytes | None,
+        workers: int,
+        batch_size: int,
+    ) -> Iterator[TableModel]:
+        """Parse byte ranges in a pool and yield their rows in file order."""
+        if path.stat().st_size == 0:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            if fieldnames:
+                columns = list(fieldnames)
+            else:
+                start = record_end(mm, 0, 0, quote)
+                header = mm[:start].decode("utf-8")
+                columns = next(csv.reader(io.StringIO(header, newline=""), **fmtparams), None)
+                if not columns:
+                    return
+            # Ranges are cut lazily, so parsing starts before the whole file is scanned.
+            jobs = (
+                (str(path), lo, hi, len(columns), restval, fmtparams, self.infer_types)
+                for lo, hi in split_ranges(mm, start, self.chunk_bytes, quote)
+            )
+            seen = 0
+            results = map_ordered(_parse_range, jobs, workers, self.executor)
+            while True:
+                try:
+                    data = next(results, None)
+                except RowError as e:
+                    raise e.shifted(seen) from None
+                if data is None:
+                    return
+                yield from column_batches(columns, data, batch_size)
+                seen += len(data[0]) if data else 0
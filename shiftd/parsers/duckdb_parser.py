@@ -2,52 +2,164 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
+from shiftd.query import Expr
 from shiftd.schema import TableModel
 
 
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError(
+            "DuckDB support requires optional dependency: uv add 'shiftd[duckdb]'"
+        ) from e
+    return duckdb
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _qualified(table: str) -> str:
+    """``schema.table`` (or ``table``) as a quoted identifier."""
+    return ".".join(map(_quote, table.split(".", 1)))
+
+
+def _arrow_table(result: Any) -> Any:
+    # DuckDB 1.4 renamed the Arrow fetch methods; older releases only have the fetch_* names.
+    fetch = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+    return fetch()
+
+
+def _arrow_reader(result: Any, batch_size: int) -> Any:
+    fetch = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+    return fetch(batch_size)
+
+
 @register_parser("duckdb")
 class DuckDBParser:
-    """Read a DuckDB table into TableModel. Source: path to .duckdb file."""
+    """Read a DuckDB table into TableModel. Source: path to .duckdb file.
+
+    With pyarrow installed, results come straight from DuckDB's Arrow export: ``parse``
+    returns one Arrow-backed table and ``iter_batches`` streams Arrow record batches, so
+    no value is converted to a Python object until a row is read.
 
-    def __init__(self, table: str | None = None, **kwargs: object) -> None:
+    ``table`` may be schema-qualified. ``query`` reads the result of any SQL query
+    instead of a table. ``columns``, ``where`` (an SQL condition, with ``?`` or ``$name``
+    placeholders bound from ``params``, or a :class:`~shiftd.query.Expr`) and ``limit``
+    are run by DuckDB, around the query if one is given.
+    """
+
+    def __init__(
+        self,
+        table: str | None = None,
+        *,
+        query: str | None = None,
+        columns: Sequence[str] | None = None,
+        where: str | Expr | None = None,
+        params: Sequence[Any] | Mapping[str, Any] = (),
+        limit: int | None = None,
+        **kwargs: object,
+    ) -> None:
+        if table and query:
+            raise ValueError("Pass either table or query, not both")
         self.table = table
+        self.query = query
+        self.columns = columns
+        self.where = where
+        self.params = params
+        self.limit = limit
         self.kwargs = kwargs
 
     def parse(self, source: Path | str) -> TableModel:
+        if not _has_pyarrow():
+            return TableModel.concat(self.iter_batches(source))
+        conn = self._connect(source)
         try:
-            import duckdb
-        except ImportError as e:
-            raise ImportError(
-                "DuckDB support requires optional dependency: uv add 'shiftd[duckdb]'"
-            ) from e
-
-        path = Path(source)
-        if not path.exists():
-            raise FileNotFoundError(str(path))
+            result = self._select(conn)
+            if result is None:
+                return TableModel(columns=[], rows=[])
+            return TableModel.from_arrow(_arrow_table(result))
+        finally:
+            conn.close()
 
-        conn = duckdb.connect(str(path), read_only=True)
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        conn = self._connect(source)
         try:
-            if self.table:
-                table_name = self.table
-            else:
-                result = conn.execute(
-                    "SELECT table_name FROM information_schema.tables "
-                    "WHERE table_schema = 'main' LIMIT 1"
-                ).fetchone()
-                if not result:
-                    return TableModel(columns=[], rows=[])
-                table_name = result[0]
-
-            result = conn.execute(f'SELECT * FROM "{table_name}"')
+            result = self._select(conn)
+            if result is None:
+                return
+            if _has_pyarrow():
+                yield from self._iter_arrow(result, batch_size)
+                return
             columns = [desc[0] for desc in result.description]
-            raw_rows = result.fetchall()
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                yield TableModel.from_columns(columns, {c: [] for c in columns})
+            while rows:
+                yield TableModel.from_tuples(columns, rows)
+                rows = result.fetchmany(batch_size)
         finally:
             conn.close()
 
-        if not raw_rows:
-            return TableModel(columns=columns, rows=[])
-        rows = [dict(zip(columns, row)) for row in raw_rows]
-        return TableModel(columns=columns, rows=rows)
+    @staticmethod
+    def _iter_arrow(result: Any, batch_size: int) -> Iterator[TableModel]:
+        """One Arrow-backed table per record batch of at most ``batch_size`` rows."""
+        import pyarrow as pa
+
+        reader = _arrow_reader(result, batch_size)
+        empty = True
+        for record_batch in reader:
+            if record_batch.num_rows:
+                empty = False
+                yield TableModel.from_arrow(pa.Table.from_batches([record_batch]))
+        if empty:
+            yield TableModel.from_arrow(reader.schema.empty_table())
+
+    def _connect(self, source: Path | str) -> Any:
+        duckdb = _import_duckdb()
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        return duckdb.connect(str(path), read_only=True)
+
+    def _select(self, conn: Any) -> Any:
+        """Run the SELECT on the query or the configured (or first) table; None if no table."""
+        if self.query:
+            from_clause = f"({self.query}) AS shiftd_query"
+        elif self.table:
+            from_clause = _qualified(self.table)
+        else:
+            result = conn.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' LIMIT 1"
+            ).fetchone()
+            if not result:
+                return None
+            from_clause = _quote(result[0])
+        select = ", ".join(map(_quote, self.columns)) if self.columns else "*"
+        sql = f"SELECT {select} FROM {from_clause}"
+        params = self.params
+        if isinstance(self.where, Expr):
+            condition, params = self.where.to_sql(_quote, "?")
+            sql += f" WHERE {condition}"
+        elif self.where:
+            sql += f" WHERE {self.where}"
+        if self.limit is not None:
+            sql += f" LIMIT {int(self.limit)}"
+        return conn.execute(sql, params or None)
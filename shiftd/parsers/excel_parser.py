@@ -2,37 +2,126 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from itertools import batched
 from pathlib import Path
+from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.chunking import Executor, check_executor, map_ordered, worker_count
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
 
+def _load_workbook(path: Path | str) -> Any:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ImportError(
+            "Excel support requires optional dependency: uv add 'shiftd[excel]'"
+        ) from e
+    return load_workbook(path, read_only=True, data_only=True)
+
+
+def _worksheet(wb: Any, sheet: str | int | None) -> Any:
+    if sheet is None:
+        return wb.active
+    names = wb.sheetnames
+    if isinstance(sheet, int):
+        if not -len(names) <= sheet < len(names):
+            raise ValueError(f"Sheet index {sheet} out of range; the workbook has {len(names)}")
+        return wb[names[sheet]]
+    if sheet not in names:
+        raise ValueError(f"Unknown sheet: {sheet}. Available: {names}")
+    return wb[sheet]
+
+
+def _iter_sheet(ws: Any, batch_size: int) -> Iterator[TableModel]:
+    rows_iter = ws.iter_rows(values_only=True)
+    header = next(rows_iter, None)
+    if not header:
+        return
+    columns = [str(c) for c in header]
+    empty = True
+    for chunk in batched(rows_iter, batch_size):
+        empty = False
+        yield TableModel.from_tuples(columns, chunk)
+    if empty:  # a header alone still names the columns
+        yield TableModel.from_tuples(columns, [])
+
+
+def _read_sheet(path: str, name: str) -> tuple[list[str], dict[str, Sequence[Any]]]:
+    """Read one sheet to columns. Module-level so a process pool can pickle it."""
+    wb = _load_workbook(path)
+    try:
+        table = TableModel.concat(_iter_sheet(wb[name], DEFAULT_BATCH_SIZE))
+    finally:
+        wb.close()
+    return table.columns, table.to_columns()
+
+
 @register_parser("xlsx")
 @register_parser("excel")
 class ExcelParser:
-    """Read the first sheet of an Excel file into TableModel."""
+    """Read one sheet of an Excel file into TableModel, or all of them.
+
+    ``sheet`` picks a sheet by name or index; the default is the active sheet. The
+    first row of a sheet is its header. :meth:`parse_sheets` reads several sheets, in
+    a pool of ``workers`` processes (or threads) when there is more than one; with
+    ``workers=None`` that happens for files of at least ``PARALLEL_MIN_BYTES`` (see
+    :mod:`shiftd.chunking`).
+    """
+
+    def __init__(
+        self,
+        sheet: str | int | None = None,
+        *,
+        workers: int | None = None,
+        executor: Executor = "process",
+    ) -> None:
+        check_executor(executor)
+        self.sheet = sheet
+        self.workers = workers
+        self.executor = executor
 
     def parse(self, source: Path | str) -> TableModel:
-        try:
-            from openpyxl import load_workbook
-        except ImportError as e:
-            raise ImportError(
-                "Excel support requires optional dependency: uv add 'shiftd[excel]'"
-            ) from e
+        return TableModel.concat(self.iter_batches(source))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
-        wb = load_workbook(path, read_only=True, data_only=True)
-        ws = wb.active
-        rows_iter = ws.iter_rows(values_only=True)
-        header = next(rows_iter, None)
-        if not header:
+        wb = _load_workbook(path)
+        try:
+            yield from _iter_sheet(_worksheet(wb, self.sheet), batch_size)
+        finally:
             wb.close()
-            return TableModel(columns=[], rows=[])
-        columns = [str(c) for c in header]
-        rows = [{columns[i]: cell for i, cell in enumerate(row)} for row in rows_iter]
+
+    def parse_sheets(
+        self, source: Path | str, sheets: Sequence[str] | None = None
+    ) -> dict[str, TableModel]:
+        """Sheet name -> table for ``sheets`` (default: every sheet), in workbook order."""
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        wb = _load_workbook(path)
+        names = wb.sheetnames
         wb.close()
-        if not rows:
-            return TableModel(columns=columns, rows=[])
-        return TableModel(columns=columns, rows=rows)
+        if sheets is not None:
+            unknown = [s for s in sheets if s not in names]
+            if unknown:
+                raise ValueError(f"Unknown sheet: {unknown[0]}. Available: {names}")
+            names = list(sheets)
+        workers = min(worker_count(self.workers, path), len(names))
+        jobs = [(str(path), name) for name in names]
+        if workers > 1:
+            results = map_ordered(_read_sheet, jobs, workers, self.executor)
+        else:
+            results = (_read_sheet(*job) for job in jobs)
+        return {
+            name: TableModel.from_columns(columns, data)
+            if columns
+            else TableModel(columns=[], rows=[])
+            for name, (columns, data) in zip(names, results)
+        }
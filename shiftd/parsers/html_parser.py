@@ -2,92 +2,267 @@
 
 from __future__ import annotations
 
+from html.parser import HTMLParser as _HTMLParser
 from pathlib import Path
 from typing import Any
 
+from shiftd.infer import infer_table
 from shiftd.parsers.registry import register_parser
 from shiftd.schema import TableModel
 
+# Characters fed to the tokenizer at a time.
+_READ_CHARS = 1 << 16
 
-def _parse_attr(v: str) -> Any:
-    """Try to coerce string values to int/float/bool."""
-    if v.lower() in ("true", "false"):
-        return v.lower() == "true"
-    if v.isdigit():
-        return int(v)
-    try:
-        return float(v)
-    except ValueError:
-        return v
+# Span limits from the HTML spec; rowspan="0" spans the rest of the row group.
+_MAX_COLSPAN = 1000
+_MAX_ROWSPAN = 65534
+
+_ROW_GROUPS = frozenset(("thead", "tbody", "tfoot"))
+
+
+def _span(attrs: list[tuple[str, str | None]], name: str, limit: int) -> int:
+    for key, value in attrs:
+        if key == name:
+            try:
+                n = int(value or "")
+            except ValueError:
+                return 1
+            if n == 0 and name == "rowspan":
+                return limit
+            return min(max(n, 1), limit)
+    return 1
+
+
+class _Table:
+    """Rows of one <table> as they are read; ``keep=False`` tracks nesting only."""
+
+    def __init__(self, key: str, keep: bool) -> None:
+        self.key = key
+        self.keep = keep
+        self.head: list[list[str | None]] = []  # rows inside <thead>
+        self.rows: list[list[str | None]] = []
+        self.in_head = False
+        self.spans: dict[int, list[Any]] = {}  # column -> [rows left, text] from rowspan
+        self.pending: dict[int, list[Any]] = {}  # spans not yet copied into this row
+        self.row: list[str | None] | None = None
+        self.cell: list[str] | None = None
+        self.colspan = self.rowspan = 1
+
+    def _fill_spans(self, row: list[str | None], to_end: bool) -> None:
+        """Append cells spanning down from earlier rows at the end of ``row``; with
+        ``to_end``, all that remain, leaving None in the gaps of a short row."""
+        pending = self.pending
+        while pending:
+            col = len(row)
+            span = pending.pop(col, None)
+            if span is None:
+                if not to_end:
+                    return
+                row.extend([None] * (min(pending) - col))
+                continue
+            row.append(span[1])
+            span[0] -= 1
+
+    def _open_row(self) -> list[str | None]:
+        self.row = []
+        self.pending = dict(self.spans)
+        return self.row
+
+    def start_row(self) -> None:
+        self.end_row()
+        self._open_row()
+
+    def start_cell(self, attrs: list[tuple[str, str | None]]) -> None:
+        self.end_cell()
+        if self.row is None:
+            self._open_row()
+        self.cell = []
+        self.colspan = _span(attrs, "colspan", _MAX_COLSPAN)
+        self.rowspan = _span(attrs, "rowspan", _MAX_ROWSPAN)
+
+    def end_cell(self) -> None:
+        if self.cell is None or self.row is None:
+            return
+        text = "".join(self.cell).strip()
+        self.cell = None
+        row = self.row
+        self._fill_spans(row, to_end=False)
+        for _ in range(self.colspan):
+            if self.rowspan > 1:
+                self.spans[len(row)] = [self.rowspan - 1, text]
+            row.append(text)
+
+    def end_row(self) -> None:
+        self.end_cell()
+        if self.row is None:
+            return
+        row, self.row = self.row, None
+        self._fill_spans(row, to_end=True)
+        self.spans = {c: span for c, span in self.spans.items() if span[0]}
+        (self.head if self.in_head else self.rows).append(row)
+
+    def start_group(self, tag: str) -> None:
+        self.end_row()
+        self.spans.clear()  # rowspans stop at the row group
+        self.in_head = tag == "thead"
+
+    def end_group(self) -> None:
+        self.end_row()
+        self.spans.clear()
+        self.in_head = False
+
+    def to_table(self) -> TableModel:
+        """The header row (or the <thead> rows joined per column) over the other rows."""
+        if self.head:
+            header = _join_header(self.head)
+            body = self.rows
+        elif len(self.rows) >= 2:
+            header = [c or "" for c in self.rows[0]]
+            body = self.rows[1:]
+        else:
+            body = []
+        if not body:
+            return TableModel(columns=[], rows=[])
+        return infer_table(_unique_names(header), body)
+
+
+def _unique_names(names: list[str]) -> list[str]:
+    """Suffix repeated names (``Name``, ``Name_2``, ...), e.g. a header cell spanning columns."""
+    taken = set(names)  # a suffixed name must not clash with a later original one
+    seen: set[str] = set()
+    out: list[str] = []
+    for name in names:
+        unique, n = name, 1
+        while unique in seen or (n > 1 and unique in taken):
+            n += 1
+            unique = f"{name}_{n}"
+        seen.add(unique)
+        out.append(unique)
+    return out
+
+
+def _join_header(rows: list[list[str | None]]) -> list[str]:
+    """One name per column from stacked header rows, e.g. a colspan group over its parts."""
+    if len(rows) == 1:
+        return [c or "" for c in rows[0]]
+    names: list[str] = []
+    for col in range(max(map(len, rows))):
+        parts: list[str] = []
+        for row in rows:
+            cell = row[col] if col < len(row) else None
+            if cell and (not parts or parts[-1] != cell):
+                parts.append(cell)
+        names.append(" ".join(parts))
+    return names
+
+
+class _TableExtractor(_HTMLParser):
+    """Collect tables in one pass. With ``wanted`` set, only that table (by order of
+    its opening tag) keeps its cells, and ``done`` turns True once it has closed."""
+
+    def __init__(self, wanted: int | None = None) -> None:
+        super().__init__()
+        self.wanted = wanted
+        self.tables: dict[str, _Table] = {}
+        self.done = False
+        self._stack: list[_Table] = []
+        self._count = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        if tag == "table":
+            index = self._count
+            self._count += 1
+            key = dict(attrs).get("id") or ""
+            if not key or key in self.tables:
+                key = f"table_{index}"
+            table = _Table(key, keep=self.wanted is None or index == self.wanted)
+            if table.keep:  # added when opened, so nested tables keep document order
+                self.tables[key] = table
+            self._stack.append(table)
+            return
+        if not self._stack or not self._stack[-1].keep:
+            return
+        table = self._stack[-1]
+        if tag in ("td", "th"):
+            table.start_cell(attrs)
+        elif tag == "tr":
+            table.start_row()
+        elif tag in _ROW_GROUPS:
+            table.start_group(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.done or not self._stack:
+            return
+        if tag == "table":
+            self._close_table()
+            return
+        table = self._stack[-1]
+        if not table.keep:
+            return
+        if tag in ("td", "th"):
+            table.end_cell()
+        elif tag == "tr":
+            table.end_row()
+        elif tag in _ROW_GROUPS:
+            table.end_group()
+
+    def handle_data(self, data: str) -> None:
+        if self._stack:
+            cell = self._stack[-1].cell
+            if cell is not None and not self.done:
+                cell.append(data)
+
+    def _close_table(self) -> None:
+        table = self._stack.pop()
+        if not table.keep:
+            return
+        table.end_row()
+        if self.wanted is not None:
+            self.done = True
+
+    def finish(self) -> None:
+        """Close tables left open at the end of the document, as browsers do."""
+        if not self.done:
+            self.close()
+        while self._stack and not self.done:
+            self._close_table()
+
+
+def _extract(path: Path, wanted: int | None) -> list[_Table]:
+    if not path.exists():
+        raise FileNotFoundError(str(path))
+    extractor = _TableExtractor(wanted)
+    with open(path, encoding="utf-8") as f:
+        while not extractor.done and (chunk := f.read(_READ_CHARS)):
+            extractor.feed(chunk)
+    extractor.finish()
+    return list(extractor.tables.values())
 
 
 @register_parser("html")
 class HTMLParser:
-    """Read the first HTML <table> into TableModel.
+    """Read one HTML <table> (``table_index``, by document order) into TableModel.
 
-    Uses only the stdlib html.parser — no extra dependencies.
+    The file is fed to the stdlib tokenizer in chunks and reading stops as soon as the
+    table closes. ``colspan``/``rowspan`` cells are repeated over the slots they cover.
+    The header is the ``<thead>`` (several rows joined per column) or else the first
+    row. Uses only the stdlib html.parser — no extra dependencies.
     """
 
     def __init__(self, table_index: int = 0, **kwargs: object) -> None:
         self.table_index = table_index
         self.kwargs = kwargs
 
-    def parse(self, path: Path) -> TableModel:
-        if not path.exists():
-            raise FileNotFoundError(str(path))
-
-        from html.parser import HTMLParser as _HTMLParser
-
-        class _TableExtractor(_HTMLParser):
-            def __init__(self) -> None:
-                super().__init__()
-                self.tables: list[list[list[str]]] = []
-                self._in_table = False
-                self._in_row = False
-                self._in_cell = False
-                self._current_row: list[str] = []
-                self._current_cell = ""
-                self._current_table: list[list[str]] = []
-
-            def handle_starttag(self, tag: str, attrs: list) -> None:
-                if tag == "table":
-                    self._in_table = True
-                    self._current_table = []
-                elif tag in ("tr",) and self._in_table:
-                    self._in_row = True
-                    self._current_row = []
-                elif tag in ("td", "th") and self._in_row:
-                    self._in_cell = True
-                    self._current_cell = ""
-
-            def handle_endtag(self, tag: str) -> None:
-                if tag in ("td", "th") and self._in_cell:
-                    self._in_cell = False
-                    self._current_row.append(self._current_cell.strip())
-                elif tag == "tr" and self._in_row:
-                    self._in_row = False
-                    self._current_table.append(self._current_row)
-                elif tag == "table" and self._in_table:
-                    self._in_table = False
-                    self.tables.append(self._current_table)
-
-            def handle_data(self, data: str) -> None:
-                if self._in_cell:
-                    self._current_cell += data
-
-        with open(path, encoding="utf-8") as f:
-            content = f.read()
-
-        extractor = _TableExtractor()
-        extractor.feed(content)
-
-        if not extractor.tables or self.table_index >= len(extractor.tables):
-            return TableModel(columns=[], rows=[])
-
-        raw = extractor.tables[self.table_index]
-        if len(raw) < 2:
-            return TableModel(columns=[], rows=[])
+    def parse(self, path: Path | str) -> TableModel:
+        # Counted from the end, every table has to be read first.
+        wanted = self.table_index if self.table_index >= 0 else None
+        tables = _extract(Path(path), wanted)
+        if wanted is None:
+            tables = tables[self.table_index :][:1] if -self.table_index <= len(tables) else []
+        return tables[0].to_table() if tables else TableModel(columns=[], rows=[])
 
-        columns = raw[0]
-        rows = [{col: _parse_attr(val) for col, val in zip(columns, r)} for r in raw[1:]]
-        return TableModel(columns=columns, rows=rows)
+    def parse_tables(self, path: Path | str) -> dict[str, TableModel]:
+        """Every table in one pass, keyed by its ``id`` or else ``table_<index>``."""
+        return {t.key: t.to_table() for t in _extract(Path(path), None)}
@@ -1,31 +1,218 @@
 """Parse JSON into TableModel."""
 
 import json
+import re
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any, TextIO
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
+# Characters read from the file at a time while streaming.
+_READ_CHARS = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# A decode error this close to the buffer end may be a token cut off by the read (``tru``,
+# ``"\u00``); further in, the text is invalid whatever comes next.
+_TRUNCATION_TAIL = 8
+
+# A number is only known to be complete once one of these follows it.
+_NUMBER_START = frozenset("-0123456789")
+_AFTER_VALUE = frozenset(",]}: \t\n\r")
+
+
+class _JSONStream:
+    """Incremental reader over a JSON text: values are decoded one at a time with
+    ``JSONDecoder.raw_decode`` from a sliding buffer, so only the value being decoded
+    (plus one read) is ever held in memory.
+    """
+
+    def __init__(self, f: TextIO, decoder: json.JSONDecoder, read_chars: int = _READ_CHARS) -> None:
+        self._f = f
+        self._decoder = decoder
+        self._read_chars = read_chars
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, chars: int | None = None) -> bool:
+        """Read more text; False at end of file. Drops the consumed part of the buffer."""
+        if self._eof:
+            return False
+        chunk = self._f.read(chars or self._read_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character ('' at end of input), without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``chars``."""
+        c = self.peek()
+        if not c or c not in chars:
+            found = repr(c) if c else "end of input"
+            raise ValueError(f"invalid JSON: expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return c
+
+    def value(self) -> Any:
+        """Decode the next value. A value running past the buffer end is retried with a
+        larger read, and so is a number not yet followed by a delimiter: "1" of "12"
+        decodes fine on its own."""
+        self.peek()
+        chars = self._read_chars
+        while True:
+            buf, pos = self._buf, self._pos
+            try:
+                obj, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                # Only an error that more text could resolve is worth another read; a
+                # malformed file is not buffered to its end before failing.
+                truncated = e.msg.startswith("Unterminated string") or (
+                    e.pos >= len(buf) - _TRUNCATION_TAIL
+                )
+                if not truncated or not self._fill(chars):
+                    raise ValueError(f"invalid JSON: {e.msg}") from e
+                chars *= 2
+                continue
+            partial = end == len(buf) or (
+                buf[pos] in _NUMBER_START and buf[end] not in _AFTER_VALUE
+            )
+            if partial and self._fill(chars):
+                chars *= 2
+                continue
+            self._pos = end
+            return obj
+
+    def descend(self, keys: list[str]) -> None:
+        """Walk object keys down to the value at ``keys``, leaving it next in the stream.
+
+        Values of other keys are decoded and dropped on the way.
+        """
+        for depth, key in enumerate(keys):
+            missing = ValueError(f"JSON path {'.'.join(keys[: depth + 1])!r} not found")
+            self.expect("{")
+            if self.peek() == "}":
+                raise missing
+            while True:
+                name = self.value()
+                self.expect(":")
+                if name == key:
+                    break
+                self.value()
+                if self.expect(",}") == "}":
+                    raise missing
+
+    def items(self) -> Iterator[Any]:
+        """Yield the elements of the array that comes next in the stream.
+
+        Elements followed by ``,`` or ``]`` inside the buffer are decoded in a tight loop;
+        only one that reaches the buffer end goes through :meth:`value` to read more.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        decode = self._decoder.raw_decode
+        skip = _WHITESPACE.match
+        while True:
+            buf = self._buf
+            pos = skip(buf, self._pos).end()  # type: ignore[union-attr]
+            while True:
+                try:
+                    obj, end = decode(buf, pos)
+                except json.JSONDecodeError:
+                    break
+                sep = skip(buf, end).end()  # type: ignore[union-attr]
+                if sep >= len(buf) or buf[sep] not in ",]":
+                    break
+                self._pos = sep + 1
+                yield obj
+                if buf[sep] == "]":
+                    return
+                pos = skip(buf, sep + 1).end()  # type: ignore[union-attr]
+            self._pos = pos
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
 
 @register_parser("json")
 class JSONParser:
-    """Read JSON (array of objects or single object) into TableModel."""
+    """Read JSON (array of objects or single object) into TableModel.
+
+    ``iter_batches`` streams the array element by element, so memory is bounded by the
+    batch size rather than the file size. ``parse`` decodes the whole document at once
+    with ``json.load``, which is faster when the table is held whole anyway.
+    ``json_path`` selects a nested array by object keys, e.g. ``"data.items"`` for
+    ``{"data": {"items": [...]}}``, and is always streamed. Other keyword arguments go
+    to ``json.JSONDecoder`` (``parse_float``, ``object_hook``, ...).
+    """
 
-    def __init__(self, **kwargs: object) -> None:
+    def __init__(self, json_path: str | None = None, **kwargs: object) -> None:
+        self.json_path = json_path
         self.kwargs = kwargs
 
-    def parse(self, path: Path) -> TableModel:
+    def parse(self, path: Path | str) -> TableModel:
+        if self.json_path:
+            return TableModel.concat(self.iter_batches(path))
+        path = Path(path)
         if not path.exists():
             raise FileNotFoundError(str(path))
         with open(path, encoding="utf-8") as f:
-            data = json.load(f, **self.kwargs)
+            data = json.load(f, **self.kwargs)  # type: ignore[arg-type]
         if isinstance(data, list):
-            rows = [dict(r) for r in data]
+            rows = [r if type(r) is dict else dict(r) for r in data]
         elif isinstance(data, dict):
             rows = [data]
         else:
             rows = []
         if not rows:
             return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+        return TableModel(columns=list(rows[0].keys()), rows=rows)
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        columns: list[str] | None = None
+        rows: list[dict[str, Any]] = []
+        with open(path, encoding="utf-8") as f:
+            for row in self._iter_rows(_JSONStream(f, json.JSONDecoder(**self.kwargs))):
+                rows.append(row)
+                if len(rows) >= batch_size:
+                    columns = columns or list(rows[0].keys())
+                    yield TableModel(columns=columns, rows=rows)
+                    rows = []
+        if rows:
+            yield TableModel(columns=columns or list(rows[0].keys()), rows=rows)
+
+    def _iter_rows(self, stream: _JSONStream) -> Iterator[dict[str, Any]]:
+        if self.json_path:
+            stream.descend(self.json_path.split("."))
+        first = stream.peek()
+        if first == "[":
+            for r in stream.items():
+                yield r if type(r) is dict else dict(r)
+        elif first == "{":
+            yield stream.value()
+        elif first:
+            stream.value()  # a scalar holds no rows
+        else:
+            raise ValueError("invalid JSON: expected a value, found end of input")
+        if not self.json_path and stream.peek():
+            raise ValueError("invalid JSON: extra data after the top-level value")
@@ -3,25 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
 
+from shiftd.infer import infer_table
 from shiftd.parsers.registry import register_parser
 from shiftd.schema import TableModel
 
 
-def _parse_value(v: str) -> Any:
-    """Try to coerce string values to int/float/bool."""
-    v = v.strip()
-    if v.lower() in ("true", "false"):
-        return v.lower() == "true"
-    if v.isdigit():
-        return int(v)
-    try:
-        return float(v)
-    except ValueError:
-        return v
-
-
 def _parse_row(line: str) -> list[str]:
     """Split a Markdown table row into cell values."""
     line = line.strip()
@@ -66,14 +53,8 @@ class MarkdownParser:
         columns = _parse_row(table_lines[0])
 
         # Skip separator line(s), parse data rows
-        rows: list[dict[str, Any]] = []
-        for line in table_lines[1:]:
-            if _is_separator(line):
-                continue
-            values = _parse_row(line)
-            row = {col: _parse_value(val) for col, val in zip(columns, values)}
-            rows.append(row)
+        rows = [_parse_row(line) for line in table_lines[1:] if not _is_separator(line)]
 
         if not rows:
             return TableModel(columns=[], rows=[])
-        return TableModel(columns=columns, rows=rows)
+        return infer_table(columns, rows)
@@ -2,29 +2,73 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
+from shiftd.query import Expr, Query, scan_arrow
 from shiftd.schema import TableModel
 
 
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet support requires optional dependency: uv add 'shiftd[arrow]'"
+        ) from e
+    return pa, pq
+
+
 @register_parser("parquet")
 class ParquetParser:
-    """Read Parquet file into TableModel."""
+    """Read Parquet file into an Arrow-backed TableModel (values stay in Arrow memory).
+
+    ``columns``, ``where`` (a :class:`~shiftd.query.Expr` or its text form) and ``limit``
+    are pushed into the scan: only the selected columns are decoded, and row groups whose
+    min/max statistics rule the filter out are skipped without being read.
+    """
+
+    def __init__(
+        self,
+        *,
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
+    ) -> None:
+        self.columns = columns
+        self.where = where
+        self.limit = limit
 
     def parse(self, source: Path | str) -> TableModel:
-        try:
-            import pyarrow.parquet as pq
-        except ImportError as e:
-            raise ImportError(
-                "Parquet support requires optional dependency: uv add 'shiftd[arrow]'"
-            ) from e
+        _, pq = _import_parquet()
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
+        if query := Query.build(self.columns, self.where, self.limit):
+            return TableModel.concat(scan_arrow(path, "parquet", query, DEFAULT_BATCH_SIZE))
         table = pq.read_table(path)
         if table.num_rows == 0 and table.num_columns == 0:
             return TableModel(columns=[], rows=[])
-        columns = table.column_names
-        rows = table.to_pylist()
-        return TableModel(columns=columns, rows=rows)
+        return TableModel.from_arrow(table)
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        """Read one record batch at a time; only the current row group is held in memory."""
+        pa, pq = _import_parquet()
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        if query := Query.build(self.columns, self.where, self.limit):
+            yield from scan_arrow(path, "parquet", query, batch_size)
+            return
+        with pq.ParquetFile(path) as pf:
+            columns = pf.schema_arrow.names
+            empty = True
+            for batch in pf.iter_batches(batch_size=batch_size):
+                empty = False
+                yield TableModel.from_arrow(pa.Table.from_batches([batch]))
+            if empty and columns:
+                yield TableModel.from_arrow(pf.schema_arrow.empty_table())
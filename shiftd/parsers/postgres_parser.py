@@ -2,49 +2,236 @@
 
 from __future__ import annotations
 
+import datetime
+import decimal
+import io
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
+from shiftd.query import Expr
 from shiftd.schema import TableModel
 
+# Decoders for COPY text values by column type OID; other types are read as str. Values a
+# decoder rejects (``infinity`` dates, ``BC`` years, ``24:00:00``) are kept as text.
+_COPY_TYPES: dict[int, Callable[[str], Any]] = {
+    16: lambda v: v == "t",  # bool
+    17: lambda v: bytes.fromhex(v[2:]),  # bytea (hex output)
+    20: int,  # int8
+    21: int,  # int2
+    23: int,  # int4
+    26: int,  # oid
+    700: float,  # float4
+    701: float,  # float8
+    1082: datetime.date.fromisoformat,
+    1083: datetime.time.fromisoformat,
+    1114: datetime.datetime.fromisoformat,  # timestamp
+    1184: datetime.datetime.fromisoformat,  # timestamptz
+    1700: decimal.Decimal,  # numeric
+}
+
+_COPY_ESCAPE = re.compile(r"\\(.)")
+_COPY_UNESCAPE = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+# Chunks of COPY output buffered between the server reader thread and the batch builder.
+_COPY_QUEUE_CHUNKS = 64
+
+
+def _import_psycopg2():
+    try:
+        import psycopg2
+    except ImportError as e:
+        raise ImportError(
+            "PostgreSQL support requires optional dependency: uv add 'shiftd[postgres]'"
+        ) from e
+    return psycopg2
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _qualified(table: str) -> str:
+    """``schema.table`` (or ``table``) as a quoted identifier."""
+    return ".".join(map(_quote, table.split(".", 1)))
+
+
+def _unescape(field: str) -> str:
+    if "\\" not in field:
+        return field
+    return _COPY_ESCAPE.sub(lambda m: _COPY_UNESCAPE.get(m[1], m[1]), field)
+
+
+def _decode_or_text(decode: Callable[[str], Any], field: str) -> Any:
+    text = _unescape(field)
+    try:
+        return decode(text)
+    except ValueError:
+        return text
+
+
+class _CopySink(io.TextIOBase):
+    """Writable file that hands COPY output chunks to a bounded queue."""
+
+    def __init__(self, chunks: queue.Queue[str | None]) -> None:
+        self.chunks = chunks
+        self.closed_by_reader = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if self.closed_by_reader:
+            raise OSError("COPY reader stopped")
+        self.chunks.put(data)
+        return len(data)
+
 
 @register_parser("postgres")
 @register_parser("postgresql")
 class PostgresParser:
-    """Read a PostgreSQL table into TableModel. Source: connection string. Optional: table name."""
+    """Read a PostgreSQL table into TableModel. Source: connection string. Optional: table name.
+
+    ``table`` may be schema-qualified (``"sales.orders"``). ``columns``, ``where`` (an
+    SQL condition, with ``%s`` or ``%(name)s`` placeholders bound from ``params``, or a
+    :class:`~shiftd.query.Expr`) and ``limit`` run on the server. Rows stream through a
+    server-side cursor fetching ``batch_size`` rows at a time. ``copy=True`` reads
+    ``COPY (SELECT ...) TO STDOUT`` instead, decoding int, float, numeric, bool, bytea,
+    date and time columns and reading other types as text.
+    """
 
-    def __init__(self, table: str | None = None, **kwargs: object) -> None:
+    def __init__(
+        self,
+        table: str | None = None,
+        *,
+        columns: Sequence[str] | None = None,
+        where: str | Expr | None = None,
+        params: Sequence[Any] | Mapping[str, Any] = (),
+        limit: int | None = None,
+        copy: bool = False,
+        **kwargs: object,
+    ) -> None:
         self.table = table
+        self.columns = columns
+        self.where = where
+        self.params = params
+        self.limit = limit
+        self.copy = copy
         self.kwargs = kwargs
 
     def parse(self, source: Path | str) -> TableModel:
+        return TableModel.concat(self.iter_batches(source))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        """Stream through a server-side (named) cursor; rows stay on the server until fetched."""
+        psycopg2 = _import_psycopg2()
+        conn = psycopg2.connect(str(source), **self.kwargs)
         try:
-            import psycopg2
-            from psycopg2.extras import RealDictCursor
-        except ImportError as e:
-            raise ImportError(
-                "PostgreSQL support requires optional dependency: uv add 'shiftd[postgres]'"
-            ) from e
-        dsn = str(source)
-        conn = psycopg2.connect(dsn, **self.kwargs)
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        try:
-            if self.table:
-                cur.execute(f'SELECT * FROM "{self.table}"')
-            else:
-                cur.execute(
-                    "SELECT table_name FROM information_schema.tables "
-                    "WHERE table_schema = 'public' AND table_type = 'BASE TABLE' LIMIT 1"
-                )
-                row = cur.fetchone()
-                if not row:
-                    conn.close()
-                    return TableModel(columns=[], rows=[])
-                cur.execute(f'SELECT * FROM "{row["table_name"]}"')
-            rows = [dict(r) for r in cur.fetchall()]
+            with conn.cursor() as lookup:
+                table_name = self._table_name(lookup)
+                if table_name is None:
+                    return
+                sql = lookup.mogrify(*self._select(table_name)).decode()
+            if self.copy:
+                yield from self._iter_copy(conn, sql, batch_size)
+                return
+            cur = conn.cursor(name="shiftd_batches")
+            cur.itersize = batch_size
+            cur.execute(sql)
+            rows = cur.fetchmany(batch_size)
+            columns = [desc[0] for desc in cur.description]
+            while rows:
+                yield TableModel.from_tuples(columns, rows)
+                rows = cur.fetchmany(batch_size)
+            cur.close()
         finally:
             conn.close()
-        if not rows:
-            return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+
+    def _select(self, table_name: str) -> tuple[str, Sequence[Any] | Mapping[str, Any] | None]:
+        """The SELECT and its parameters (None without any, so a literal % stays as is)."""
+        select = ", ".join(map(_quote, self.columns)) if self.columns else "*"
+        sql = f"SELECT {select} FROM {_qualified(table_name)}"
+        params = self.params
+        if isinstance(self.where, Expr):
+            condition, params = self.where.to_sql(_quote, "%s")
+            sql += f" WHERE {condition}"
+        elif self.where:
+            sql += f" WHERE {self.where}"
+        if self.limit is not None:
+            sql += f" LIMIT {int(self.limit)}"
+        return sql, params or None
+
+    def _iter_copy(self, conn: Any, sql: str, batch_size: int) -> Iterator[TableModel]:
+        """Run COPY TO STDOUT in a thread and build batches from its text rows as they arrive."""
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT * FROM ({sql}) AS shiftd_query LIMIT 0")
+            columns = [desc[0] for desc in cur.description]
+            decoders = [_COPY_TYPES.get(desc[1]) for desc in cur.description]
+        chunks: queue.Queue[str | None] = queue.Queue(_COPY_QUEUE_CHUNKS)
+        sink = _CopySink(chunks)
+        errors: list[BaseException] = []
+
+        def run_copy() -> None:
+            try:
+                with conn.cursor() as cur:
+                    cur.copy_expert(f"COPY ({sql}) TO STDOUT", sink)
+            except BaseException as e:  # re-raised in the reading thread
+                errors.append(e)
+            finally:
+                chunks.put(None)
+
+        thread = threading.Thread(target=run_copy, name="shiftd-copy", daemon=True)
+        thread.start()
+        try:
+            lines: list[str] = []
+            tail = ""
+            while (chunk := chunks.get()) is not None:
+                *complete, tail = (tail + chunk).split("\n")
+                lines.extend(complete)
+                while len(lines) >= batch_size:
+                    yield self._copy_batch(columns, decoders, lines[:batch_size])
+                    del lines[:batch_size]
+            if errors:
+                raise errors[0]
+            if lines:
+                yield self._copy_batch(columns, decoders, lines)
+        finally:
+            sink.closed_by_reader = True
+            while thread.is_alive():  # drain so a blocked writer can see the flag and stop
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    @staticmethod
+    def _copy_batch(
+        columns: list[str], decoders: list[Callable[[str], Any] | None], lines: list[str]
+    ) -> TableModel:
+        fields = zip(*(line.split("\t") for line in lines))
+        data: dict[str, list[Any]] = {}
+        for name, decode, values in zip(columns, decoders, fields):
+            if decode is None:
+                data[name] = [None if v == "\\N" else _unescape(v) for v in values]
+                continue
+            try:
+                data[name] = [None if v == "\\N" else decode(_unescape(v)) for v in values]
+            except ValueError:
+                data[name] = [None if v == "\\N" else _decode_or_text(decode, v) for v in values]
+        return TableModel.from_columns(columns, data)
+
+    def _table_name(self, cur) -> str | None:
+        if self.table:
+            return self.table
+        cur.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = 'public' AND table_type = 'BASE TABLE' LIMIT 1"
+        )
+        row = cur.fetchone()
+        return row[0] if row else None
@@ -1,12 +1,16 @@
 """Registry of format parsers."""
 
+import inspect
+from collections.abc import Iterator, Sequence
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from shiftd.schema import TableModel
 
 Source = Path | str
 
+DEFAULT_BATCH_SIZE = 65_536
+
 
 class Parser(Protocol):
     """Parse a source (file path or connection string) into TableModel."""
@@ -14,6 +18,43 @@ class Parser(Protocol):
     def parse(self, source: Source) -> TableModel: ...
 
 
+@runtime_checkable
+class BatchParser(Parser, Protocol):
+    """Parser that can also read a source as a stream of TableModel batches.
+
+    Every batch has the same columns and at most ``batch_size`` rows, so memory stays
+    bounded by the batch size rather than by the size of the source.
+    """
+
+    def iter_batches(
+        self, source: Source, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]: ...
+
+
+@runtime_checkable
+class QueryParser(Parser, Protocol):
+    """Parser that reads only some columns and rows of a source itself.
+
+    It takes ``columns``, ``where`` (a :class:`~shiftd.query.Expr`) and ``limit`` as
+    constructor arguments and applies them in full in ``parse`` and ``iter_batches``,
+    pushing them into the source as far as its format allows. See :mod:`shiftd.query`.
+    """
+
+    columns: Sequence[str] | None
+    where: Any
+    limit: int | None
+
+
+def is_query_parser(cls: type[Parser]) -> bool:
+    """Whether instances of ``cls`` are :class:`QueryParser`, judged from its constructor
+    (protocols with attributes cannot be checked with ``issubclass``)."""
+    try:
+        params = inspect.signature(cls).parameters
+    except (TypeError, ValueError):
+        return False
+    return all(name in params for name in ("columns", "where", "limit"))
+
+
 _REGISTRY: dict[str, type[Parser]] = {}
 
 
@@ -3,42 +3,123 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
+from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
+from shiftd.query import Expr
 from shiftd.schema import TableModel
 
+# Bytes of the database file memory-mapped for reads.
+_MMAP_BYTES = 256 * 2**20
+
+_USER_TABLES = (
+    "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' "
+    "ORDER BY rowid"
+)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
 
 @register_parser("sqlite")
 class SQLiteParser:
-    """Read a SQLite table into TableModel. Source: path to .db file. Optional: table name."""
+    """Read a SQLite table into TableModel. Source: path to .db file. Optional: table name.
+
+    The database is opened read-only and memory-mapped, and rows are fetched in batches
+    of plain tuples. ``columns``, ``where`` (an SQL condition, with ``?`` or ``:name``
+    placeholders bound from ``params``, or a :class:`~shiftd.query.Expr`) and ``limit``
+    are run by SQLite. ``query`` reads the result of any SELECT instead of a table; the
+    other options then apply to it.
+    """
 
-    def __init__(self, table: str | None = None, **kwargs: object) -> None:
+    def __init__(
+        self,
+        table: str | None = None,
+        *,
+        query: str | None = None,
+        columns: Sequence[str] | None = None,
+        where: str | Expr | None = None,
+        params: Sequence[Any] | Mapping[str, Any] = (),
+        limit: int | None = None,
+        **kwargs: object,
+    ) -> None:
+        if table and query:
+            raise ValueError("Pass either table or query, not both")
         self.table = table
+        self.query = query
+        self.columns = columns
+        self.where = where
+        self.params = params
+        self.limit = limit
         self.kwargs = kwargs
 
     def parse(self, source: Path | str) -> TableModel:
-        path = Path(source)
-        if not path.exists():
-            raise FileNotFoundError(str(path))
-        db_path = str(path)
-        conn = sqlite3.connect(db_path, **self.kwargs)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
+        return TableModel.concat(self.iter_batches(source))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        conn = self._connect(source)
         try:
-            if self.table:
-                cur.execute(f'SELECT * FROM "{self.table}"')
+            if self.query:
+                from_clause = f"({self.query})"
+            elif self.table:
+                from_clause = _quote(self.table)
             else:
-                cur.execute("SELECT name FROM sqlite_master WHERE type='table' LIMIT 1")
-                row = cur.fetchone()
+                row = conn.execute(_USER_TABLES).fetchone()
                 if not row:
-                    conn.close()
-                    return TableModel(columns=[], rows=[])
-                cur.execute(f'SELECT * FROM "{row[0]}"')
-            rows = [dict(r) for r in cur.fetchall()]
+                    return
+                from_clause = _quote(row[0])
+            yield from self._select(conn, from_clause, batch_size)
+        finally:
+            conn.close()
+
+    def parse_tables(self, source: Path | str) -> dict[str, TableModel]:
+        """Every table in the database (internal ``sqlite_*`` ones aside), by name.
+
+        ``columns``, ``where`` and ``limit`` apply to each table.
+        """
+        conn = self._connect(source)
+        try:
+            names = [r[0] for r in conn.execute(_USER_TABLES)]
+            return {
+                name: TableModel.concat(self._select(conn, _quote(name), DEFAULT_BATCH_SIZE))
+                for name in names
+            }
         finally:
             conn.close()
-        if not rows:
-            return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+
+    def _connect(self, source: Path | str) -> sqlite3.Connection:
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        uri = f"{path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, **self.kwargs)  # type: ignore[arg-type]
+        conn.execute(f"PRAGMA mmap_size={_MMAP_BYTES}")
+        return conn
+
+    def _select(
+        self, conn: sqlite3.Connection, from_clause: str, batch_size: int
+    ) -> Iterator[TableModel]:
+        select = ", ".join(map(_quote, self.columns)) if self.columns else "*"
+        sql = f"SELECT {select} FROM {from_clause}"
+        params = self.params
+        if isinstance(self.where, Expr):
+            condition, params = self.where.to_sql(_quote, "?")
+            sql += f" WHERE {condition}"
+        elif self.where:
+            sql += f" WHERE {self.where}"
+        if self.limit is not None:
+            if isinstance(params, Mapping):
+                sql += " LIMIT :_shiftd_limit"
+                params = {**params, "_shiftd_limit": self.limit}
+            else:
+                sql += " LIMIT ?"
+                params = [*params, self.limit]
+        cur = conn.execute(sql, params)
+        columns = [desc[0] for desc in cur.description]
+        while rows := cur.fetchmany(batch_size):
+            yield TableModel.from_tuples(columns, rows)
@@ -1,106 +1,150 @@
 """Parse TOON (Token-Oriented Object Notation) into TableModel.
 
 Tabular format: [N]{field1,field2,...}: then N lines of comma-separated values.
+The block may be named (``key[N]{...}:``) and nested inside objects (``key:`` lines
+with the block indented below them).
 """
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import TextIO
 
-from shiftd.parsers.registry import register_parser
+from shiftd.infer import infer_table
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
+# Cells read as None (case-insensitive).
+_NULLS = ("", "null")
 
-def _parse_cell(s: str) -> Any:
-    """Parse one TOON cell string to Python type."""
-    s = s.strip()
-    if s == "" or s.lower() == "null":
-        return None
-    if s.startswith('"') and s.endswith('"') and len(s) >= 2:
-        return s[1:-1].replace('\\"', '"')
-    if s.lower() == "true":
-        return True
-    if s.lower() == "false":
-        return False
-    if s.isdigit():
-        return int(s)
-    try:
-        return float(s)
-    except ValueError:
-        return s
+# [N]{fields}:   or   key[N]{fields}:
+_TABULAR_HEADER = re.compile(r"^(?:(?P<key>\w+))?\[(?P<n>\d+)\]\{(?P<fields>[^}]+)\}:\s*$")
+
+# key:  -- opens a nested object
+_OBJECT_KEY = re.compile(r"^(?P<key>\w+):\s*$")
+
+# One cell and its delimiter: a double-quoted string (backslash escapes, or doubled
+# quotes as older files have them) or bare text up to the next comma.
+_CELL = re.compile(r'[ \t]*(?:"((?:[^"\\]|\\.|"")*)"[ \t]*|([^,]*))(?:,|$)')
+
+_ESCAPE = re.compile(r'\\(.)|""')
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+
+def _unescape(m: re.Match[str]) -> str:
+    c = m.group(1)
+    if c is None:
+        return '"'
+    return _ESCAPES.get(c, "\\" + c)
 
 
 def _split_row(row_str: str) -> list[str]:
-    """Split a TOON row by comma, respecting double-quoted strings."""
+    """Split a TOON row by comma. Bare cells are stripped; quoted ones are unescaped."""
+    if '"' not in row_str:
+        if " " not in row_str and "\t" not in row_str:
+            return row_str.split(",")
+        return [c.strip() for c in row_str.split(",")]
     out: list[str] = []
-    cur: list[str] = []
-    i = 0
-    in_quote = False
-    while i < len(row_str):
-        c = row_str[i]
-        if c == '"':
-            if in_quote and i + 1 < len(row_str) and row_str[i + 1] == '"':
-                cur.append('"')
-                i += 2
-                continue
-            in_quote = not in_quote
-            i += 1
-            continue
-        if c == "," and not in_quote:
-            out.append("".join(cur))
-            cur = []
-            i += 1
-            continue
-        cur.append(c)
-        i += 1
-    out.append("".join(cur))
-    return out
-
-
-# Root-level: [N]{fields}:   or   key[N]{fields}:
-_TABULAR_HEADER = re.compile(r"^(?:(?P<key>\w+))?\[(?P<n>\d+)\]\{(?P<fields>[^}]+)\}:\s*$")
+    match = _CELL.match
+    pos = 0
+    while True:
+        m = match(row_str, pos)
+        assert m is not None  # the bare alternative matches anywhere
+        quoted, bare = m.groups()
+        if quoted is None:
+            out.append(bare.strip())
+        elif "\\" in quoted or '""' in quoted:
+            out.append(_ESCAPE.sub(_unescape, quoted))
+        else:
+            out.append(quoted)
+        pos = m.end()
+        if not m.group(0).endswith(","):
+            return out
+
 
+def _lines(f: TextIO) -> Iterator[tuple[int, str]]:
+    """Non-blank lines with their indentation, stripped."""
+    for line in f:
+        text = line.strip()
+        if text:
+            yield len(line) - len(line.lstrip(" ")), text
 
-def _parse_toon_content(content: str) -> list[dict[str, Any]]:
-    """Parse TOON tabular format. Returns list of dicts (the array rows)."""
-    lines = [ln.rstrip() for ln in content.strip().split("\n") if ln.strip()]
-    if not lines:
-        return []
-    first = lines[0].strip()
-    m = _TABULAR_HEADER.match(first)
-    if not m:
-        return []
-    n = int(m.group("n"))
-    fields_str = m.group("fields")
-    fields = [f.strip() for f in fields_str.split(",")]
-    if not fields:
-        return []
-    result: list[dict[str, Any]] = []
-    idx = 1
-    for _ in range(n):
-        if idx >= len(lines):
+
+def _find_block(
+    lines: Iterator[tuple[int, str]], keys: list[str] | None
+) -> tuple[int, int, list[str]] | None:
+    """Read up to the tabular header at ``keys`` (the first one if None): its
+    indentation, declared row count and fields."""
+    parents: list[tuple[int, str]] = []  # open objects as (indent, key)
+    for indent, text in lines:
+        while parents and parents[-1][0] >= indent:
+            parents.pop()
+        if m := _TABULAR_HEADER.match(text):
+            path = [k for _, k in parents]
+            if m.group("key"):
+                path.append(m.group("key"))
+            if keys is None or path == keys:
+                return indent, int(m.group("n")), _split_row(m.group("fields"))
+        elif m := _OBJECT_KEY.match(text):
+            parents.append((indent, m.group("key")))
+    return None
+
+
+def _iter_rows(lines: Iterator[tuple[int, str]], indent: int, n: int) -> Iterator[list[str]]:
+    """The ``n`` rows under a header at ``indent``, checking the count as rows arrive.
+
+    Rows are indented below the header; like earlier versions, a row at the header's
+    own indentation is still read while rows are missing.
+    """
+    count = 0
+    for line_indent, text in lines:
+        if count == n:
+            if line_indent > indent:
+                raise ValueError(f"TOON block declares {n} rows but has more")
+            return
+        if line_indent < indent:
             break
-        row_str = lines[idx].strip().lstrip()
-        idx += 1
-        cells = _split_row(row_str)
-        row = {
-            name: _parse_cell(cells[j]) if j < len(cells) else None for j, name in enumerate(fields)
-        }
-        result.append(row)
-    return result
+        yield _split_row(text)
+        count += 1
+    if count < n:
+        raise ValueError(f"TOON block declares {n} rows but has {count}")
 
 
 @register_parser("toon")
 class TOONParser:
-    """Read TOON file into TableModel."""
+    """Read a TOON tabular block into TableModel, line by line.
+
+    The first block in the file is read, or the one at ``toon_path``: object keys
+    joined by dots down to the block's key, e.g. ``"data.users"`` for ``users[N]{...}:``
+    nested under ``data:``. Cell types are inferred column by column.
+    """
+
+    def __init__(self, toon_path: str | None = None) -> None:
+        self.toon_path = toon_path
 
     def parse(self, source: Path | str) -> TableModel:
+        return TableModel.concat(self.iter_batches(source))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
-        content = path.read_text(encoding="utf-8")
-        rows = _parse_toon_content(content)
-        if not rows:
-            return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+        keys = self.toon_path.split(".") if self.toon_path else None
+        with open(path, encoding="utf-8") as f:
+            lines = _lines(f)
+            block = _find_block(lines, keys)
+            if block is None:
+                if keys is not None:
+                    raise ValueError(f"TOON path {self.toon_path!r} not found")
+                return
+            indent, n, fields = block
+            rows: list[list[str]] = []
+            for row in _iter_rows(lines, indent, n):
+                rows.append(row)
+                if len(rows) >= batch_size:
+                    yield infer_table(fields, rows, nulls=_NULLS)
+                    rows = []
+            if rows:
+                yield infer_table(fields, rows, nulls=_NULLS)
@@ -1,21 +1,26 @@
 """Parse XML into TableModel."""
 
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.infer import coerce_value, infer_column
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
 
-def _elem_to_dict(elem: ET.Element) -> dict[str, Any]:
+def _elem_to_dict(elem: ET.Element, coerce: bool = True) -> dict[str, Any]:
+    """Attributes and child elements of ``elem``. With ``coerce=False`` leaf values stay
+    strings, for a column-wise pass; nested elements are always coerced."""
+    parse = coerce_value if coerce else str
     d: dict[str, Any] = {}
     if elem.attrib:
         for k, v in elem.attrib.items():
-            d[k] = _parse_attr(v)
+            d[k] = parse(v)
     for child in elem:
         if len(child) == 0 and (child.text or "").strip():
-            d[child.tag] = _parse_attr((child.text or "").strip())
+            d[child.tag] = parse((child.text or "").strip())
         elif len(child) == 0:
             d[child.tag] = (child.text or "").strip() or None
         else:
@@ -23,29 +28,74 @@ def _elem_to_dict(elem: ET.Element) -> dict[str, Any]:
     return d
 
 
-def _parse_attr(v: str) -> Any:
-    if v.lower() in ("true", "false"):
-        return v.lower() == "true"
-    if v.isdigit():
-        return int(v)
-    try:
-        return float(v)
-    except ValueError:
-        return v
+def _iter_records(path: Path, row_tag: str | None) -> Iterator[dict[str, Any]]:
+    """Yield each record element as a dict of raw strings while ``iterparse`` reads on.
+
+    Every element is detached from its parent once it ends, so the tree never holds
+    more than the open ancestors of the current element.
+    """
+    stack: list[ET.Element] = []
+    in_row = 0  # open elements from the current record down; 0 outside records
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if in_row:
+                in_row += 1
+            elif elem.tag == row_tag if row_tag else len(stack) == 1:
+                in_row = 1
+            stack.append(elem)
+            continue
+        stack.pop()
+        if in_row > 1:
+            in_row -= 1  # fields stay attached until their record ends
+            continue
+        if in_row:
+            in_row = 0
+            yield _elem_to_dict(elem, coerce=False)
+        if stack:
+            stack[-1].remove(elem)
 
 
 @register_parser("xml")
 class XMLParser:
-    """Read XML (root with repeated child elements) into TableModel."""
+    """Read XML (root with repeated child elements) into TableModel.
+
+    Records are the children of the root, or with ``row_tag`` every element of that tag
+    at any depth (``{uri}tag`` for a namespace), e.g. ``row_tag="record"`` for
+    ``<feed><records><record>...``. The file is read with ``iterparse`` and each record
+    is dropped once converted, so memory stays flat whatever the file size.
+    """
+
+    def __init__(self, row_tag: str | None = None) -> None:
+        self.row_tag = row_tag
 
-    def parse(self, path: Path) -> TableModel:
+    def parse(self, path: Path | str) -> TableModel:
+        table = TableModel.concat(self.iter_batches(path))
+        if not table.columns:
+            # No record has a field: nothing to hold, however many records there are.
+            return TableModel(columns=[], rows=[])
+        return table
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
-        with open(path, encoding="utf-8") as f:
-            content = f.read()
-        root = ET.fromstring(content)
-        rows = [_elem_to_dict(child) for child in root]
-        if not rows:
-            return TableModel(columns=[], rows=[{}])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+        columns: list[str] | None = None
+        rows: list[dict[str, Any]] = []
+        for row in _iter_records(path, self.row_tag):
+            rows.append(row)
+            if len(rows) >= batch_size:
+                columns = columns or list(rows[0].keys())
+                yield self._to_table(columns, rows)
+                rows = []
+        if rows:
+            yield self._to_table(columns or list(rows[0].keys()), rows)
+
+    @staticmethod
+    def _to_table(columns: list[str], rows: list[dict[str, Any]]) -> TableModel:
+        # Every cell follows coerce_value's rule, so inferring batch by batch gives the
+        # same values as inferring whole columns.
+        raw = TableModel(columns=columns, rows=rows)
+        data = {c: infer_column(values) for c, values in raw.to_columns().items()}
+        return TableModel.from_columns(columns, data)
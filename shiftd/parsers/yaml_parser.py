@@ -2,36 +2,62 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from itertools import batched
 from pathlib import Path
+from typing import Any
 
-from shiftd.parsers.registry import register_parser
+from shiftd.parsers.registry import DEFAULT_BATCH_SIZE, register_parser
 from shiftd.schema import TableModel
 
 
+def _import_yaml() -> Any:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("YAML support requires optional dependency: uv add 'shiftd[yaml]'") from e
+    return yaml
+
+
+def _loader(yaml: Any) -> Any:
+    """libyaml's safe loader when pyyaml was built with it, else the pure-Python one."""
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _iter_rows(documents: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    for data in documents:
+        if isinstance(data, list):
+            for r in data:
+                if isinstance(r, dict):
+                    yield dict(r)
+        elif isinstance(data, dict):
+            yield data
+
+
 @register_parser("yaml")
 @register_parser("yml")
 class YAMLParser:
-    """Read YAML file into TableModel. Expects a list of objects or a single object."""
+    """Read YAML file into TableModel.
+
+    Expects a list of objects or a single object, or a stream of such documents
+    separated by ``---`` (one record per document, say), which is read document by
+    document.
+    """
 
     def parse(self, source: Path | str) -> TableModel:
-        try:
-            import yaml
-        except ImportError as e:
-            raise ImportError(
-                "YAML support requires optional dependency: uv add 'shiftd[yaml]'"
-            ) from e
+        return TableModel.concat(self.iter_batches(source))
+
+    def iter_batches(
+        self, source: Path | str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TableModel]:
+        yaml = _import_yaml()
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(str(path))
+        columns: list[str] | None = None
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        if isinstance(data, list):
-            rows = [dict(r) for r in data if isinstance(r, dict)]
-        elif isinstance(data, dict):
-            rows = [data]
-        else:
-            rows = []
-        if not rows:
-            return TableModel(columns=[], rows=[])
-        columns = list(rows[0].keys())
-        return TableModel(columns=columns, rows=rows)
+            documents = yaml.load_all(f, Loader=_loader(yaml))
+            for chunk in batched(_iter_rows(documents), batch_size):
+                rows = list(chunk)
+                columns = columns or list(rows[0].keys())
+                yield TableModel(columns=columns, rows=rows)
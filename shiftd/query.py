@@ -0,0 +1,511 @@
+"""Column selection, row filters and row limits, pushed down to each format as far as it allows.
+
+A filter is a small, portable expression tree: comparisons of a column with a literal,
+``IN`` lists, null checks, and ``and``/``or``/``not``. Build one with :func:`col`
+(``(col("age") >= 18) & col("country").isin(["IT", "FR"])``) or parse one from text with
+:func:`parse_where` (``"age >= 18 and country in ('IT', 'FR')"``). Each backend
+translates it: database parsers into a SQL ``WHERE`` clause with bound parameters,
+Parquet and Arrow into a ``pyarrow.compute`` expression (which also skips Parquet row
+groups by their statistics), and every other format into a predicate applied to the
+rows while they stream (see :meth:`Query.apply`).
+
+Nulls follow SQL: a comparison with a null is unknown, ``not`` of unknown is unknown,
+and only rows where the filter is true are kept. When streaming, a text cell compared
+with a non-text literal is first coerced like the text formats do (see
+:func:`shiftd.infer.coerce_value`), so ``age >= 18`` also works on a plain CSV file.
+"""
+
+from __future__ import annotations
+
+import ast
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import compress
+from pathlib import Path
+from typing import Any, Literal
+
+from shiftd.infer import coerce_value
+from shiftd.schema import TableModel
+
+Op = Literal["==", "!=", "<", "<=", ">", ">="]
+
+_PY_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_SQL_OPS = {"==": "=", "!=": "<>", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+_FLIPPED: dict[str, Op] = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+# A row predicate returns True, False or None (unknown), like SQL.
+Predicate = Callable[[Sequence[Any]], bool | None]
+
+
+class Expr(ABC):
+    """A row filter. Combine with ``&`` (and), ``|`` (or) and ``~`` (not)."""
+
+    def __and__(self, other: Expr) -> Expr:
+        return And((self, other))
+
+    def __or__(self, other: Expr) -> Expr:
+        return Or((self, other))
+
+    def __invert__(self) -> Expr:
+        return Not(self)
+
+    @abstractmethod
+    def columns(self) -> set[str]:
+        """Names of the columns the filter reads."""
+
+    @abstractmethod
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        """SQL condition and its parameters, e.g. ``('"age" >= ?', [18])``."""
+
+    @abstractmethod
+    def to_arrow(self) -> Any:
+        """The filter as a ``pyarrow.compute.Expression``."""
+
+    @abstractmethod
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        """Function of a row tuple (values in ``columns`` order): True, False or None."""
+
+
+def _compare(op: Callable[[Any, Any], bool], value: Any, literal: Any) -> bool | None:
+    if value is None:
+        return None
+    if isinstance(value, str) and not isinstance(literal, str):
+        value = coerce_value(value)
+    try:
+        return op(value, literal)
+    except TypeError:
+        return None
+
+
+def _index(columns: Sequence[str], name: str) -> int:
+    try:
+        return list(columns).index(name)
+    except ValueError:
+        raise ValueError(f"Unknown column in filter: {name}. Available: {list(columns)}") from None
+
+
+@dataclass(frozen=True)
+class Compare(Expr):
+    column: str
+    op: Op
+    value: Any
+
+    def columns(self) -> set[str]:
+        return {self.column}
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        return f"{quote(self.column)} {_SQL_OPS[self.op]} {placeholder}", [self.value]
+
+    def to_arrow(self) -> Any:
+        import pyarrow.compute as pc
+
+        return _PY_OPS[self.op](pc.field(self.column), self.value)
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        i, op, literal = _index(columns, self.column), _PY_OPS[self.op], self.value
+        return lambda row: _compare(op, row[i], literal)
+
+
+@dataclass(frozen=True)
+class IsIn(Expr):
+    column: str
+    values: tuple[Any, ...]
+
+    def columns(self) -> set[str]:
+        return {self.column}
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        if not self.values:
+            return "1 = 0", []
+        marks = ", ".join(placeholder for _ in self.values)
+        return f"{quote(self.column)} IN ({marks})", list(self.values)
+
+    def to_arrow(self) -> Any:
+        import pyarrow.compute as pc
+
+        return pc.field(self.column).isin(list(self.values))
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        i, values = _index(columns, self.column), self.values
+
+        def isin(row: Sequence[Any]) -> bool | None:
+            value = row[i]
+            if value is None:
+                return None
+            return any(_compare(operator.eq, value, v) for v in values)
+
+        return isin
+
+
+@dataclass(frozen=True)
+class IsNull(Expr):
+    column: str
+
+    def columns(self) -> set[str]:
+        return {self.column}
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        return f"{quote(self.column)} IS NULL", []
+
+    def to_arrow(self) -> Any:
+        import pyarrow.compute as pc
+
+        return pc.field(self.column).is_null()
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        i = _index(columns, self.column)
+        return lambda row: row[i] is None
+
+
+@dataclass(frozen=True)
+class And(Expr):
+    terms: tuple[Expr, ...]
+
+    def columns(self) -> set[str]:
+        return set().union(*(t.columns() for t in self.terms))
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        return _join_sql(self.terms, " AND ", quote, placeholder)
+
+    def to_arrow(self) -> Any:
+        out = self.terms[0].to_arrow()
+        for term in self.terms[1:]:
+            out = out & term.to_arrow()
+        return out
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        preds = [t.predicate(columns) for t in self.terms]
+
+        def all_of(row: Sequence[Any]) -> bool | None:
+            unknown = False
+            for pred in preds:
+                result = pred(row)
+                if result is False:
+                    return False
+                unknown = unknown or result is None
+            return None if unknown else True
+
+        return all_of
+
+
+@dataclass(frozen=True)
+class Or(Expr):
+    terms: tuple[Expr, ...]
+
+    def columns(self) -> set[str]:
+        return set().union(*(t.columns() for t in self.terms))
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        return _join_sql(self.terms, " OR ", quote, placeholder)
+
+    def to_arrow(self) -> Any:
+        out = self.terms[0].to_arrow()
+        for term in self.terms[1:]:
+            out = out | term.to_arrow()
+        return out
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        preds = [t.predicate(columns) for t in self.terms]
+
+        def any_of(row: Sequence[Any]) -> bool | None:
+            unknown = False
+            for pred in preds:
+                result = pred(row)
+                if result is True:
+                    return True
+                unknown = unknown or result is None
+            return None if unknown else False
+
+        return any_of
+
+
+@dataclass(frozen=True)
+class Not(Expr):
+    term: Expr
+
+    def columns(self) -> set[str]:
+        return self.term.columns()
+
+    def to_sql(self, quote: Callable[[str], str], placeholder: str) -> tuple[str, list[Any]]:
+        sql, params = self.term.to_sql(quote, placeholder)
+        return f"NOT ({sql})", params
+
+    def to_arrow(self) -> Any:
+        return ~self.term.to_arrow()
+
+    def predicate(self, columns: Sequence[str]) -> Predicate:
+        pred = self.term.predicate(columns)
+
+        def negated(row: Sequence[Any]) -> bool | None:
+            result = pred(row)
+            return None if result is None else not result
+
+        return negated
+
+
+def _join_sql(
+    terms: tuple[Expr, ...], sep: str, quote: Callable[[str], str], placeholder: str
+) -> tuple[str, list[Any]]:
+    parts, params = [], []
+    for term in terms:
+        sql, term_params = term.to_sql(quote, placeholder)
+        parts.append(f"({sql})")
+        params.extend(term_params)
+    return sep.join(parts), params
+
+
+@dataclass(frozen=True, eq=False)
+class Column:
+    """A column reference that builds filters: ``col("age") >= 18``, ``col("x").isin([1, 2])``."""
+
+    name: str
+
+    def __eq__(self, value: Any) -> Expr:  # type: ignore[override]
+        return IsNull(self.name) if value is None else Compare(self.name, "==", value)
+
+    def __ne__(self, value: Any) -> Expr:  # type: ignore[override]
+        return Not(IsNull(self.name)) if value is None else Compare(self.name, "!=", value)
+
+    def __lt__(self, value: Any) -> Expr:
+        return Compare(self.name, "<", value)
+
+    def __le__(self, value: Any) -> Expr:
+        return Compare(self.name, "<=", value)
+
+    def __gt__(self, value: Any) -> Expr:
+        return Compare(self.name, ">", value)
+
+    def __ge__(self, value: Any) -> Expr:
+        return Compare(self.name, ">=", value)
+
+    def isin(self, values: Iterable[Any]) -> Expr:
+        return IsIn(self.name, tuple(values))
+
+    def is_null(self) -> Expr:
+        return IsNull(self.name)
+
+    def not_null(self) -> Expr:
+        return Not(IsNull(self.name))
+
+
+def col(name: str) -> Column:
+    """Reference a column in a filter."""
+    return Column(name)
+
+
+_AST_OPS: dict[type, Op] = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+
+def parse_where(text: str) -> Expr:
+    """Parse a filter written like a Python condition, without evaluating it.
+
+    Supported: ``column <op> literal`` (``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, in
+    either order, chains like ``1 < x <= 5``), ``column in (...)`` / ``not in``,
+    ``column is None`` / ``is not None``, ``and``, ``or``, ``not`` and parentheses.
+    Literals are numbers, strings, ``True``, ``False`` and ``None``.
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid filter: {text!r}: {e.msg}") from None
+    return _from_ast(tree.body, text)
+
+
+def _from_ast(node: ast.expr, text: str) -> Expr:
+    if isinstance(node, ast.BoolOp):
+        terms = tuple(_from_ast(v, text) for v in node.values)
+        return And(terms) if isinstance(node.op, ast.And) else Or(terms)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return Not(_from_ast(node.operand, text))
+    if isinstance(node, ast.Compare):
+        operands = [node.left, *node.comparators]
+        terms = tuple(
+            _compare_from_ast(left, op, right, text)
+            for left, op, right in zip(operands, node.ops, operands[1:])
+        )
+        return terms[0] if len(terms) == 1 else And(terms)
+    raise ValueError(f"Unsupported filter expression {ast.unparse(node)!r} in {text!r}")
+
+
+def _compare_from_ast(left: ast.expr, op: ast.cmpop, right: ast.expr, text: str) -> Expr:
+    if isinstance(op, (ast.In, ast.NotIn)) and isinstance(left, ast.Name):
+        if not isinstance(right, (ast.Tuple, ast.List, ast.Set)):
+            raise ValueError(f"'in' needs a list of literals in {text!r}")
+        expr: Expr = IsIn(left.id, tuple(_literal(e, text) for e in right.elts))
+        return Not(expr) if isinstance(op, ast.NotIn) else expr
+    if isinstance(op, (ast.Is, ast.IsNot)) and isinstance(left, ast.Name):
+        if _literal(right, text) is not None:
+            raise ValueError(f"'is' only compares with None in {text!r}")
+        return IsNull(left.id) if isinstance(op, ast.Is) else Not(IsNull(left.id))
+    if type(op) in _AST_OPS:
+        symbol = _AST_OPS[type(op)]
+        if isinstance(left, ast.Name):
+            column, value = left.id, _literal(right, text)
+        elif isinstance(right, ast.Name):
+            column, value, symbol = right.id, _literal(left, text), _FLIPPED[symbol]
+        else:
+            raise ValueError(f"A comparison needs a column name on one side in {text!r}")
+        if value is None and symbol in ("==", "!="):
+            return IsNull(column) if symbol == "==" else Not(IsNull(column))
+        return Compare(column, symbol, value)
+    raise ValueError(f"Unsupported comparison {ast.unparse(op)!r} in {text!r}")
+
+
+def _literal(node: ast.expr, text: str) -> Any:
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"Expected a literal, got {ast.unparse(node)!r} in {text!r}") from None
+    if isinstance(value, (list, tuple, set, dict, complex)):
+        raise ValueError(f"Expected a literal, got {ast.unparse(node)!r} in {text!r}")
+    return value
+
+
+@dataclass(frozen=True)
+class Query:
+    """Which columns, which rows and how many of them to read.
+
+    Parsers that implement :class:`~shiftd.parsers.registry.QueryParser` take these as
+    constructor arguments and push them into the source; for the others,
+    :meth:`apply` filters their batches as they stream.
+    """
+
+    columns: tuple[str, ...] | None = None
+    where: Expr | None = None
+    limit: int | None = None
+
+    @classmethod
+    def build(
+        cls,
+        columns: Sequence[str] | None = None,
+        where: Expr | str | None = None,
+        limit: int | None = None,
+    ) -> Query | None:
+        """A Query from user arguments (``where`` may be text, see :func:`parse_where`);
+        None when nothing is selected."""
+        if columns is None and where is None and limit is None:
+            return None
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        if isinstance(columns, str):
+            raise TypeError("columns must be a list of column names, not a string")
+        if isinstance(where, str):
+            where = parse_where(where)
+        return cls(tuple(columns) if columns is not None else None, where, limit)
+
+    def options(self) -> dict[str, Any]:
+        """Constructor arguments for a QueryParser."""
+        return {
+            "columns": list(self.columns) if self.columns is not None else None,
+            "where": self.where,
+            "limit": self.limit,
+        }
+
+    def apply(self, batches: Iterable[TableModel]) -> Iterator[TableModel]:
+        """Filter, select and cut ``batches`` as they stream; stop reading once ``limit``
+        rows are out. When no row matches, one empty batch still carries the columns."""
+        remaining = self.limit
+        empty: TableModel | None = None
+        yielded = False
+        predicate: Predicate | None = None
+        for batch in batches:
+            if self.where is not None:
+                if predicate is None:
+                    predicate = self.where.predicate(batch.columns)
+                batch = _filter(batch, predicate)
+            if self.columns is not None:
+                batch = _select(batch, self.columns)
+            if remaining is not None and len(batch.rows) > remaining:
+                batch = _head(batch, remaining)
+            if not batch.rows:
+                empty = empty or batch
+                if remaining == 0:
+                    break
+                continue
+            yielded = True
+            yield batch
+            if remaining is not None:
+                remaining -= len(batch.rows)
+                if remaining == 0:
+                    return
+        if not yielded and empty is not None:
+            yield empty
+
+
+def _filter(batch: TableModel, predicate: Predicate) -> TableModel:
+    mask = [predicate(row) is True for row in batch.iter_tuples()]
+    if all(mask):
+        return batch
+    if batch.is_arrow:
+        import pyarrow as pa
+
+        return TableModel.from_arrow(batch.to_arrow().filter(pa.array(mask)))
+    return TableModel.from_columns(
+        batch.columns, {c: list(compress(v, mask)) for c, v in batch.to_columns().items()}
+    )
+
+
+def _select(batch: TableModel, columns: tuple[str, ...]) -> TableModel:
+    if list(columns) == batch.columns:
+        return batch
+    missing = [c for c in columns if c not in batch.columns]
+    if missing:
+        raise ValueError(f"Unknown column(s): {missing}. Available: {batch.columns}")
+    if batch.is_arrow:
+        return TableModel.from_arrow(batch.to_arrow().select(list(columns)))
+    data = batch.to_columns()
+    return TableModel.from_columns(list(columns), {c: data[c] for c in columns})
+
+
+def _head(batch: TableModel, n: int) -> TableModel:
+    if batch.is_arrow:
+        return TableModel.from_arrow(batch.rows.table.slice(0, n))  # type: ignore[attr-defined]
+    return TableModel.from_columns(batch.columns, {c: v[:n] for c, v in batch.to_columns().items()})
+
+
+def scan_arrow(
+    path: Path, file_format: Literal["parquet", "ipc"], query: Query, batch_size: int
+) -> Iterator[TableModel]:
+    """Read a Parquet or Arrow IPC file through ``pyarrow.dataset`` with the query pushed
+    into the scan: only the selected columns are decoded, the filter is evaluated by
+    Arrow (and, for Parquet, skips row groups whose statistics rule it out)."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path, format=file_format)
+    scanner = dataset.scanner(
+        columns=list(query.columns) if query.columns is not None else None,
+        filter=query.where.to_arrow() if query.where is not None else None,
+        batch_size=batch_size,
+    )
+    remaining = query.limit
+    empty = True
+    for record_batch in scanner.to_batches():
+        if remaining == 0:
+            break
+        if remaining is not None and record_batch.num_rows > remaining:
+            record_batch = record_batch.slice(0, remaining)
+        if not record_batch.num_rows:
+            continue
+        empty = False
+        if remaining is not None:
+            remaining -= record_batch.num_rows
+        yield TableModel.from_arrow(pa.Table.from_batches([record_batch]))
+    if empty and scanner.projected_schema.names:
+        yield TableModel.from_arrow(scanner.projected_schema.empty_table())
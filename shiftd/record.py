@@ -0,0 +1,86 @@
+"""Compact row type: a tuple of values plus a column index shared by every row of a layout."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+
+class Record(Mapping[str, Any]):
+    """Read-only row backed by a tuple. Get the class for a layout with :func:`record_type`.
+
+    Each layout is a subclass holding the column names and the column -> position map,
+    so an instance stores nothing but its values tuple. Reads like a dict:
+    ``row["a"]``, ``row.get("a")``, ``dict(row)``, ``row == {"a": 1}``.
+    """
+
+    __slots__ = ("_values",)
+
+    _columns: tuple[str, ...] = ()
+    _index: dict[str, int] = {}
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        values = tuple(values)
+        if len(values) != len(self._columns):
+            raise ValueError(f"expected {len(self._columns)} values, got {len(values)}")
+        self._values = values
+
+    @property
+    def values_tuple(self) -> tuple[Any, ...]:
+        return self._values
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(zip(self._columns, self._values))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._index.get(key)
+        return default if i is None else self._values[i]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            return self._values == other._values  # type: ignore[attr-defined]
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild, (self._columns, self._values)
+
+
+@lru_cache(maxsize=1024)
+def _record_type(columns: tuple[str, ...]) -> type[Record]:
+    if len(set(columns)) != len(columns):
+        raise ValueError("columns must be unique")
+    namespace = {
+        "__slots__": (),
+        "_columns": columns,
+        "_index": {c: i for i, c in enumerate(columns)},
+    }
+    return type("Record", (Record,), namespace)
+
+
+def record_type(columns: Sequence[str]) -> type[Record]:
+    """The Record subclass for a column layout. Equal layouts share one class and index."""
+    return _record_type(tuple(columns))
+
+
+def _rebuild(columns: tuple[str, ...], values: tuple[Any, ...]) -> Record:
+    return record_type(columns)(values)
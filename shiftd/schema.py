@@ -2,16 +2,58 @@
 
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import batched, repeat
+from operator import attrgetter, eq
+from typing import Annotated, Any, Literal, get_args
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, SkipValidation, field_serializer, field_validator
+
+from shiftd.columnar import ArrowRows, ColumnarRows, extend_column, pack_column
+from shiftd.record import Record, record_type
+
+_CHUNK_ROWS = 65_536
+
+ValidationLevel = Literal["full", "sample", "trusted"]
+
+# Rows checked at the "sample" level, spread evenly across the table.
+_SAMPLE_ROWS = 1_000
+
+_validation: ContextVar[ValidationLevel] = ContextVar("shiftd_validation", default="full")
+
+
+@contextmanager
+def validation_level(level: ValidationLevel) -> Iterator[None]:
+    """Set how TableModel checks rows of dicts while the block runs.
+
+    ``full`` checks every row, ``sample`` up to 1000 evenly spaced rows, and ``trusted``
+    skips the per-row check. Columnar tables never need it: their shape is guaranteed.
+    """
+    if level not in get_args(ValidationLevel):
+        raise ValueError(
+            f"Unknown validation level: {level}. Available: {get_args(ValidationLevel)}"
+        )
+    token = _validation.set(level)
+    try:
+        yield
+    finally:
+        _validation.reset(token)
 
 
 class TableModel(BaseModel):
-    """Validated table: columns and rows. Every row must have exactly the column keys."""
+    """Validated table: columns and rows. Every row must have exactly the column keys.
+
+    ``rows`` is either a list of dicts or :class:`~shiftd.record.Record` rows, or a
+    :class:`~shiftd.columnar.ColumnarRows` view over one buffer per column (see
+    :meth:`from_columns`) or over a ``pyarrow.Table`` (see :meth:`from_arrow`). All of
+    them read the same way.
+    """
 
     columns: list[str]
-    rows: list[dict[str, Any]]
+    rows: Annotated[Sequence[Mapping[str, Any]], SkipValidation]
 
     @field_validator("columns")
     @classmethod
@@ -22,15 +64,40 @@ class TableModel(BaseModel):
 
     @field_validator("rows", mode="after")
     @classmethod
-    def rows_match_columns(cls, rows: list[dict[str, Any]], info: Any) -> list[dict[str, Any]]:
+    def rows_match_columns(
+        cls, rows: Sequence[Mapping[str, Any]], info: Any
+    ) -> Sequence[Mapping[str, Any]]:
+        if not isinstance(rows, Sequence) or isinstance(rows, (str, bytes)):
+            raise ValueError("rows must be a list of dicts")
         columns = info.data.get("columns")
-        if not columns:
+        if isinstance(rows, ColumnarRows):
+            # Column buffers guarantee row shape; only the column order must agree.
+            if columns is not None and list(rows.columns) != columns:
+                raise ValueError(f"column data {list(rows.columns)} does not match {columns}")
             return rows
-        for i, row in enumerate(rows):
-            if not isinstance(row, dict):
+        level = _validation.get()
+        if not columns or level == "trusted":
+            return rows
+        step = 1
+        if level == "sample" and len(rows) > _SAMPLE_ROWS:
+            step = len(rows) // _SAMPLE_ROWS
+        checked = rows[::step] if step > 1 else rows
+        expected = frozenset(columns)
+        row_types = set(map(type, checked))
+        if row_types == {dict}:
+            # Both passes run in C and compare each keys view against one frozenset,
+            # without building a set per row.
+            if all(map(eq, map(dict.keys, checked), repeat(expected))):
+                return rows
+        elif all(issubclass(t, Record) for t in row_types):
+            # Records share their layout: check each distinct layout once, not each row.
+            if all(frozenset(t._columns) == expected for t in row_types):
+                return rows
+        for j, row in enumerate(checked):
+            i = j * step
+            if not isinstance(row, (dict, Record)):
                 raise ValueError(f"row {i} must be a dict")
             keys = set(row.keys())
-            expected = set(columns)
             if keys != expected:
                 missing = expected - keys
                 extra = keys - expected
@@ -41,3 +108,185 @@ class TableModel(BaseModel):
                     msg += f"; extra: {sorted(extra)}"
                 raise ValueError(msg)
         return rows
+
+    @field_serializer("rows")
+    def _dump_rows(self, rows: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        return list(self.iter_dicts())
+
+    @classmethod
+    def from_columns(cls, columns: list[str], data: Mapping[str, Sequence[Any]]) -> TableModel:
+        """Build a table stored as one buffer per column instead of one dict per row."""
+        packed = {c: pack_column(values) for c, values in data.items()}
+        return cls(columns=columns, rows=ColumnarRows(columns, packed))
+
+    @classmethod
+    def from_tuples(cls, columns: list[str], rows: Iterable[Sequence[Any]]) -> TableModel:
+        """Build a columnar table from row tuples, e.g. straight from a DB-API cursor."""
+        width = len(columns)
+        buffers: list[list[Any]] = [[] for _ in columns]
+        for n, chunk in enumerate(batched(rows, _CHUNK_ROWS)):
+            if set(map(len, chunk)) != {width}:
+                bad = next(i for i, r in enumerate(chunk) if len(r) != width)
+                raise ValueError(
+                    f"row {n * _CHUNK_ROWS + bad}: expected {width} values, got {len(chunk[bad])}"
+                )
+            for buf, values in zip(buffers, zip(*chunk)):
+                buf.extend(values)
+        return cls.from_columns(columns, dict(zip(columns, buffers)))
+
+    @classmethod
+    def from_arrow(cls, table: Any) -> TableModel:
+        """Wrap a ``pyarrow.Table`` without copying; rows are converted only when read."""
+        return cls(columns=list(table.column_names), rows=ArrowRows(table))
+
+    @classmethod
+    def concat(cls, tables: Iterable[TableModel]) -> TableModel:
+        """Stack tables that share the same columns, e.g. the batches of a streaming parser.
+
+        Tables are consumed one at a time, so a generator of batches is never held whole.
+        Arrow-backed tables are stacked as Arrow chunks, without converting any value.
+        """
+        first: TableModel | None = None
+        data: dict[str, Sequence[Any]] | None = None
+        arrow_parts: list[Any] = []
+        for t in tables:
+            if first is None:
+                first = t
+                continue
+            if t.columns != first.columns:
+                raise ValueError(
+                    f"cannot concatenate tables with columns {first.columns} and {t.columns}"
+                )
+            if data is None and isinstance(first.rows, ArrowRows):
+                if isinstance(t.rows, ArrowRows):
+                    if not arrow_parts:
+                        arrow_parts.append(first.rows.table)
+                    arrow_parts.append(t.rows.table)
+                    continue
+                if arrow_parts:
+                    first = cls.from_arrow(_concat_arrow(arrow_parts))
+                    arrow_parts = []
+            if data is None:
+                data = {c: pack_column(list(v)) for c, v in first.to_columns().items()}
+            for c, values in t.to_columns().items():
+                data[c] = extend_column(data[c], values)
+        if first is None:
+            return cls(columns=[], rows=[])
+        if arrow_parts:
+            return cls.from_arrow(_concat_arrow(arrow_parts))
+        if data is None:
+            return first
+        return cls.from_columns(first.columns, data)
+
+    @property
+    def is_columnar(self) -> bool:
+        return isinstance(self.rows, ColumnarRows)
+
+    @property
+    def is_arrow(self) -> bool:
+        return isinstance(self.rows, ArrowRows)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Values of one column. Columnar tables return their buffer without copying."""
+        if name not in self.columns:
+            raise KeyError(name)
+        if isinstance(self.rows, ColumnarRows):
+            return self.rows.column(name)
+        return [row.get(name) for row in self.rows]
+
+    def column_types(self) -> dict[str, type | None]:
+        """Column name -> the one Python type of its non-null values (``int``, ``float``,
+        ``bool``, ``str``, ``bytes``, ``datetime``, ...), or None for mixed or all-null
+        columns, e.g. to pick SQL column types. Typed buffers and Arrow columns answer
+        from their type without a scan."""
+        if isinstance(self.rows, ArrowRows):
+            schema = self.rows.table.schema
+            return {c: _arrow_python_type(schema.field(c).type) for c in self.columns}
+        out: dict[str, type | None] = {}
+        for c, values in self.to_columns().items():
+            if isinstance(values, array):
+                out[c] = int if values.typecode == "q" else float
+                continue
+            kinds = set(map(type, values))
+            kinds.discard(type(None))
+            out[c] = kinds.pop() if len(kinds) == 1 else None
+        return out
+
+    def to_arrow(self, schema: Any = None) -> Any:
+        """The table as a ``pyarrow.Table``. Arrow-backed tables return theirs as is.
+
+        With ``schema``, the result is built with (or cast to) that schema, so that every
+        batch of a stream matches the first one. Requires optional dependency shiftd[arrow].
+        """
+        if isinstance(self.rows, ArrowRows):
+            table = self.rows.table
+            if schema is not None and not table.schema.equals(schema):
+                table = table.cast(schema)
+            return table
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "Arrow support requires optional dependency: uv add 'shiftd[arrow]'"
+            ) from e
+        return pa.table(self.to_columns(), schema=schema)
+
+    def to_columns(self) -> dict[str, Sequence[Any]]:
+        """Column name -> values, in column order."""
+        if isinstance(self.rows, ColumnarRows):
+            return self.rows.data
+        return {c: [row.get(c) for row in self.rows] for c in self.columns}
+
+    def iter_tuples(self) -> Iterator[tuple[Any, ...]]:
+        """Yield each row as a tuple of values in column order (missing keys -> None)."""
+        if isinstance(self.rows, ColumnarRows):
+            return self.rows.iter_tuples()
+        if set(map(type, self.rows)) == {record_type(self.columns)}:
+            return map(attrgetter("_values"), self.rows)
+        columns = self.columns
+        return (tuple(map(row.get, columns)) for row in self.rows)
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield each row as a plain dict, e.g. for JSON or YAML encoders."""
+        if isinstance(self.rows, ColumnarRows):
+            columns = self.columns
+            yield from (dict(zip(columns, values)) for values in self.rows.iter_tuples())
+            return
+        for row in self.rows:
+            if type(row) is dict:
+                yield row
+            elif isinstance(row, Record):
+                yield row.to_dict()
+            else:
+                yield dict(row)
+
+
+def _concat_arrow(tables: list[Any]) -> Any:
+    import pyarrow as pa
+
+    # "permissive" lets e.g. an all-null first batch take the type of the later ones.
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def _arrow_python_type(arrow_type: Any) -> type | None:
+    import datetime
+    import decimal
+
+    import pyarrow.types as pat
+
+    checks: list[tuple[Any, type]] = [
+        (pat.is_boolean, bool),
+        (pat.is_integer, int),
+        (pat.is_floating, float),
+        (pat.is_decimal, decimal.Decimal),
+        (lambda t: pat.is_string(t) or pat.is_large_string(t), str),
+        (lambda t: pat.is_binary(t) or pat.is_large_binary(t), bytes),
+        (pat.is_timestamp, datetime.datetime),
+        (pat.is_date, datetime.date),
+        (pat.is_time, datetime.time),
+        (pat.is_duration, datetime.timedelta),
+    ]
+    for check, kind in checks:
+        if check(arrow_type):
+            return kind
+    return None
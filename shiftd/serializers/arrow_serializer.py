@@ -2,29 +2,56 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
+from shiftd.widening import WideningWriter
 
 
 @register_serializer("arrow")
 class ArrowSerializer:
     def serialize(self, table: TableModel, target: str | Path) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: str | Path) -> None:
+        """Append each batch as a record batch.
+
+        Column types widen as batches arrive, as for Parquet (see :mod:`shiftd.widening`).
+        """
         try:
             import pyarrow as pa
-            import pyarrow.ipc as ipc
         except ImportError as e:
             raise ImportError(
                 "Arrow support requires optional dependency: uv add 'shiftd[arrow]'"
             ) from e
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
-        if not table.columns and not table.rows:
-            pa_table = pa.table({})
-        else:
-            pa_table = pa.Table.from_pylist(table.rows)
-        with pa.OSFile(str(path), "wb") as f:
-            writer = ipc.new_file(f, pa_table.schema)
-            writer.write_table(pa_table)
+        writer = WideningWriter(path, _open_writer, _read_batches)
+        try:
+            for batch in batches:
+                if writer.schema is None and not batch.columns and not batch.rows:
+                    break
+                writer.write(batch.to_arrow())
+            if writer.schema is None:
+                writer.write(pa.table({}))
+        finally:
             writer.close()
+
+
+def _open_writer(path: Path, schema: Any) -> Any:
+    import pyarrow.ipc as ipc
+
+    return ipc.new_file(str(path), schema)
+
+
+def _read_batches(path: Path) -> Iterator[Any]:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(str(path)) as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
@@ -1,6 +1,7 @@
 """Serialize TableModel to CSV."""
 
 import csv
+from collections.abc import Iterable
 from pathlib import Path
 
 from shiftd.schema import TableModel
@@ -9,11 +10,22 @@ from shiftd.serializers.registry import register_serializer
 
 @register_serializer("csv")
 class CSVSerializer:
-    def serialize(self, table: TableModel, path: Path) -> None:
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+
+    def serialize(self, table: TableModel, path: Path | str) -> None:
+        self.write_batches([table], path)
+
+    def write_batches(self, batches: Iterable[TableModel], path: Path | str) -> None:
+        path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w", newline="", encoding="utf-8") as f:
-            if not table.columns:
-                return
-            writer = csv.DictWriter(f, fieldnames=table.columns)
-            writer.writeheader()
-            writer.writerows(table.rows)
+            writer = csv.writer(f, **self.kwargs)
+            columns: list[str] | None = None
+            for batch in batches:
+                if columns is None:
+                    columns = batch.columns
+                    if not columns:
+                        return
+                    writer.writerow(columns)
+                writer.writerows(batch.iter_tuples())
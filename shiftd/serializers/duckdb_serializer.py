@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
+import csv
+import datetime
+import decimal
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
+from shiftd.widening import widen_type
+
+# Python type of a column's values -> DuckDB type, for loads without pyarrow. Mixed or
+# all-null columns are VARCHAR.
+_SQL_TYPES: dict[type, str] = {
+    bool: "BOOLEAN",
+    int: "BIGINT",
+    float: "DOUBLE",
+    decimal.Decimal: "DECIMAL(38, 10)",
+    str: "VARCHAR",
+    bytes: "BLOB",
+    datetime.datetime: "TIMESTAMP",
+    datetime.date: "DATE",
+    datetime.time: "TIME",
+    datetime.timedelta: "INTERVAL",
+}
+
+# Values that ``str`` does not render in DuckDB's CSV input format; the rest are written
+# with ``str`` (mixed columns included, as VARCHAR).
+_CSV_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bytes: lambda v: "".join(f"\\x{b:02X}" for b in v),
+    datetime.timedelta: lambda v: (
+        f"{v.days} days {v.seconds} seconds {v.microseconds} microseconds"
+    ),
+}
+_CSV_OPTIONS = "HEADER false, DELIMITER ',', QUOTE '\"', ESCAPE '\"', ALLOW_QUOTED_NULLS false"
+
+# Name the Arrow stream is registered under while it is loaded.
+_SOURCE_VIEW = "shiftd_source"
 
 
 def _sanitize_name(name: str) -> str:
@@ -13,15 +50,99 @@ def _sanitize_name(name: str) -> str:
     return "".join(c if c.isalnum() or c == "_" else "_" for c in name) or "col"
 
 
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _sql_type(kinds: set[type]) -> str:
+    kinds = kinds - {type(None)}
+    if kinds == {int, float}:
+        return "DOUBLE"
+    if len(kinds) == 1:
+        return _SQL_TYPES.get(kinds.pop(), "VARCHAR")
+    return "VARCHAR"
+
+
+def _mixed_columns(batch: TableModel) -> set[str]:
+    """Columns whose non-null values have more than one Python type."""
+    return {
+        c
+        for c, values in batch.to_columns().items()
+        if len(set(map(type, values)) - {type(None)}) > 1
+    }
+
+
+def _widen(schema: Any, other: Any) -> tuple[Any, list[int]]:
+    """``schema`` widened to hold ``other``, and the positions of the columns whose types
+    do not widen into each other (made text)."""
+    import pyarrow as pa
+
+    fields = []
+    clashes = []
+    for i, (field, new) in enumerate(zip(schema, other)):
+        wider = widen_type(field.type, new.type)
+        if wider is None:
+            wider = pa.string()
+            clashes.append(i)
+        fields.append(field.with_type(wider))
+    return pa.schema(fields), clashes
+
+
+def _alter_types(conn: Any, table: str, old: Any, new: Any) -> None:
+    """Change the types of the table's columns from ``old`` to ``new`` (Arrow schemas)."""
+    changed = [(o, n) for o, n in zip(old, new) if not o.type.equals(n.type)]
+    if not changed:
+        return
+    conn.register(_SOURCE_VIEW, new.empty_table())
+    try:
+        sql_types = {row[0]: row[1] for row in conn.execute(f"DESCRIBE {_SOURCE_VIEW}").fetchall()}
+    finally:
+        conn.unregister(_SOURCE_VIEW)
+    for o, n in changed:
+        # An all-null column was created with a placeholder type; nothing to convert.
+        using = " USING NULL" if str(o.type) == "null" else ""
+        conn.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN "{n.name}" TYPE {sql_types[n.name]}{using}'
+        )
+
+
+def _stringify(batch: TableModel, text_columns: frozenset[str]) -> TableModel:
+    """The batch with the values of ``text_columns`` as str (None kept)."""
+    if not text_columns:
+        return batch
+    data = {
+        c: [None if v is None else str(v) for v in values] if c in text_columns else values
+        for c, values in batch.to_columns().items()
+    }
+    return TableModel.from_columns(batch.columns, data)
+
+
 @register_serializer("duckdb")
 class DuckDBSerializer:
-    """Write TableModel to a DuckDB file. Optional: table name (default 'data')."""
+    """Write TableModel to a DuckDB file. Optional: table name (default 'data').
+
+    With pyarrow installed, batches are streamed to DuckDB as Arrow record batches and
+    loaded by ``CREATE TABLE AS SELECT``, keeping each column's Arrow type. A later batch
+    that needs a wider type (floats in an int column, values in an all-null one) widens
+    the column with ``ALTER TABLE`` before its rows are inserted (see
+    :mod:`shiftd.widening`). Columns with values Arrow cannot type together (mixed
+    values, in one batch or across batches) and all-null columns are VARCHAR. Without
+    pyarrow, the rows are spooled to a temporary CSV file that DuckDB loads with
+    ``COPY``, into columns typed from all the rows.
+    """
 
     def __init__(self, table: str = "data", **kwargs: object) -> None:
         self.table = table
         self.kwargs = kwargs
 
     def serialize(self, table: TableModel, target: Path | str) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
         try:
             import duckdb
         except ImportError as e:
@@ -32,26 +153,103 @@ class DuckDBSerializer:
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
         safe_table = _sanitize_name(self.table)
+        batches = iter(batches)
+        first = next(batches, None)
 
         conn = duckdb.connect(str(path))
         try:
             conn.execute(f'DROP TABLE IF EXISTS "{safe_table}"')
-            if not table.columns and not table.rows:
+            if first is None or (not first.columns and not first.rows):
                 conn.execute(f'CREATE TABLE "{safe_table}" (id INTEGER)')
+            elif _has_pyarrow():
+                self._load_arrow(conn, safe_table, first, batches)
             else:
-                columns = [_sanitize_name(c) for c in table.columns]
-                col_defs = ", ".join(f'"{c}" VARCHAR' for c in columns)
-                conn.execute(f'CREATE TABLE "{safe_table}" ({col_defs})')
-                placeholders = ", ".join("?" for _ in columns)
-                col_list = ", ".join(f'"{c}"' for c in columns)
-                for row in table.rows:
-                    values = [
-                        str(v) if v is not None else None
-                        for v in (row.get(c) for c in table.columns)
-                    ]
-                    conn.execute(
-                        f'INSERT INTO "{safe_table}" ({col_list}) VALUES ({placeholders})',
-                        values,
-                    )
+                self._load_rows(conn, safe_table, first, batches)
         finally:
             conn.close()
+
+    @staticmethod
+    def _load_arrow(
+        conn: Any, table: str, first: TableModel, batches: Iterator[TableModel]
+    ) -> None:
+        """Load runs of batches that share a schema with one statement each, widening the
+        table's column types with ``ALTER TABLE`` between runs."""
+        import pyarrow as pa
+
+        names = [_sanitize_name(c) for c in first.columns]
+        text_columns: set[str] = set()
+
+        def convert(batch: TableModel) -> Any:
+            try:
+                arrow = _stringify(batch, frozenset(text_columns)).to_arrow()
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                text_columns.update(_mixed_columns(batch))
+                arrow = _stringify(batch, frozenset(text_columns)).to_arrow()
+            return arrow.rename_columns(names)
+
+        def typed() -> Iterator[tuple[Any, Any]]:
+            schema = None
+            for batch in chain([first], batches):
+                arrow = convert(batch)
+                if schema is None:
+                    schema = arrow.schema
+                elif not arrow.schema.equals(schema):
+                    schema, clashes = _widen(schema, arrow.schema)
+                    if clashes:
+                        text_columns.update(batch.columns[i] for i in clashes)
+                        arrow = convert(batch)
+                if not arrow.schema.equals(schema):
+                    arrow = arrow.cast(schema)
+                yield schema, arrow
+
+        loaded = None
+        for schema, run in groupby(typed(), key=itemgetter(0)):
+            if loaded is not None:
+                _alter_types(conn, table, loaded, schema)
+            record_batches = (b for _, arrow in run for b in arrow.to_batches())
+            conn.register(_SOURCE_VIEW, pa.RecordBatchReader.from_batches(schema, record_batches))
+            try:
+                if loaded is None:
+                    conn.execute(f'CREATE TABLE "{table}" AS SELECT * FROM {_SOURCE_VIEW}')
+                else:
+                    conn.execute(f'INSERT INTO "{table}" SELECT * FROM {_SOURCE_VIEW}')
+            finally:
+                conn.unregister(_SOURCE_VIEW)
+            loaded = schema
+        # Columns that never had a value say nothing about their type; keep them as text.
+        if loaded is not None:
+            text = pa.schema(
+                f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in loaded
+            )
+            _alter_types(conn, table, loaded, text)
+
+    @staticmethod
+    def _load_rows(conn: Any, table: str, first: TableModel, batches: Iterator[TableModel]) -> None:
+        """Spool the rows to a temporary CSV file and load it with DuckDB's ``COPY``.
+
+        Columns are typed once every batch has been spooled, from the Python types of all
+        their values: one type (or int and float, as DOUBLE) keeps it, anything else is
+        VARCHAR.
+        """
+        columns = [_sanitize_name(c) for c in first.columns]
+        seen: list[set[type]] = [set() for _ in columns]
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "rows.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                # Quoting every non-null value keeps NULL (empty) apart from "" (empty string).
+                writer = csv.writer(f, quoting=csv.QUOTE_NOTNULL)
+                for batch in chain([first], batches):
+                    batch_kinds = [set(map(type, v)) for v in batch.to_columns().values()]
+                    for kinds, new in zip(seen, batch_kinds):
+                        kinds |= new
+                    rows: Iterable[Sequence[Any]] = batch.iter_tuples()
+                    if any(kinds & _CSV_FORMATTERS.keys() for kinds in batch_kinds):
+                        rows = (
+                            [v if v is None else _CSV_FORMATTERS.get(type(v), str)(v) for v in row]
+                            for row in rows
+                        )
+                    writer.writerows(rows)
+            col_defs = ", ".join(f'"{c}" {_sql_type(kinds)}' for c, kinds in zip(columns, seen))
+            conn.execute(f'CREATE TABLE "{table}" ({col_defs})')
+            source = str(path).replace("'", "''")
+            conn.execute(f"COPY \"{table}\" FROM '{source}' ({_CSV_OPTIONS})")
@@ -2,30 +2,67 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+# Rows in an Excel worksheet, header included.
+MAX_SHEET_ROWS = 1_048_576
+
+
+def _workbook() -> Any:
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise ImportError(
+            "Excel support requires optional dependency: uv add 'shiftd[excel]'"
+        ) from e
+    return Workbook(write_only=True)
+
 
 @register_serializer("xlsx")
 @register_serializer("excel")
 class ExcelSerializer:
-    """Write TableModel as an Excel file (.xlsx)."""
+    """Write TableModel as an Excel file (.xlsx).
+
+    Rows are streamed with openpyxl's ``write_only`` mode, so memory does not grow with
+    the table. A table longer than a worksheet continues on ``Sheet2``, ``Sheet3``, ...
+    (named after ``sheet_name``), each starting with the header row.
+    """
+
+    def __init__(self, sheet_name: str = "Sheet", max_rows: int = MAX_SHEET_ROWS) -> None:
+        if not 2 <= max_rows <= MAX_SHEET_ROWS:
+            raise ValueError(f"max_rows must be between 2 and {MAX_SHEET_ROWS}")
+        self.sheet_name = sheet_name
+        self.max_rows = max_rows
 
     def serialize(self, table: TableModel, target: Path | str) -> None:
-        try:
-            from openpyxl import Workbook
-        except ImportError as e:
-            raise ImportError(
-                "Excel support requires optional dependency: uv add 'shiftd[excel]'"
-            ) from e
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
+        wb = _workbook()
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
-        wb = Workbook()
-        ws = wb.active
-        if table.columns:
-            ws.append(table.columns)
-            for row in table.rows:
-                ws.append([row.get(c) for c in table.columns])
+        ws = wb.create_sheet(self.sheet_name)
+        columns: list[str] | None = None
+        sheets = 1
+        used = 0  # rows on the current sheet
+        for batch in batches:
+            if columns is None:
+                columns = batch.columns
+                if not columns:
+                    break
+                ws.append(columns)
+                used = 1
+            for values in batch.iter_tuples():
+                if used == self.max_rows:
+                    sheets += 1
+                    ws = wb.create_sheet(f"{self.sheet_name}{sheets}")
+                    ws.append(columns)
+                    used = 1
+                ws.append(values)
+                used += 1
         wb.save(path)
@@ -39,10 +39,9 @@ class HTMLSerializer:
             lines.append("    </tr>")
             lines.append("  </thead>")
         lines.append("  <tbody>")
-        for row in table.rows:
+        for values in table.iter_tuples():
             lines.append("    <tr>")
-            for col in table.columns:
-                val = row.get(col, "")
+            for val in values:
                 lines.append(f"      <td>{_escape(str(val) if val is not None else '')}</td>")
             lines.append("    </tr>")
         lines.append("  </tbody>")
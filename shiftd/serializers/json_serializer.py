@@ -16,4 +16,4 @@ class JSONSerializer:
     def serialize(self, table: TableModel, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(table.rows, f, indent=self.indent, **self.kwargs)
+            json.dump(list(table.iter_dicts()), f, indent=self.indent, **self.kwargs)
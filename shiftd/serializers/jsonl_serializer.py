@@ -1,6 +1,7 @@
 """Serialize TableModel to JSONL (JSON Lines)."""
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from shiftd.schema import TableModel
@@ -14,8 +15,13 @@ class JSONLSerializer:
     def __init__(self, **kwargs: object) -> None:
         self.kwargs = kwargs
 
-    def serialize(self, table: TableModel, path: Path) -> None:
+    def serialize(self, table: TableModel, path: Path | str) -> None:
+        self.write_batches([table], path)
+
+    def write_batches(self, batches: Iterable[TableModel], path: Path | str) -> None:
+        path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w", encoding="utf-8") as f:
-            for row in table.rows:
-                f.write(json.dumps(row, **self.kwargs) + "\n")
+            for batch in batches:
+                for row in batch.iter_dicts():
+                    f.write(json.dumps(row, **self.kwargs) + "\n")
@@ -28,8 +28,8 @@ class MarkdownSerializer:
         sep = "| " + " | ".join("---" for _ in table.columns) + " |"
         lines.append(sep)
         # Data rows
-        for row in table.rows:
-            vals = [str(row.get(c, "")) if row.get(c) is not None else "" for c in table.columns]
+        for values in table.iter_tuples():
+            vals = [str(v) if v is not None else "" for v in values]
             lines.append("| " + " | ".join(vals) + " |")
 
         with open(path, "w", encoding="utf-8") as f:
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
+from shiftd.widening import WideningWriter
 
 
 @register_serializer("parquet")
 class ParquetSerializer:
     def serialize(self, table: TableModel, target: str | Path) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: str | Path) -> None:
+        """Write each batch as its own row group.
+
+        Column types widen as batches arrive (see :mod:`shiftd.widening`): an all-null
+        or int column that later gets strings or floats is written as such, never cast
+        to the first batch's type.
+        """
         try:
             import pyarrow as pa
             import pyarrow.parquet as pq
@@ -20,8 +32,26 @@ class ParquetSerializer:
             ) from e
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
-        if not table.columns and not table.rows:
-            pa_table = pa.table({})
-        else:
-            pa_table = pa.Table.from_pylist(table.rows)
-        pq.write_table(pa_table, str(path))
+        writer = WideningWriter(path, _open_writer, _read_batches)
+        try:
+            for batch in batches:
+                if writer.schema is None and not batch.columns and not batch.rows:
+                    break
+                writer.write(batch.to_arrow())
+        finally:
+            writer.close()
+        if writer.schema is None:
+            pq.write_table(pa.table({}), str(path))
+
+
+def _open_writer(path: Path, schema: Any) -> Any:
+    import pyarrow.parquet as pq
+
+    return pq.ParquetWriter(str(path), schema)
+
+
+def _read_batches(path: Path) -> Iterator[Any]:
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as pf:
+        yield from pf.iter_batches()
@@ -2,27 +2,176 @@
 
 from __future__ import annotations
 
+import datetime
+import decimal
+import io
+import math
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+# Python type of a column's values -> PostgreSQL type (TIMESTAMPTZ for datetimes with a
+# tzinfo). Mixed or all-null columns are TEXT.
+_SQL_TYPES: dict[type, str] = {
+    bool: "BOOLEAN",
+    int: "BIGINT",
+    float: "DOUBLE PRECISION",
+    decimal.Decimal: "NUMERIC",
+    str: "TEXT",
+    bytes: "BYTEA",
+    datetime.datetime: "TIMESTAMP",
+    datetime.date: "DATE",
+    datetime.time: "TIME",
+    datetime.timedelta: "INTERVAL",
+}
+
+# Characters handed to the server per read while streaming COPY data.
+_COPY_READ_CHARS = 2**20
+
+# COPY text format: backslash escapes for the characters that delimit fields and rows.
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
 
 def _sanitize_name(name: str) -> str:
     """Use only alphanumeric and underscore for identifiers."""
     return "".join(c if c.isalnum() or c == "_" else "_" for c in name) or "col"
 
 
+def _format_float(v: float) -> str:
+    if math.isfinite(v):
+        return repr(v)
+    return "NaN" if math.isnan(v) else ("Infinity" if v > 0 else "-Infinity")
+
+
+def _format_interval(v: datetime.timedelta) -> str:
+    return f"{v.days} days {v.seconds} seconds {v.microseconds} microseconds"
+
+
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: lambda v: v.translate(_ESCAPES),
+    int: str,
+    bool: lambda v: "true" if v else "false",
+    float: _format_float,
+    bytes: lambda v: "\\\\x" + v.hex(),
+    datetime.timedelta: _format_interval,
+}
+
+
+def _format_value(v: Any) -> str:
+    if v is None:
+        return "\\N"
+    fmt = _FORMATTERS.get(type(v))
+    if fmt is not None:
+        return fmt(v)
+    if isinstance(v, (datetime.date, datetime.time)):
+        return v.isoformat()
+    return str(v).translate(_ESCAPES)
+
+
+def _copy_text(batch: TableModel) -> str:
+    """One batch as COPY text-format rows (tab-separated, ``\\N`` for NULL)."""
+    return "".join("\t".join(map(_format_value, values)) + "\n" for values in batch.iter_tuples())
+
+
+def _batch_types(batch: TableModel) -> list[str | None]:
+    """SQL type of each column's values in one batch: None when all are null, TEXT when
+    they mix types (naive and aware datetimes included)."""
+    out: list[str | None] = []
+    for name, kind in batch.column_types().items():
+        if kind is datetime.datetime:
+            if batch.is_arrow:
+                aware = {batch.to_arrow().schema.field(name).type.tz is not None}
+            else:
+                aware = {v.tzinfo is not None for v in batch.column(name) if v is not None}
+            out.append(
+                "TEXT" if len(aware) > 1 else "TIMESTAMPTZ" if True in aware else "TIMESTAMP"
+            )
+        elif kind is not None:
+            out.append(_SQL_TYPES.get(kind, "TEXT"))
+        elif any(v is not None for v in batch.column(name)):
+            out.append("TEXT")
+        else:
+            out.append(None)
+    return out
+
+
+def _widen_type(old: str | None, new: str | None) -> str | None:
+    """Column type holding the values of both types (None: no value seen yet)."""
+    if new is None or new == old:
+        return old
+    if old is None:
+        return new
+    if {old, new} == {"BIGINT", "DOUBLE PRECISION"}:
+        return "DOUBLE PRECISION"
+    return "TEXT"
+
+
+def _typed(batches: Iterable[TableModel]) -> Iterator[tuple[tuple[str | None, ...], TableModel]]:
+    """Each batch with the column types of every batch so far, widened."""
+    types: list[str | None] | None = None
+    for batch in batches:
+        new = _batch_types(batch)
+        types = new if types is None else [_widen_type(o, n) for o, n in zip(types, new)]
+        yield tuple(types), batch
+
+
+class _CopyStream(io.TextIOBase):
+    """Readable file over the COPY text of a stream of batches, encoded one batch at a time."""
+
+    def __init__(self, batches: Iterable[TableModel]) -> None:
+        self._chunks = map(_copy_text, batches)
+        self._current = io.StringIO()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        if size is None or size < 0:
+            return self._current.read() + "".join(self._chunks)
+        parts: list[str] = []
+        while size > 0:
+            part = self._current.read(size)
+            if not part:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._current = io.StringIO(chunk)
+                continue
+            parts.append(part)
+            size -= len(part)
+        return "".join(parts)
+
+
 @register_serializer("postgres")
 @register_serializer("postgresql")
 class PostgresSerializer:
-    """Write TableModel to a PostgreSQL table. Target: connection string. Optional: table name."""
+    """Write TableModel to a PostgreSQL table. Target: connection string. Optional: table name.
+
+    Rows are streamed batch by batch into ``COPY ... FROM STDIN``. Columns are declared
+    BIGINT/DOUBLE PRECISION/BOOLEAN/TIMESTAMP/TIMESTAMPTZ/... when all values of the
+    first batch have that type (see :meth:`~shiftd.schema.TableModel.column_types`),
+    TEXT otherwise. A later batch that needs another type ends the COPY and widens the
+    column with ``ALTER TABLE`` before the next COPY starts: an all-null column takes
+    the type of its first values, int becomes DOUBLE PRECISION when floats arrive, and
+    any other clash becomes TEXT. With ``staging=True`` the rows go into an UNLOGGED
+    staging table that replaces the target in one transaction once loaded, so readers
+    keep the old table until then.
+    """
 
-    def __init__(self, table: str = "data", **kwargs: object) -> None:
+    def __init__(self, table: str = "data", *, staging: bool = False, **kwargs: object) -> None:
         self.table = table
+        self.staging = staging
         self.kwargs = kwargs
 
     def serialize(self, table: TableModel, target: Path | str) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
         try:
             import psycopg2
         except ImportError as e:
@@ -31,23 +180,43 @@ class PostgresSerializer:
             ) from e
         dsn = str(target)
         safe_table = _sanitize_name(self.table)
+        load_table = f"{safe_table}__shiftd_staging" if self.staging else safe_table
+        batches = iter(batches)
+        first = next(batches, None)
         conn = psycopg2.connect(dsn, **self.kwargs)
         cur = conn.cursor()
         try:
-            cur.execute(f'DROP TABLE IF EXISTS "{safe_table}"')
-            if not table.columns and not table.rows:
-                cur.execute(f'CREATE TABLE "{safe_table}" (id SERIAL PRIMARY KEY)')
+            cur.execute(f'DROP TABLE IF EXISTS "{load_table}"')
+            unlogged = "UNLOGGED " if self.staging else ""
+            if first is None or (not first.columns and not first.rows):
+                cur.execute(f'CREATE {unlogged}TABLE "{load_table}" (id SERIAL PRIMARY KEY)')
             else:
-                cols = [f'"{_sanitize_name(c)}" TEXT' for c in table.columns]
-                cur.execute(f'CREATE TABLE "{safe_table}" ({", ".join(cols)})')
-                for row in table.rows:
-                    values = [row.get(c) for c in table.columns]
-                    placeholders = ", ".join("%s" for _ in table.columns)
-                    col_list = ", ".join(f'"{_sanitize_name(c)}"' for c in table.columns)
-                    cur.execute(
-                        f'INSERT INTO "{safe_table}" ({col_list}) VALUES ({placeholders})',
-                        values,
+                columns = [_sanitize_name(c) for c in first.columns]
+                col_list = ", ".join(f'"{c}"' for c in columns)
+                declared: tuple[str | None, ...] | None = None
+                # One COPY per run of batches whose types fit the columns; a batch that
+                # needs a wider type (or TEXT, when types clash) alters them first.
+                for types, run in groupby(_typed(chain([first], batches)), key=itemgetter(0)):
+                    if declared is None:
+                        col_defs = ", ".join(f'"{c}" {t or "TEXT"}' for c, t in zip(columns, types))
+                        cur.execute(f'CREATE {unlogged}TABLE "{load_table}" ({col_defs})')
+                    else:
+                        for c, old, new in zip(columns, declared, types):
+                            if new != old:
+                                cur.execute(
+                                    f'ALTER TABLE "{load_table}" ALTER COLUMN "{c}" '
+                                    f'TYPE {new} USING "{c}"::{new}'
+                                )
+                    cur.copy_expert(
+                        f'COPY "{load_table}" ({col_list}) FROM STDIN',
+                        _CopyStream(batch for _, batch in run),
+                        size=_COPY_READ_CHARS,
                     )
+                    declared = types
+            if self.staging:
+                cur.execute(f'ALTER TABLE "{load_table}" SET LOGGED')
+                cur.execute(f'DROP TABLE IF EXISTS "{safe_table}"')
+                cur.execute(f'ALTER TABLE "{load_table}" RENAME TO "{safe_table}"')
             conn.commit()
         finally:
             conn.close()
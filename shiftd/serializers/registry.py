@@ -1,7 +1,8 @@
 """Registry of format serializers."""
 
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from shiftd.schema import TableModel
 
@@ -14,6 +15,17 @@ class Serializer(Protocol):
     def serialize(self, table: TableModel, target: Target) -> None: ...
 
 
+@runtime_checkable
+class BatchSerializer(Serializer, Protocol):
+    """Serializer that can write a stream of TableModel batches as they arrive.
+
+    The first batch fixes the columns. Writing no batches produces the same output
+    as serializing an empty table.
+    """
+
+    def write_batches(self, batches: Iterable[TableModel], target: Target) -> None: ...
+
+
 _REGISTRY: dict[str, type[Serializer]] = {}
 
 
@@ -3,46 +3,152 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable, Sequence
 from pathlib import Path
+from typing import Literal, get_args
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+JournalMode = Literal["OFF", "WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"]
+
+# Python type of a column's values -> declared SQLite type. Other columns are left
+# untyped, so every value is stored as given.
+_SQL_TYPES: dict[type, str] = {
+    bool: "INTEGER",
+    int: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    bytes: "BLOB",
+}
+
+# Page cache during the load, in KiB.
+_LOAD_CACHE_KIB = 128 * 1024
+
 
 def _sanitize_name(name: str) -> str:
     """Use only alphanumeric and underscore for table/column names."""
     return "".join(c if c.isalnum() or c == "_" else "_" for c in name) or "col"
 
 
+def _batch_types(batch: TableModel) -> list[str | None]:
+    """Declared type fitting each column of one batch: None when all values are null,
+    "" (untyped) when they mix types or have no SQLite type."""
+    out: list[str | None] = []
+    for name, kind in batch.column_types().items():
+        if kind is not None:
+            out.append(_SQL_TYPES.get(kind, ""))
+        elif any(v is not None for v in batch.column(name)):
+            out.append("")
+        else:
+            out.append(None)
+    return out
+
+
+def _col_defs(columns: list[str], types: list[str]) -> str:
+    return ", ".join(f'"{c}" {t}' if t else f'"{c}"' for c, t in zip(columns, types))
+
+
 @register_serializer("sqlite")
 class SQLiteSerializer:
-    """Write TableModel to a SQLite file. Optional: table name (default 'data')."""
+    """Write TableModel to a SQLite file. Optional: table name (default 'data').
+
+    Rows are bulk-inserted with ``executemany`` in one transaction, with
+    ``synchronous=OFF`` and a large page cache. ``journal_mode`` defaults to ``OFF``
+    for a new file and ``WAL`` when writing into an existing database, and is restored
+    afterwards. Columns are declared INTEGER/REAL/TEXT/BLOB when all values of the
+    first batch have that type (see :meth:`~shiftd.schema.TableModel.column_types`),
+    and left untyped otherwise. When a later batch brings values of another type into a
+    declared column, the table is rebuilt with that column untyped before they are
+    inserted, so SQLite's type affinity never converts a value. ``indexes`` (column
+    names, or tuples of them) are created after the data is in.
+    """
 
-    def __init__(self, table: str = "data", **kwargs: object) -> None:
+    def __init__(
+        self,
+        table: str = "data",
+        *,
+        indexes: Sequence[str | Sequence[str]] = (),
+        journal_mode: JournalMode | None = None,
+        **kwargs: object,
+    ) -> None:
+        if journal_mode is not None and journal_mode not in get_args(JournalMode):
+            raise ValueError(
+                f"Unknown journal_mode: {journal_mode}. Available: {list(get_args(JournalMode))}"
+            )
         self.table = table
+        self.indexes = indexes
+        self.journal_mode = journal_mode
         self.kwargs = kwargs
 
     def serialize(self, table: TableModel, target: Path | str) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
+        """Create the table from the first batch, then insert batch by batch in one transaction."""
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
+        journal_mode = self.journal_mode or ("WAL" if path.exists() else "OFF")
         safe_table = _sanitize_name(self.table)
         conn = sqlite3.connect(str(path), **self.kwargs)
         cur = conn.cursor()
+        previous: tuple[str, int] | None = None
         try:
+            previous = (
+                cur.execute("PRAGMA journal_mode").fetchone()[0],
+                cur.execute("PRAGMA synchronous").fetchone()[0],
+            )
+            cur.execute(f"PRAGMA journal_mode={journal_mode}")
+            cur.execute("PRAGMA synchronous=OFF")
+            cur.execute(f"PRAGMA cache_size=-{_LOAD_CACHE_KIB}")
             cur.execute(f'DROP TABLE IF EXISTS "{safe_table}"')
-            if not table.columns and not table.rows:
+            insert: str | None = None
+            for batch in batches:
+                types = _batch_types(batch)
+                if insert is None:
+                    if not batch.columns and not batch.rows:
+                        break
+                    columns = [_sanitize_name(c) for c in batch.columns]
+                    declared = [t or "" for t in types]
+                    cur.execute(f'CREATE TABLE "{safe_table}" ({_col_defs(columns, declared)})')
+                    col_list = ", ".join(f'"{c}"' for c in columns)
+                    placeholders = ", ".join("?" for _ in columns)
+                    insert = f'INSERT INTO "{safe_table}" ({col_list}) VALUES ({placeholders})'
+                elif any(d and t is not None and t != d for d, t in zip(declared, types)):
+                    # Type affinity would convert these values: drop the declared types.
+                    declared = [d if t is None or t == d else "" for d, t in zip(declared, types)]
+                    self._retype(cur, safe_table, columns, declared)
+                cur.executemany(insert, batch.iter_tuples())
+            if insert is None:
                 cur.execute(f'CREATE TABLE "{safe_table}" (id INTEGER PRIMARY KEY)')
             else:
-                columns = [_sanitize_name(c) for c in table.columns]
-                col_list = ", ".join(f'"{c}"' for c in columns)
-                cur.execute(f'CREATE TABLE "{safe_table}" ({col_list})')
-                placeholders = ", ".join("?" for _ in columns)
-                for row in table.rows:
-                    values = [row.get(c) for c in table.columns]
-                    cur.execute(
-                        f'INSERT INTO "{safe_table}" ({col_list}) VALUES ({placeholders})',
-                        values,
-                    )
+                self._create_indexes(cur, safe_table)
             conn.commit()
         finally:
-            conn.close()
+            try:
+                # Also after a failed load: the tuned journal mode would stay on the file.
+                if previous is not None:
+                    conn.rollback()
+                    previous_mode, previous_sync = previous
+                    cur.execute(f"PRAGMA synchronous={previous_sync}")
+                    if previous_mode.upper() != journal_mode:
+                        cur.execute(f"PRAGMA journal_mode={previous_mode}")
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _retype(cur: sqlite3.Cursor, table: str, columns: list[str], types: list[str]) -> None:
+        """Rebuild the table with new declared types. Its rows so far all fit their
+        columns' old types, so they are copied unchanged."""
+        staging = f"{table}__shiftd_retype"
+        cur.execute(f'CREATE TABLE "{staging}" ({_col_defs(columns, types)})')
+        cur.execute(f'INSERT INTO "{staging}" SELECT * FROM "{table}"')
+        cur.execute(f'DROP TABLE "{table}"')
+        cur.execute(f'ALTER TABLE "{staging}" RENAME TO "{table}"')
+
+    def _create_indexes(self, cur: sqlite3.Cursor, table: str) -> None:
+        for index in self.indexes:
+            columns = [_sanitize_name(c) for c in ([index] if isinstance(index, str) else index)]
+            name = _sanitize_name(f"idx_{table}_{'_'.join(columns)}")
+            col_list = ", ".join(f'"{c}"' for c in columns)
+            cur.execute(f'CREATE INDEX "{name}" ON "{table}" ({col_list})')
@@ -40,9 +40,10 @@ class TOMLSerializer:
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
         lines: list[str] = []
-        for row in table.rows:
+        keys = [_format_key(col) for col in table.columns]
+        for values in table.iter_tuples():
             lines.append(f"[[{self.table_name}]]")
-            for col in table.columns:
-                lines.append(f"{_format_key(col)} = {_format_value(row.get(col))}")
+            for key, value in zip(keys, values):
+                lines.append(f"{key} = {_format_value(value)}")
             lines.append("")
         path.write_text("\n".join(lines), encoding="utf-8")
@@ -3,45 +3,92 @@
 Tabular format: [N]{field1,field2,...}: then N lines of comma-separated values.
 """
 
+import shutil
+import tempfile
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+# Rows formatted before each write to the file.
+_WRITE_ROWS = 4096
+
 
 def _format_cell(v: Any) -> str:
-    """Format one cell for TOON. Quote if contains comma, newline, or quote."""
-    if v is None:
-        return "null"
-    if isinstance(v, bool):
-        return "true" if v else "false"
-    if isinstance(v, (int, float)):
-        if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
+    """Format one cell for TOON. Quote if it is empty, contains a comma, line break or
+    quote, or has surrounding whitespace; escapes keep each row on one line."""
+    if type(v) is not str:
+        if v is None:
             return "null"
-        return str(v)
-    s = str(v)
-    if "," in s or "\n" in s or '"' in s:
-        s = '"' + s.replace("\\", "\\\\").replace('"', '\\"') + '"'
-    return s
-
-
-def _to_toon(columns: list[str], rows: list[dict[str, Any]]) -> str:
-    """Encode to TOON tabular: [N]{field1,field2,...}: then N data lines."""
-    if not columns or not rows:
-        return ""
-    n = len(rows)
-    header = f"[{n}]{{{','.join(columns)}}}:"
-    lines = [header]
-    for row in rows:
-        cells = [_format_cell(row.get(k)) for k in columns]
-        lines.append("  " + ",".join(cells))
-    return "\n".join(lines)
+        if isinstance(v, bool):
+            return "true" if v else "false"
+        if isinstance(v, (int, float)):
+            if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
+                return "null"
+            return str(v)
+        v = str(v)
+    if (
+        v
+        and "," not in v
+        and '"' not in v
+        and "\n" not in v
+        and "\r" not in v
+        and not v[0].isspace()
+        and not v[-1].isspace()
+    ):
+        return v
+    v = v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+    return '"' + v + '"'
+
+
+def _write_rows(f: TextIO, rows: Iterable[tuple[Any, ...]]) -> None:
+    lines: list[str] = []
+    for values in rows:
+        lines.append("\n  " + ",".join(map(_format_cell, values)))
+        if len(lines) >= _WRITE_ROWS:
+            f.write("".join(lines))
+            lines.clear()
+    f.write("".join(lines))
 
 
 @register_serializer("toon")
 class TOONSerializer:
+    """Write TableModel as one TOON tabular block.
+
+    The header declares the row count, so batches from an iterator of unknown length
+    are spooled to a temporary file next to the target and copied after the header.
+    """
+
     def serialize(self, table: TableModel, target: Path | str) -> None:
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(_to_toon(table.columns, table.rows), encoding="utf-8")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            if isinstance(batches, Sequence):
+                n = sum(len(b.rows) for b in batches)
+                if n and batches[0].columns:
+                    self._write_header(f, batches[0].columns, n)
+                    for batch in batches:
+                        _write_rows(f, batch.iter_tuples())
+                return
+            with tempfile.TemporaryFile(
+                "w+", encoding="utf-8", newline="\n", dir=path.parent
+            ) as spool:
+                columns: list[str] | None = None
+                n = 0
+                for batch in batches:
+                    columns = batch.columns if columns is None else columns
+                    n += len(batch.rows)
+                    _write_rows(spool, batch.iter_tuples())
+                if n and columns:
+                    self._write_header(f, columns, n)
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f)
+
+    @staticmethod
+    def _write_header(f: TextIO, columns: list[str], n: int) -> None:
+        f.write(f"[{n}]{{{','.join(columns)}}}:")
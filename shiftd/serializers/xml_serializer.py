@@ -1,35 +1,98 @@
 """Serialize TableModel to XML."""
 
-import xml.etree.ElementTree as ET
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any, TextIO
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+_INDENT = "  "
 
-def _dict_to_elem(parent: ET.Element, tag: str, value: object) -> None:
+# Rows rendered before each write to the file.
+_WRITE_ROWS = 4096
+
+
+def _escape(text: str) -> str:
+    # Character data escaping as done by xml.etree.ElementTree.
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _check_tag(tag: Any) -> str:
+    if not isinstance(tag, str):
+        raise TypeError(f"cannot serialize {tag!r} (type {type(tag).__name__})")
+    if tag[:1] == "{":
+        raise ValueError(f"namespaced tag {tag!r} is not supported")
+    return tag
+
+
+def _write_elem(parts: list[str], tag: str, value: Any, depth: int) -> None:
+    """Append ``value`` as a ``tag`` element indented at ``depth``; None writes nothing."""
+    if value is None:
+        return
+    pad = "\n" + _INDENT * depth
     if isinstance(value, dict):
-        child = ET.SubElement(parent, tag)
+        children: list[str] = []
         for k, v in value.items():
-            _dict_to_elem(child, k, v)
-    elif value is not None:
-        child = ET.SubElement(parent, tag)
-        child.text = str(value)
+            _write_elem(children, _check_tag(k), v, depth + 1)
+        if children:
+            parts.append(f"{pad}<{tag}>{''.join(children)}{pad}</{tag}>")
+        else:
+            parts.append(f"{pad}<{tag} />")
+        return
+    text = str(value)
+    parts.append(f"{pad}<{tag}>{_escape(text)}</{tag}>" if text else f"{pad}<{tag} />")
 
 
 @register_serializer("xml")
 class XMLSerializer:
+    """Write TableModel as an indented XML document, one ``row_tag`` element per row.
+
+    Rows are escaped and written straight to the file batch by batch, so no element
+    tree is built; the output is what ``ElementTree`` with ``ET.indent`` would write.
+    """
+
     def __init__(self, root_tag: str = "root", row_tag: str = "row") -> None:
         self.root_tag = root_tag
         self.row_tag = row_tag
 
-    def serialize(self, table: TableModel, path: Path) -> None:
+    def serialize(self, table: TableModel, path: Path | str) -> None:
+        self.write_batches([table], path)
+
+    def write_batches(self, batches: Iterable[TableModel], path: Path | str) -> None:
+        path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        root = ET.Element(self.root_tag)
-        for row in table.rows:
-            row_el = ET.SubElement(root, self.row_tag)
-            for col in table.columns:
-                _dict_to_elem(row_el, col, row.get(col))
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ")
-        tree.write(path, encoding="utf-8", xml_declaration=True, default_namespace="")
+        root, row_tag = _check_tag(self.root_tag), _check_tag(self.row_tag)
+        with open(path, "w", encoding="utf-8", errors="xmlcharrefreplace", newline="\n") as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            opened = False
+            for batch in batches:
+                if not opened and len(batch.rows):
+                    f.write(f"<{root}>")
+                    opened = True
+                self._write_rows(f, batch, row_tag)
+            f.write(f"\n</{root}>" if opened else f"<{root} />")
+
+    @staticmethod
+    def _write_rows(f: TextIO, batch: TableModel, row_tag: str) -> None:
+        columns = [_check_tag(c) for c in batch.columns]
+        row_pad = "\n" + _INDENT
+        parts: list[str] = []
+        for values in batch.iter_tuples():
+            cells: list[str] = []
+            for col, value in zip(columns, values):
+                _write_elem(cells, col, value, 2)
+            if cells:
+                parts.append(f"{row_pad}<{row_tag}>{''.join(cells)}{row_pad}</{row_tag}>")
+            else:
+                parts.append(f"{row_pad}<{row_tag} />")
+            if len(parts) >= _WRITE_ROWS:
+                f.write("".join(parts))
+                parts.clear()
+        f.write("".join(parts))
@@ -2,25 +2,81 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from shiftd.schema import TableModel
 from shiftd.serializers.registry import register_serializer
 
+_STYLE: dict[str, Any] = {"default_flow_style": False, "allow_unicode": True, "sort_keys": False}
+
+
+def _import_yaml() -> Any:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("YAML support requires optional dependency: uv add 'shiftd[yaml]'") from e
+    return yaml
+
+
+@cache
+def _dumper() -> Any:
+    """libyaml's safe dumper when pyyaml was built with it, else the pure-Python one.
+
+    Tuples are written as lists and decimals as floats, so the output stays loadable
+    by any safe loader. Values shared between rows are written out each time, without
+    ``&id`` anchors, so the output does not depend on how rows are batched.
+    """
+    yaml = _import_yaml()
+
+    class Dumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):  # type: ignore[misc]
+        def ignore_aliases(self, data: Any) -> bool:
+            return True
+
+    def represent_decimal(dumper: Any, value: Decimal) -> Any:
+        if not value.is_finite():
+            return dumper.represent_float(float(value))
+        return dumper.represent_scalar("tag:yaml.org,2002:float", str(value))
+
+    Dumper.add_representer(tuple, Dumper.represent_list)
+    Dumper.add_representer(Decimal, represent_decimal)
+    return Dumper
+
 
 @register_serializer("yaml")
 @register_serializer("yml")
 class YAMLSerializer:
-    """Write TableModel as a YAML list of objects."""
+    """Write TableModel as a YAML list of objects.
+
+    Batches are dumped one at a time and appended, which gives the same list as one
+    dump of the whole table. With ``documents=True`` each row is its own document in a
+    ``---``-separated stream instead.
+    """
+
+    def __init__(self, documents: bool = False) -> None:
+        self.documents = documents
 
     def serialize(self, table: TableModel, target: Path | str) -> None:
-        try:
-            import yaml
-        except ImportError as e:
-            raise ImportError(
-                "YAML support requires optional dependency: uv add 'shiftd[yaml]'"
-            ) from e
+        self.write_batches([table], target)
+
+    def write_batches(self, batches: Iterable[TableModel], target: Path | str) -> None:
+        yaml = _import_yaml()
+        dumper = _dumper()
         path = Path(target)
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(table.rows, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            empty = True
+            for batch in batches:
+                rows = list(batch.iter_dicts())
+                if not rows:
+                    continue
+                empty = False
+                if self.documents:
+                    yaml.dump_all(rows, f, Dumper=dumper, explicit_start=True, **_STYLE)
+                else:
+                    yaml.dump(rows, f, Dumper=dumper, **_STYLE)
+            if empty and not self.documents:
+                yaml.dump([], f, Dumper=dumper, **_STYLE)
@@ -0,0 +1,103 @@
+"""Arrow schemas that widen as a stream of batches reveals its column types.
+
+The first batch of a stream does not settle its types: an all-null column has none yet
+and an int column may get floats later. Batches are converted with their own types and
+the written schema is widened to cover them (``pyarrow.unify_schemas`` with permissive
+promotion: null to any type, int to float, string to large string, ...). Types that do
+not widen into each other, such as int and str, raise ``ValueError``: no value is ever
+cast into a narrower type. Requires optional dependency shiftd[arrow].
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+
+def widen_type(a: Any, b: Any) -> Any | None:
+    """The narrowest Arrow type holding values of both ``a`` and ``b``, or None."""
+    import pyarrow as pa
+
+    if a.equals(b):
+        return a
+    try:
+        unified = pa.unify_schemas(
+            [pa.schema([("v", a)]), pa.schema([("v", b)])], promote_options="permissive"
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    return unified.field("v").type
+
+
+def widen_schema(schema: Any, other: Any) -> Any:
+    """``schema`` widened to hold the columns of ``other`` (same names, same order)."""
+    import pyarrow as pa
+
+    if schema.equals(other):
+        return schema
+    if schema.names != other.names:
+        raise ValueError(f"batch columns {other.names} do not match {schema.names}")
+    fields = []
+    for field, new in zip(schema, other):
+        wider = widen_type(field.type, new.type)
+        if wider is None:
+            raise ValueError(
+                f"column {field.name!r} changed type from {field.type} to {new.type} "
+                "between batches"
+            )
+        fields.append(field.with_type(wider))
+    return pa.schema(fields)
+
+
+class WideningWriter:
+    """Write Arrow tables to one file, widening its schema when a later table needs it.
+
+    ``open_writer(path, schema)`` returns a writer with ``write_table`` and ``close``;
+    ``read_batches(path)`` yields the record batches of a closed file. Widening a file
+    that already has rows rewrites them once, batch by batch, into the wider schema.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        open_writer: Callable[[Path, Any], Any],
+        read_batches: Callable[[Path], Iterator[Any]],
+    ) -> None:
+        self.path = path
+        self.open_writer = open_writer
+        self.read_batches = read_batches
+        self.schema: Any = None
+        self._writer: Any = None
+
+    def write(self, table: Any) -> None:
+        if self._writer is None:
+            self.schema = table.schema
+            self._writer = self.open_writer(self.path, self.schema)
+        elif not table.schema.equals(self.schema):
+            wider = widen_schema(self.schema, table.schema)
+            if not wider.equals(self.schema):
+                self._rewrite(wider)
+            table = table.cast(self.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _rewrite(self, schema: Any) -> None:
+        import pyarrow as pa
+
+        self._writer.close()
+        self._writer = None
+        written = self.path.with_name(self.path.name + ".shiftd-widen")
+        os.replace(self.path, written)
+        try:
+            self._writer = self.open_writer(self.path, schema)
+            for record_batch in self.read_batches(written):
+                self._writer.write_table(pa.Table.from_batches([record_batch]).cast(schema))
+        finally:
+            written.unlink()
+        self.schema = schema
@@ -9,6 +9,12 @@ def test(c):
     c.run("uv run python -m tasks.test", pty=True)
 
 
+@task
+def bench(c, name="columnar"):
+    """Run a benchmark from tasks/bench_*.py (e.g. invoke bench --name columnar)."""
+    c.run(f"uv run python -m tasks.bench_{name}", pty=True)
+
+
 @task
 def lint(c):
     """Run ruff check on shiftd and tasks."""
@@ -0,0 +1,92 @@
+"""Columnar vs dict-per-row TableModel: memory and throughput.
+
+Execute via: uv run python -m tasks.bench_columnar [ROWS]
+
+Peak memory is the Python heap as seen by tracemalloc; Arrow buffers are not included.
+"""
+
+import csv
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from shiftd import Engine, TableModel
+
+COLUMNS = ["id", "name", "city", "score", "ratio", "active"]
+
+
+def _write_csv(path: Path, n: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(COLUMNS)
+        for i in range(n):
+            w.writerow([i, f"user{i}", f"city{i % 100}", i % 1000, i / 7, i % 2 == 0])
+
+
+def _dict_rows(path: Path) -> TableModel:
+    """The previous model: csv.DictReader and one dict per row."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return TableModel(columns=list(rows[0]), rows=rows)
+
+
+def _measure(fn: Callable[[], Any]) -> tuple[Any, float, float]:
+    """Time one untraced run, then take the Python heap peak of a second, traced run."""
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def _typed(n: int) -> tuple[list[dict[str, Any]], dict[str, list[Any]]]:
+    rows = [
+        {"id": i, "name": f"user{i}", "city": f"city{i % 100}", "score": i % 1000}
+        | {"ratio": i / 7, "active": i % 2 == 0}
+        for i in range(n)
+    ]
+    return rows, {c: [r[c] for r in rows] for c in COLUMNS}
+
+
+def main(n: int) -> None:
+    engine = Engine()
+    print(f"{n:,} rows x {len(COLUMNS)} columns\n")
+    print(f"{'case':<34}{'time (s)':>10}{'peak (MiB)':>12}")
+
+    def report(name: str, elapsed: float, peak: float) -> None:
+        print(f"{name:<34}{elapsed:>10.2f}{peak:>12.1f}")
+
+    with tempfile.TemporaryDirectory() as d:
+        src = Path(d) / "in.csv"
+        _write_csv(src, n)
+
+        dict_table, t, m = _measure(lambda: _dict_rows(src))
+        report("parse csv, dict per row", t, m)
+        col_table, t, m = _measure(lambda: engine.parse(src))
+        report("parse csv, columnar", t, m)
+
+        for fmt in ("csv", "parquet"):
+            _, t, m = _measure(lambda: engine.serialize(dict_table, Path(d) / f"a.{fmt}"))
+            report(f"write {fmt}, dict per row", t, m)
+            _, t, m = _measure(lambda: engine.serialize(col_table, Path(d) / f"b.{fmt}"))
+            report(f"write {fmt}, columnar", t, m)
+
+    rows, data = _typed(n)
+    _, t, m = _measure(lambda: TableModel(columns=COLUMNS, rows=[dict(r) for r in rows]))
+    report("hold typed rows, dict per row", t, m)
+    _, t, m = _measure(lambda: TableModel.from_columns(COLUMNS, {c: list(data[c]) for c in data}))
+    report("hold typed rows, columnar", t, m)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
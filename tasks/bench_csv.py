@@ -0,0 +1,44 @@
+"""CSV reading: sequential vs parallel byte ranges vs pyarrow.csv.
+
+Execute via: uv run python -m tasks.bench_csv [ROWS]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shiftd.parsers.csv_parser import CSVParser
+
+COLUMNS = ["id", "name", "city", "note", "ratio"]
+
+
+def _write_csv(path: Path, n: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(COLUMNS)
+        for i in range(n):
+            w.writerow([i, f"user{i}", f"city{i % 100}", f'said "hi"\nat {i}', i / 7])
+
+
+def main(n: int) -> None:
+    cpus = os.process_cpu_count() or 1
+    with tempfile.TemporaryDirectory() as d:
+        src = Path(d) / "in.csv"
+        _write_csv(src, n)
+        print(f"{n:,} rows, {src.stat().st_size / 2**20:.0f} MiB, {cpus} CPU(s)\n")
+        print(f"{'reader':<28}{'time (s)':>10}")
+        cases = {
+            f"python, {w} worker(s)": CSVParser(engine="python", workers=w) for w in {1, 2, cpus}
+        }
+        cases["pyarrow.csv"] = CSVParser(engine="arrow")
+        for name, parser in cases.items():
+            start = time.perf_counter()
+            parser.parse(src)
+            print(f"{name:<28}{time.perf_counter() - start:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,38 @@
+"""JSONL reading: one worker vs parallel byte ranges.
+
+Execute via: uv run python -m tasks.bench_jsonl [ROWS]
+(about 10 million rows make the 1 GB file this was tuned on)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shiftd.parsers.jsonl_parser import JSONLParser
+
+
+def _write_jsonl(path: Path, n: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            row = {"id": i, "name": f"user{i}", "city": f"city{i % 100}", "tags": [i % 3, "x"]}
+            f.write(json.dumps({**row, "ratio": i / 7, "active": i % 2 == 0}) + "\n")
+
+
+def main(n: int) -> None:
+    cpus = os.process_cpu_count() or 1
+    with tempfile.TemporaryDirectory() as d:
+        src = Path(d) / "in.jsonl"
+        _write_jsonl(src, n)
+        print(f"{n:,} rows, {src.stat().st_size / 2**20:.0f} MiB, {cpus} CPU(s)\n")
+        print(f"{'reader':<28}{'time (s)':>10}")
+        for w in sorted({1, 2, cpus}):
+            start = time.perf_counter()
+            JSONLParser(workers=w).parse(src)
+            print(f"{f'{w} worker(s)':<28}{time.perf_counter() - start:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,88 @@
+"""Record rows vs dict rows: resident memory and construction speed for a database extract.
+
+Execute via: uv run python -m tasks.bench_records [ROWS]
+"""
+
+import gc
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from shiftd import Engine
+from shiftd.record import record_type
+
+COLUMNS = ["id", "name", "city", "score", "ratio", "active"]
+
+
+def _make_db(path: Path, n: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE data ({', '.join(COLUMNS)})")
+    conn.executemany(
+        "INSERT INTO data VALUES (?, ?, ?, ?, ?, ?)",
+        ((i, f"user{i}", f"city{i % 100}", i % 1000, i / 7, i % 2) for i in range(n)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _fetch(path: Path, build: Callable[[sqlite3.Cursor], list[Any]]) -> list[Any]:
+    conn = sqlite3.connect(path)
+    try:
+        return build(conn.execute("SELECT * FROM data"))
+    finally:
+        conn.close()
+
+
+def _dict_rows(path: Path) -> list[Any]:
+    """The previous SQLiteParser path: sqlite3.Row, then dict(r) per row."""
+
+    def build(cur: sqlite3.Cursor) -> list[Any]:
+        cur.row_factory = sqlite3.Row
+        return [dict(r) for r in cur.fetchall()]
+
+    return _fetch(path, build)
+
+
+def _record_rows(path: Path) -> list[Any]:
+    row_type = record_type(COLUMNS)
+    return _fetch(path, lambda cur: list(map(row_type, cur.fetchall())))
+
+
+def _measure(fn: Callable[[], Any]) -> tuple[float, float]:
+    """Time one untraced run, then take the Python heap retained by a second, traced run."""
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, held / 2**20
+
+
+def main(n: int) -> None:
+    print(f"{n:,} rows x {len(COLUMNS)} columns from SQLite\n")
+    print(f"{'rows held as':<26}{'time (s)':>10}{'held (MiB)':>12}")
+    with tempfile.TemporaryDirectory() as d:
+        db = Path(d) / "bench.db"
+        _make_db(db, n)
+        cases: dict[str, Callable[[], Any]] = {
+            "dict per row": lambda: _dict_rows(db),
+            "Record per row": lambda: _record_rows(db),
+            "columnar (SQLiteParser)": lambda: Engine().parse(db),
+        }
+        for name, fn in cases.items():
+            elapsed, held = _measure(fn)
+            print(f"{name:<26}{elapsed:>10.2f}{held:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,52 @@
+"""SQLite bulk writing: rows/sec for the SQLite serializer, and read back.
+
+Execute via: uv run python -m tasks.bench_sqlite [ROWS]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shiftd.parsers.sqlite_parser import SQLiteParser
+from shiftd.schema import TableModel
+from shiftd.serializers.sqlite_serializer import SQLiteSerializer
+
+
+def _table(n: int) -> TableModel:
+    return TableModel.from_columns(
+        ["id", "name", "city", "ratio", "active"],
+        {
+            "id": list(range(n)),
+            "name": [f"user{i}" for i in range(n)],
+            "city": [f"city{i % 100}" for i in range(n)],
+            "ratio": [i / 7 for i in range(n)],
+            "active": [i % 2 == 0 for i in range(n)],
+        },
+    )
+
+
+def main(n: int) -> None:
+    table = _table(n)
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "out.db"
+        print(f"{n:,} rows\n")
+        print(f"{'step':<28}{'time (s)':>10}{'rows/s':>14}")
+        cases = {
+            "write": SQLiteSerializer(),
+            "write, index on city": SQLiteSerializer(indexes=["city"]),
+        }
+        for name, serializer in cases.items():
+            path.unlink(missing_ok=True)
+            start = time.perf_counter()
+            serializer.serialize(table, path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<28}{elapsed:>10.2f}{n / elapsed:>14,.0f}")
+        start = time.perf_counter()
+        SQLiteParser().parse(path)
+        elapsed = time.perf_counter() - start
+        print(f"{'read':<28}{elapsed:>10.2f}{n / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,12 +1,19 @@
 """Tests for shiftd. Execute via: uv run python -m tasks.test (or invoke test)."""
 
+import json
+import pickle
 import sys
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
 from pydantic import ValidationError
-from shiftd import Engine, TableModel
+from shiftd import BatchError, Engine, TableModel
 from shiftd.engine import infer_format
+from shiftd.record import Record, record_type
+from shiftd.schema import validation_level
 
 
 def _assert(cond: bool, msg: str = "Assertion failed") -> None:
@@ -111,6 +118,23 @@ def test_convert_with_explicit_to() -> None:
         _assert("1" in (tmp / "data.json").read_text())
 
 
+def test_convert_streaming() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        lines = "".join(f"{i},n{i}\n" for i in range(10))
+        (tmp / "data.csv").write_text("id,name\n" + lines, encoding="utf-8")
+        engine = Engine()
+        batches = list(engine.iter_batches(tmp / "data.csv", batch_size=4))
+        _assert([len(b.rows) for b in batches] == [4, 4, 2], "unexpected batch sizes")
+        _assert(TableModel.concat(batches).rows == engine.parse(tmp / "data.csv").rows)
+        for fmt in ("jsonl", "sqlite", "json"):  # json has no batch writer: whole-table fallback
+            engine.convert(tmp / "data.csv", tmp / f"s.{fmt}", to=fmt, streaming=True, batch_size=3)
+            engine.convert(tmp / "data.csv", tmp / f"w.{fmt}", to=fmt)
+            _assert((tmp / f"s.{fmt}").read_bytes() == (tmp / f"w.{fmt}").read_bytes(), fmt)
+        engine.convert(tmp / "data.csv", tmp / "s.csv", streaming=True, batch_size=3)
+        _assert((tmp / "s.csv").read_text() == (tmp / "data.csv").read_text())
+
+
 # -- Engine.batch -----------------------------------------------------------
 
 
@@ -125,6 +149,50 @@ def test_batch() -> None:
         _assert((tmp / "out" / "b.json").exists(), "b.json not created")
 
 
+def test_batch_parallel() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        sources = []
+        for i in range(4):
+            (tmp / f"f{i}.csv").write_text("x\n" + f"{i}\n" * (i * 100 + 1), encoding="utf-8")
+            sources.append(tmp / f"f{i}.csv")
+        for executor in ("process", "thread"):
+            out = tmp / executor
+            results = Engine().batch(sources, out, to="jsonl", workers=3, executor=executor)
+            _assert(results == [out / f"f{i}.jsonl" for i in range(4)], "results out of order")
+            _assert(all(p.exists() for p in results), f"{executor}: outputs missing")
+        (tmp / "bad.json").write_text("{not json", encoding="utf-8")
+        (tmp / "worse.json").write_text("[1, 2", encoding="utf-8")
+        try:
+            Engine().batch(
+                [sources[0], tmp / "bad.json", sources[1], tmp / "worse.json"],
+                tmp / "mixed",
+                to="csv",
+                workers=2,
+            )
+            _assert(False, "Expected BatchError")
+        except BatchError as e:
+            _assert(list(e.errors) == [tmp / "bad.json", tmp / "worse.json"], str(e))
+            _assert(e.results[1] is None and e.results[2] == tmp / "mixed" / "f1.csv")
+            _assert((tmp / "mixed" / "f1.csv").exists(), "good file after a bad one not converted")
+        # A single failure keeps its own exception type, serial or parallel.
+        for workers in (1, 2):
+            out = tmp / f"single{workers}"
+            try:
+                Engine().batch([tmp / "bad.json", sources[1]], out, to="csv", workers=workers)
+                _assert(False, "Expected ValueError")
+            except BatchError as e:
+                _assert(False, f"single failure wrapped in BatchError: {e}")
+            except ValueError as e:
+                _assert(any("bad.json" in note for note in e.__notes__), str(e.__notes__))
+            _assert((out / "f1.csv").exists(), "good file after a bad one not converted")
+        try:
+            Engine().batch([tmp / "missing.csv"], tmp / "out", to="json")
+            _assert(False, "Expected FileNotFoundError")
+        except FileNotFoundError:
+            pass
+
+
 # -- Engine.parse / serialize -----------------------------------------------
 
 
@@ -232,6 +300,1119 @@ def test_table_model_duplicate_columns() -> None:
         pass
 
 
+def test_table_model_validation_levels() -> None:
+    bad = [{"a": i} for i in range(5000)]
+    bad.insert(4001, {"b": 1})
+    with validation_level("trusted"):
+        TableModel(columns=["a"], rows=bad)
+    with validation_level("sample"):
+        TableModel(columns=["a"], rows=bad)  # the odd row falls between samples
+        try:
+            TableModel(columns=["a"], rows=[{"b": 1}, *bad])
+            _assert(False, "Expected ValidationError for a sampled row")
+        except ValidationError:
+            pass
+    try:
+        TableModel(columns=["a"], rows=bad)
+        _assert(False, "Expected ValidationError at full validation")
+    except ValidationError as e:
+        _assert("row 4001" in str(e) and "extra: ['b']" in str(e), str(e))
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "in.jsonl").write_text('{"a": 1}\n{"a": 2, "b": 3}\n', encoding="utf-8")
+        _assert(len(Engine().parse(tmp / "in.jsonl", validation="trusted").rows) == 2)
+        try:
+            Engine().parse(tmp / "in.jsonl")
+            _assert(False, "Expected ValidationError")
+        except ValidationError:
+            pass
+
+
+def test_table_model_from_columns() -> None:
+    t = TableModel.from_columns(["a", "b"], {"a": [1, 2], "b": ["x", None]})
+    _assert(t.is_columnar, "expected columnar storage")
+    _assert(t.rows == [{"a": 1, "b": "x"}, {"a": 2, "b": None}])
+    _assert(t.rows[1]["b"] is None and len(t.rows) == 2)
+    _assert(list(t.iter_tuples()) == [(1, "x"), (2, None)])
+    _assert(t.column("a").typecode == "q", "int column not packed")  # type: ignore[attr-defined]
+    try:
+        TableModel.from_columns(["a", "b"], {"a": [1, 2], "b": [3]})
+        _assert(False, "Expected ValueError for ragged columns")
+    except ValueError:
+        pass
+
+
+def test_columnar_behaviour() -> None:
+    from array import array
+
+    from shiftd.columnar import ColumnarRows, extend_column, pack_column
+
+    # from_columns / to_columns round trip, with int and float columns packed.
+    data = {"i": [1, -(2**63), 2**63 - 1], "f": [0.5, 1.0, -2.0], "s": ["a", None, "c"]}
+    t = TableModel.from_columns(["i", "f", "s"], data)
+    _assert({c: list(v) for c, v in t.to_columns().items()} == data, "round trip")
+    _assert(TableModel.from_columns(t.columns, t.to_columns()).rows == t.rows)
+    typecodes = [getattr(v, "typecode", None) for v in t.to_columns().values()]
+    _assert(typecodes == ["q", "d", None], f"{typecodes}")
+    _assert(not isinstance(pack_column([1, 2**63]), array), "int beyond int64 must stay a list")
+    _assert(not isinstance(pack_column([1, 2.5]), array), "mixed int/float must stay a list")
+    _assert(not isinstance(pack_column([1, True]), array), "bool must not pack as int")
+    _assert(extend_column(array("q", [1]), [2.5]) == [1, 2.5], "extending widens to a list")
+    t2 = TableModel.from_tuples(["a", "b"], iter([(1, "x"), (2, "y")]))
+    _assert(t2.is_columnar and t2.rows == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    try:
+        TableModel.from_tuples(["a", "b"], [(1, "x"), (2,)])
+        _assert(False, "Expected ValueError for a short tuple")
+    except ValueError as e:
+        _assert("row 1" in str(e), str(e))
+
+    # Indexing and slicing read like a list of dicts.
+    rows = t.rows
+    _assert(isinstance(rows, ColumnarRows) and len(rows) == 3)
+    _assert(rows[-1] == {"i": 2**63 - 1, "f": -2.0, "s": "c"} and rows[0]["f"] == 0.5)
+    _assert(isinstance(rows[1:], ColumnarRows) and rows[1:] == [rows[1], rows[2]])
+    _assert(rows[::-1] == list(reversed(list(rows))) and rows.index(rows[2]) == 2)
+    try:
+        rows[3]
+        _assert(False, "Expected IndexError")
+    except IndexError:
+        pass
+
+    # Rows are read-only views; buffers are shared, so changes to them show in the rows.
+    try:
+        rows[0] = {"i": 0, "f": 0.0, "s": None}  # type: ignore[index]
+        _assert(False, "rows must be read-only")
+    except TypeError:
+        pass
+    try:
+        rows[0]["s"] = "z"  # type: ignore[index]
+        _assert(False, "a row must be read-only")
+    except TypeError:
+        pass
+    t.column("s")[1] = "b"  # type: ignore[index]
+    _assert(rows[1]["s"] == "b", "buffer not shared")
+
+    # Serializers write the same bytes for dict-backed and columnar tables.
+    engine = Engine()
+    plain = TableModel(columns=["i", "f", "s"], rows=[dict(r) for r in rows])
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        for fmt in ("csv", "tsv", "json", "jsonl", "xml", "yaml", "html", "md", "toon"):
+            engine.serialize(plain, tmp / f"dict.{fmt}")
+            engine.serialize(t, tmp / f"col.{fmt}")
+            same = (tmp / f"dict.{fmt}").read_bytes() == (tmp / f"col.{fmt}").read_bytes()
+            _assert(same, f"{fmt}: columnar output differs")
+
+
+def test_record_rows() -> None:
+    row_type = record_type(["a", "b"])
+    _assert(row_type is record_type(("a", "b")), "layouts should be interned")
+    r = row_type((1, None))
+    _assert(r["a"] == 1 and r.get("b") is None and r.get("c", 0) == 0)
+    _assert(r == {"a": 1, "b": None} and {"a": 1, "b": None} == r and list(r) == ["a", "b"])
+    _assert(pickle.loads(pickle.dumps(r)) == r, "record pickling")
+    t = TableModel(columns=["b", "a"], rows=[r, row_type((2, "x"))])
+    _assert(list(t.iter_tuples()) == [(None, 1), ("x", 2)])
+    _assert(json.loads(json.dumps(list(t.iter_dicts())))[1] == {"a": 2, "b": "x"})
+    try:
+        TableModel(columns=["a"], rows=[r])
+        _assert(False, "Expected ValidationError for record layout mismatch")
+    except ValidationError:
+        pass
+    columnar = TableModel.from_columns(["a"], {"a": [1, 2]})
+    _assert(all(isinstance(row, Record) for row in columnar.rows))
+
+
+def test_csv_parse_columnar() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "in.csv").write_text("a,b\n1,2\n\n3\n", encoding="utf-8")
+        table = Engine().parse(tmp / "in.csv")
+        _assert(table.is_columnar, "CSV should parse into columns")
+        _assert(table.rows == [{"a": "1", "b": "2"}, {"a": "3", "b": None}])
+        Engine().serialize(table, tmp / "out.csv")
+        _assert((tmp / "out.csv").read_text() == "a,b\n1,2\n3,\n")
+
+
+def test_arrow_native_path() -> None:
+    import pyarrow as pa
+    from shiftd.parsers.csv_parser import CSVParser
+
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "in.csv").write_text('id,note\n1,"a\nb"\n2,\n', encoding="utf-8")
+        table = Engine().parse(tmp / "in.csv")
+        _assert(table.is_arrow, "CSV should parse through pyarrow.csv when available")
+        _assert(table.rows == [{"id": "1", "note": "a\nb"}, {"id": "2", "note": ""}])
+        python = CSVParser(engine="python").parse(tmp / "in.csv")
+        _assert(not python.is_arrow and python.rows == table.rows, "engines disagree")
+
+        Engine().convert(tmp / "in.csv", tmp / "a.parquet")
+        parquet = Engine().parse(tmp / "a.parquet")
+        _assert(parquet.is_arrow and parquet.to_arrow().column("id").type == pa.string())
+        Engine().serialize(parquet, tmp / "b.arrow")
+        arrow = Engine().parse(tmp / "b.arrow")
+        _assert(arrow.to_arrow().equals(parquet.to_arrow()), "parquet -> arrow changed data")
+        _assert(arrow.rows[-1] == {"id": "2", "note": ""} and len(arrow.rows[1:]) == 1)
+
+        batches = list(Engine().iter_batches(tmp / "b.arrow", batch_size=1))
+        whole = TableModel.concat(batches)
+        _assert(whole.is_arrow and whole.to_arrow().equals(arrow.to_arrow()), "arrow concat")
+        mixed = TableModel.concat(
+            [batches[0], TableModel.from_columns(["id", "note"], {"id": ["3"], "note": ["c"]})]
+        )
+        _assert(list(mixed.iter_tuples()) == [("1", "a\nb"), ("3", "c")])
+
+
+def test_csv_parallel() -> None:
+    from shiftd.parsers.csv_parser import CSVParser
+    from shiftd.parsers.tsv_parser import TSVParser
+
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        body = "".join(f'{i},"say ""hi""\nline {i}",{"" if i % 7 else "x"}\n' for i in range(300))
+        (tmp / "in.csv").write_text("id,text,flag\n" + body + "\n300,short\n", encoding="utf-8")
+        expected = CSVParser(engine="python", workers=1).parse(tmp / "in.csv")
+        _assert(expected.rows[-1] == {"id": "300", "text": "short", "flag": None})
+        for executor in ("thread", "process"):
+            parser = CSVParser(engine="python", workers=3, chunk_bytes=64, executor=executor)  # type: ignore[arg-type]
+            _assert(parser.parse(tmp / "in.csv").rows == expected.rows, f"{executor} differs")
+        batches = list(
+            CSVParser(engine="python", workers=2, chunk_bytes=500).iter_batches(tmp / "in.csv", 40)
+        )
+        _assert(max(len(b.rows) for b in batches) <= 40)
+        _assert(TableModel.concat(batches).rows == expected.rows, "batches out of order")
+
+        (tmp / "in.tsv").write_text("a\tb\n1\t2\n3\t4\t5\n", encoding="utf-8")
+        try:
+            TSVParser(engine="python", workers=2, chunk_bytes=1, executor="thread").parse(
+                tmp / "in.tsv"
+            )
+            _assert(False, "Expected ValueError for a long row")
+        except ValueError as e:
+            _assert(str(e).startswith("row 1:"), f"wrong row in error: {e}")
+
+
+def test_infer_types() -> None:
+    from shiftd.infer import coerce_value, infer_column
+    from shiftd.parsers.csv_parser import CSVParser
+
+    cells = ["1", "2.5", "true", "x", "", "NULL", "007", "1e3"]
+    nulls = frozenset({"", "null"})
+    _assert(list(infer_column(cells, nulls)) == [coerce_value(c, nulls) for c in cells])
+    _assert(infer_column(["1", "2"]).typecode == "q", "int column not packed")  # type: ignore[attr-defined]
+    _assert(list(infer_column(["1.5", None, "x"])) == [1.5, None, "x"])
+    _assert(infer_column(["False", "true"]) == [False, True])
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "in.csv").write_text("a,b,c\n1,x,true\n2,3.5,false\n", encoding="utf-8")
+        t = CSVParser(engine="python", infer_types=True).parse(tmp / "in.csv")
+        _assert(t.rows == [{"a": 1, "b": "x", "c": True}, {"a": 2, "b": 3.5, "c": False}])
+        t = CSVParser(engine="arrow", infer_types=True).parse(tmp / "in.csv")
+        _assert(t.rows[1] == {"a": 2, "b": "3.5", "c": False}, "pyarrow keeps mixed columns text")
+        (tmp / "t.md").write_text("| a | b |\n|---|---|\n| 1 | x |\n| 2 |\n", encoding="utf-8")
+        _assert(Engine().parse(tmp / "t.md").rows == [{"a": 1, "b": "x"}, {"a": 2, "b": None}])
+
+
+def test_json_streaming() -> None:
+    import io
+
+    from shiftd.parsers.json_parser import JSONParser, _JSONStream
+
+    rows = [{"id": i, "tags": [i, "]"], "note": None if i % 3 else "a,b"} for i in range(25)]
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "flat.json").write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        batches = list(Engine().iter_batches(tmp / "flat.json", batch_size=10))
+        _assert([len(b.rows) for b in batches] == [10, 10, 5], "JSON should stream in batches")
+        _assert(TableModel.concat(batches).rows == rows)
+        nested = {"meta": {"items": "no"}, "data": {"total": 25, "items": rows}}
+        (tmp / "nested.json").write_text(json.dumps(nested), encoding="utf-8")
+        _assert(JSONParser(json_path="data.items").parse(tmp / "nested.json").rows == rows)
+        try:
+            JSONParser(json_path="data.rows").parse(tmp / "nested.json")
+            _assert(False, "Expected ValueError for a missing JSON path")
+        except ValueError as e:
+            _assert("data.rows" in str(e))
+        Engine().convert(tmp / "flat.json", tmp / "out.jsonl", streaming=True, batch_size=4)
+        _assert(len((tmp / "out.jsonl").read_text().splitlines()) == 25)
+        # An empty file is invalid JSON whether it is parsed whole or streamed.
+        (tmp / "empty.json").write_text(" \n", encoding="utf-8")
+        for read in (
+            lambda: JSONParser().parse(tmp / "empty.json"),
+            lambda: list(JSONParser().iter_batches(tmp / "empty.json")),
+        ):
+            try:
+                read()
+                _assert(False, "Expected ValueError for an empty JSON file")
+            except ValueError:
+                pass
+
+    # A syntax error fails at once instead of reading (and buffering) the rest of the file.
+    f = io.StringIO('[{"a": 1}, {"a": 2 "b"}, ' + '{"a": 3}, ' * 10_000 + "]")
+    try:
+        list(_JSONStream(f, json.JSONDecoder(), read_chars=64).items())
+        _assert(False, "Expected ValueError for invalid JSON")
+    except ValueError as e:
+        _assert("delimiter" in str(e), str(e))
+    _assert(f.tell() <= 128, f"read {f.tell()} chars before failing")
+    # Values cut by a read boundary still decode.
+    text = json.dumps([{"s": "x" * 50 + "\u00e9", "t": True, "n": -12345.5}] * 20)
+    got = list(_JSONStream(io.StringIO(text), json.JSONDecoder(), read_chars=7).items())
+    _assert(got == json.loads(text), "cut values")
+
+
+def test_jsonl_parallel() -> None:
+    from shiftd.parsers.jsonl_parser import JSONLParser
+
+    rows = [{"id": i, "v": [i, "\n"] if i % 4 else None, "s": "é"} for i in range(200)]
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        lines = [json.dumps(r) + ("\n" if i % 50 == 0 else "") for i, r in enumerate(rows)]
+        (tmp / "in.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        _assert(JSONLParser(workers=1).parse(tmp / "in.jsonl").rows == rows)
+        for executor in ("thread", "process"):
+            parser = JSONLParser(workers=3, chunk_bytes=64, executor=executor)  # type: ignore[arg-type]
+            _assert(parser.parse(tmp / "in.jsonl").rows == rows, f"{executor} differs")
+        batches = list(JSONLParser(workers=2, chunk_bytes=500).iter_batches(tmp / "in.jsonl", 30))
+        _assert(max(len(b.rows) for b in batches) <= 30)
+        _assert(TableModel.concat(batches).rows == rows, "batches out of order")
+
+        (tmp / "bad.jsonl").write_text('{"a": 1}\n\n{"a": 2}\n{"b": 3}\n', encoding="utf-8")
+        try:
+            JSONLParser(workers=2, chunk_bytes=1, executor="thread").parse(tmp / "bad.jsonl")
+            _assert(False, "Expected ValueError for a row with other keys")
+        except ValueError as e:
+            _assert(str(e).startswith("row 2:"), f"wrong row in error: {e}")
+        (tmp / "broken.jsonl").write_text('{"a": 1}\n{"a": 2}\n{"a": \n', encoding="utf-8")
+        (tmp / "list.jsonl").write_text('["a", "b"]\n["c", "d"]\n', encoding="utf-8")
+        for name, row in (("broken.jsonl", 2), ("list.jsonl", 0)):
+            try:
+                JSONLParser(workers=2, chunk_bytes=1, executor="thread").parse(tmp / name)
+                _assert(False, f"Expected ValueError for {name}")
+            except ValueError as e:
+                _assert(str(e).startswith(f"row {row}:"), f"{name}: wrong row in error: {e}")
+
+
+def test_xml_streaming() -> None:
+    from shiftd.parsers.xml_parser import XMLParser
+
+    records = "".join(
+        f'<record id="{i}"><name>n{i}</name><v>{i / 2}</v></record>' for i in range(25)
+    )
+    feed = f"<feed><meta><source>x</source></meta><records>{records}</records></feed>"
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "feed.xml").write_text(feed, encoding="utf-8")
+        batches = list(XMLParser(row_tag="record").iter_batches(tmp / "feed.xml", 10))
+        _assert([len(b.rows) for b in batches] == [10, 10, 5], "XML should stream in batches")
+        rows = TableModel.concat(batches).rows
+        _assert(rows[3] == {"id": 3, "name": "n3", "v": 1.5}, f"wrong record: {rows[3]}")
+        (tmp / "flat.xml").write_text(f"<records>{records}</records>", encoding="utf-8")
+        _assert(XMLParser().parse(tmp / "flat.xml").rows == rows, "rows are the root's children")
+        for body in ("", "<r/><r/><r/>"):
+            (tmp / "empty.xml").write_text(f"<records>{body}</records>", encoding="utf-8")
+            parsed = XMLParser().parse(tmp / "empty.xml")
+            streamed = TableModel.concat(XMLParser().iter_batches(tmp / "empty.xml"))
+            _assert(parsed.columns == [] and len(parsed.rows) == 0, f"{body!r}: {parsed}")
+            _assert(len(streamed.rows) == 0, f"{body!r}: {streamed}")
+
+
+def test_xml_serializer_streaming() -> None:
+    from shiftd.serializers.xml_serializer import XMLSerializer
+
+    rows = [{"a": "x<&>", "b": {"c": 1, "d": {}}}, {"a": None, "b": None}, {"a": "", "b": 2}]
+    table = TableModel(columns=["a", "b"], rows=rows)
+    expected = (
+        "<?xml version='1.0' encoding='utf-8'?>\n<root>\n  <row>\n    <a>x&lt;&amp;&gt;</a>"
+        "\n    <b>\n      <c>1</c>\n      <d />\n    </b>\n  </row>\n  <row />"
+        "\n  <row>\n    <a />\n    <b>2</b>\n  </row>\n</root>"
+    )
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        XMLSerializer().serialize(table, tmp / "one.xml")
+        _assert((tmp / "one.xml").read_text(encoding="utf-8") == expected)
+        parts = [
+            TableModel(columns=["a", "b"], rows=rows[:1]),
+            TableModel(columns=["a", "b"], rows=rows[1:]),
+        ]
+        XMLSerializer().write_batches(parts, tmp / "batches.xml")
+        _assert((tmp / "batches.xml").read_text(encoding="utf-8") == expected, "batches differ")
+        XMLSerializer().write_batches([], tmp / "empty.xml")
+        _assert((tmp / "empty.xml").read_text().endswith("\n<root />"))
+
+
+def test_html_tables() -> None:
+    from shiftd.parsers.html_parser import HTMLParser
+
+    page = (
+        '<table id="people"><thead><tr><th rowspan="2">id</th><th colspan="2">name</th></tr>'
+        "<tr><th>first<th>last</tr></thead><tbody>"
+        '<tr><td rowspan="2">1</td><td>Ada</td><td>L</td></tr><tr><td>Bob</td><td>M</td></tr>'
+        '<tr><td>3</td><td colspan="2">n/a</td></tr></tbody></table>'
+        "<table><tr><th>k</th></tr><tr><td>a<table><tr><td>x</td></tr></table></td></tr></table>"
+    )
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "page.html").write_text(page + "<table><tr><td>", encoding="utf-8")
+        people = HTMLParser().parse(tmp / "page.html")
+        _assert(people.columns == ["id", "name first", "name last"], f"{people.columns}")
+        _assert(people.rows[1] == {"id": 1, "name first": "Bob", "name last": "M"})
+        _assert(people.rows[2] == {"id": 3, "name first": "n/a", "name last": "n/a"})
+        _assert(HTMLParser(table_index=1).parse(tmp / "page.html").rows == [{"k": "a"}])
+        tables = HTMLParser().parse_tables(tmp / "page.html")
+        _assert(list(tables) == ["people", "table_1", "table_2", "table_3"], f"{list(tables)}")
+        _assert(tables["table_2"].columns == [], "a one-row table has no data rows")
+        # A one-row header spanning two columns names both, without duplicates.
+        (tmp / "span.html").write_text(
+            '<table><tr><th colspan="2">Name</th><th>Name_2</th></tr>'
+            "<tr><td>Ada</td><td>L</td><td>x</td></tr></table>",
+            encoding="utf-8",
+        )
+        span = HTMLParser().parse(tmp / "span.html")
+        _assert(span.columns == ["Name", "Name_3", "Name_2"], f"{span.columns}")
+        _assert(span.rows[0] == {"Name": "Ada", "Name_3": "L", "Name_2": "x"})
+
+
+def test_toon_codec() -> None:
+    from shiftd.parsers.toon_parser import TOONParser
+    from shiftd.serializers.toon_serializer import TOONSerializer
+
+    rows = [{"id": 1, "note": 'say "hi", then\nleave'}, {"id": 2, "note": " a\\b "}]
+    nested = "meta:\n  source: x\ndata:\n  users[2]{id,name}:\n    1,Ada\n    2,Bob\n"
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        batches = (TableModel(columns=["id", "note"], rows=[r]) for r in rows)
+        TOONSerializer().write_batches(batches, tmp / "out.toon")
+        _assert((tmp / "out.toon").read_text().count("\n") == 2, "one line per row")
+        _assert(TOONParser().parse(tmp / "out.toon").rows == rows, "TOON round trip")
+        (tmp / "nested.toon").write_text(nested, encoding="utf-8")
+        users = TOONParser(toon_path="data.users").parse(tmp / "nested.toon")
+        _assert(users.rows == [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Bob"}])
+        _assert(TOONParser().parse(tmp / "nested.toon").columns == ["id", "name"])
+        for bad in ("[3]{a}:\n  1\n  2\n", "[1]{a}:\n  1\n  2\n"):
+            (tmp / "bad.toon").write_text(bad, encoding="utf-8")
+            try:
+                TOONParser().parse(tmp / "bad.toon")
+                _assert(False, "Expected ValueError for a wrong row count")
+            except ValueError as e:
+                _assert("declares" in str(e), f"wrong error: {e}")
+
+
+def test_excel_sheets() -> None:
+    from shiftd.parsers.excel_parser import ExcelParser
+    from shiftd.serializers.excel_serializer import ExcelSerializer
+
+    rows = [{"id": i, "name": f"n{i}"} for i in range(5)]
+    batches = (TableModel(columns=["id", "name"], rows=rows[i : i + 2]) for i in range(0, 5, 2))
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        ExcelSerializer(max_rows=3).write_batches(batches, tmp / "out.xlsx")
+        for executor in ("thread", "process"):
+            parser = ExcelParser(workers=2, executor=executor)  # type: ignore[arg-type]
+            sheets = parser.parse_sheets(tmp / "out.xlsx")
+            _assert(list(sheets) == ["Sheet", "Sheet2", "Sheet3"], f"{list(sheets)}")
+            _assert(TableModel.concat(sheets.values()).rows == rows, f"{executor} rows differ")
+        _assert(ExcelParser(sheet="Sheet3").parse(tmp / "out.xlsx").rows == rows[4:])
+        _assert(ExcelParser(sheet=-2).parse(tmp / "out.xlsx").rows == rows[2:4])
+        try:
+            ExcelParser(sheet="nope").parse(tmp / "out.xlsx")
+            _assert(False, "Expected ValueError for an unknown sheet")
+        except ValueError as e:
+            _assert("Sheet2" in str(e))
+
+
+def test_yaml_streams() -> None:
+    from decimal import Decimal
+
+    from shiftd.parsers.yaml_parser import YAMLParser
+    from shiftd.serializers.yaml_serializer import YAMLSerializer
+
+    rows = [{"id": i, "tags": [i, "x"]} for i in range(5)]
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        (tmp / "docs.yaml").write_text("".join(f"---\nid: {i}\n" for i in range(5)))
+        batches = list(YAMLParser().iter_batches(tmp / "docs.yaml", batch_size=2))
+        _assert([len(b.rows) for b in batches] == [2, 2, 1], "documents should stream in batches")
+        parts = [
+            TableModel(columns=["id", "tags"], rows=rows[:3]),
+            TableModel(columns=["id", "tags"], rows=rows[3:]),
+        ]
+        YAMLSerializer().write_batches(parts, tmp / "list.yaml")
+        YAMLSerializer().serialize(
+            TableModel(columns=["id", "tags"], rows=rows), tmp / "whole.yaml"
+        )
+        _assert(
+            (tmp / "list.yaml").read_text() == (tmp / "whole.yaml").read_text(), "batches differ"
+        )
+        YAMLSerializer(documents=True).write_batches(parts, tmp / "stream.yaml")
+        _assert((tmp / "stream.yaml").read_text().count("---") == 5)
+        _assert(YAMLParser().parse(tmp / "stream.yaml").rows == rows, "document stream round trip")
+        odd = TableModel(columns=["p"], rows=[{"p": (1, 2)}, {"p": Decimal("1.5")}])
+        YAMLSerializer().serialize(odd, tmp / "odd.yaml")
+        _assert(YAMLParser().parse(tmp / "odd.yaml").rows == [{"p": [1, 2]}, {"p": 1.5}])
+
+
+def test_sqlite_bulk_write() -> None:
+    import sqlite3
+
+    from shiftd.serializers.sqlite_serializer import SQLiteSerializer
+
+    rows = [
+        {"id": i, "name": f"n{i}", "score": i / 2, "blob": b"x", "mixed": i or "a"}
+        for i in range(5)
+    ]
+    table = TableModel(columns=["id", "name", "score", "blob", "mixed"], rows=rows)
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        SQLiteSerializer(indexes=["name", ("id", "score")]).serialize(table, tmp / "out.db")
+        SQLiteSerializer(table="again").serialize(table, tmp / "out.db")  # existing file: WAL
+        conn = sqlite3.connect(tmp / "out.db")
+        try:
+            ddl = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'data'").fetchone()[0]
+            _assert('"id" INTEGER, "name" TEXT, "score" REAL, "blob" BLOB, "mixed")' in ddl, ddl)
+            indexes = {
+                r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            _assert(indexes == {"idx_data_name", "idx_data_id_score"}, f"{indexes}")
+            _assert(
+                conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete", "mode not restored"
+            )
+        finally:
+            conn.close()
+        _assert(Engine().parse(tmp / "out.db").rows == rows)
+        # A load that fails part way also restores the journal mode.
+        try:
+            SQLiteSerializer(table="failed", indexes=["id", "id"]).serialize(table, tmp / "out.db")
+            _assert(False, "Expected sqlite3.OperationalError for a repeated index")
+        except sqlite3.OperationalError:
+            pass
+        conn = sqlite3.connect(tmp / "out.db")
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            _assert(mode == "delete", f"mode not restored after a failure: {mode}")
+        finally:
+            conn.close()
+
+        # A later batch with other types must not be converted by the declared types.
+        drift = [
+            TableModel.from_columns(["n", "s"], {"n": [1, 2], "s": ["5", "x"]}),
+            TableModel.from_columns(["n", "s"], {"n": [2.0, None], "s": [7, "y"]}),
+        ]
+        SQLiteSerializer(indexes=["n"]).write_batches(drift, tmp / "drift.db")
+        conn = sqlite3.connect(tmp / "drift.db")
+        try:
+            got = conn.execute("SELECT n, typeof(n), s, typeof(s) FROM data").fetchall()
+        finally:
+            conn.close()
+        want = [
+            (1, "integer", "5", "text"),
+            (2, "integer", "x", "text"),
+            (2.0, "real", 7, "integer"),
+            (None, "null", "y", "text"),
+        ]
+        _assert(got == want, f"{got}")
+
+
+def test_sqlite_reader() -> None:
+    import sqlite3
+
+    from shiftd.parsers.sqlite_parser import SQLiteParser
+
+    with tempfile.TemporaryDirectory() as d:
+        db = Path(d) / "in.db"
+        conn = sqlite3.connect(db)
+        conn.execute('CREATE TABLE "my ""t""" (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)')
+        conn.execute("CREATE TABLE other (x REAL)")
+        conn.executemany('INSERT INTO "my ""t""" (name) VALUES (?)', [("a",), ("b",), ("c",)])
+        conn.execute("INSERT INTO other VALUES (1.5)")
+        conn.commit()
+        conn.close()
+
+        _assert(SQLiteParser().parse(db).rows[0] == {"id": 1, "name": "a"}, "first user table")
+        t = SQLiteParser('my "t"', columns=["name"], where="id > ?", params=[1], limit=1).parse(db)
+        _assert(t.columns == ["name"] and t.rows == [{"name": "b"}], f"{t.rows}")
+        t = SQLiteParser(query='SELECT name, id * 10 AS id10 FROM other, "my ""t"""').parse(db)
+        _assert(t.columns == ["name", "id10"] and len(t.rows) == 3, f"{t.columns}")
+        t = SQLiteParser(query="SELECT * FROM other WHERE x > :lo", params={"lo": 1}, limit=5)
+        _assert(t.parse(db).rows == [{"x": 1.5}])
+        tables = SQLiteParser().parse_tables(db)
+        _assert(list(tables) == ['my "t"', "other"], f"{list(tables)}")
+        _assert(len(tables['my "t"'].rows) == 3)
+        batches = list(SQLiteParser("other").iter_batches(db, batch_size=1))
+        _assert(len(batches) == 1)
+        try:
+            SQLiteParser(query="DELETE FROM other").parse(db)
+            raise AssertionError("read-only connection allowed a write")
+        except sqlite3.OperationalError:
+            pass
+        try:
+            SQLiteParser("other", query="SELECT 1")
+            raise AssertionError("table and query together accepted")
+        except ValueError:
+            pass
+
+
+def test_postgres_copy_stream() -> None:
+    import datetime
+
+    from shiftd.serializers.postgres_serializer import _CopyStream, _typed
+
+    table = TableModel(
+        columns=["s", "n", "f", "b", "raw", "when", "gap"],
+        rows=[
+            {
+                "s": "a\tb\\c\nd",
+                "n": 3,
+                "f": float("inf"),
+                "b": True,
+                "raw": b"\x01\xff",
+                "when": datetime.date(2024, 1, 2),
+                "gap": datetime.timedelta(days=1, seconds=5),
+            },
+            {"s": None, "n": None, "f": 0.5, "b": False, "raw": None, "when": None, "gap": None},
+        ],
+    )
+    expected = (
+        "a\\tb\\\\c\\nd\t3\tInfinity\ttrue\t\\\\x01ff\t2024-01-02"
+        "\t1 days 5 seconds 0 microseconds\n"
+        "\\N\t\\N\t0.5\tfalse\t\\N\t\\N\t\\N\n"
+    )
+    stream = _CopyStream([table, table])
+    parts = iter(lambda: stream.read(7), "")
+    _assert("".join(parts) == expected * 2, "COPY text mismatch")
+    _assert(_CopyStream([table]).read() == expected)
+
+    # Column types across batches: tz-aware datetimes, all-null columns, drift and clashes.
+    utc = datetime.datetime(2024, 1, 2, tzinfo=datetime.UTC)
+    drift = [
+        TableModel.from_columns(
+            ["t", "n", "late", "x"], {"t": [utc], "n": [1], "late": [None], "x": [1]}
+        ),
+        TableModel.from_columns(
+            ["t", "n", "late", "x"], {"t": [utc], "n": [2.5], "late": [b"r"], "x": ["a"]}
+        ),
+    ]
+    types = [t for t, _ in _typed(drift)]
+    _assert(types[0] == ("TIMESTAMPTZ", "BIGINT", None, "BIGINT"), f"{types[0]}")
+    _assert(types[1] == ("TIMESTAMPTZ", "DOUBLE PRECISION", "BYTEA", "TEXT"), f"{types[1]}")
+    naive = TableModel(columns=["t"], rows=[{"t": utc}, {"t": utc.replace(tzinfo=None)}])
+    _assert([t for t, _ in _typed([naive])] == [("TEXT",)])
+
+
+@contextmanager
+def _local_postgres() -> Iterator[str | None]:
+    """DSN of a PostgreSQL server for tests: $SHIFTD_TEST_POSTGRES_DSN, or a throwaway
+    cluster started with initdb/pg_ctl from PATH. None when neither is available."""
+    import os
+    import shutil
+    import subprocess
+
+    if dsn := os.environ.get("SHIFTD_TEST_POSTGRES_DSN"):
+        yield dsn
+        return
+    if not (shutil.which("initdb") and shutil.which("pg_ctl")):
+        yield None
+        return
+    with tempfile.TemporaryDirectory() as d:
+        data = Path(d) / "data"
+        run = partial(subprocess.run, check=True, capture_output=True)
+        run(["initdb", "-D", str(data), "-U", "postgres", "--auth=trust"])
+        options = f"-c listen_addresses='' -k {d}"
+        run(["pg_ctl", "-D", str(data), "-o", options, "-w", "start"])
+        try:
+            yield f"host={d} user=postgres dbname=postgres"
+        finally:
+            run(["pg_ctl", "-D", str(data), "-m", "fast", "stop"])
+
+
+def test_postgres_bulk_load() -> None:
+    import datetime
+    import importlib.util
+
+    if importlib.util.find_spec("psycopg2") is None:
+        print("  skipped: psycopg2 not installed")
+        return
+    from shiftd.serializers.postgres_serializer import PostgresSerializer
+
+    with _local_postgres() as dsn:
+        if dsn is None:
+            print("  skipped: no PostgreSQL (set SHIFTD_TEST_POSTGRES_DSN or put initdb on PATH)")
+            return
+        import psycopg2
+
+        rows = [
+            {"id": i, "name": f"n\t{i}", "score": i / 2, "day": datetime.date(2024, 1, i + 1)}
+            for i in range(5)
+        ]
+        table = TableModel(columns=["id", "name", "score", "day"], rows=rows)
+        batches = [
+            TableModel(columns=table.columns, rows=rows[:2]),
+            TableModel(columns=table.columns, rows=rows[2:]),
+        ]
+        PostgresSerializer(table="pg_load").write_batches(batches, dsn)
+        PostgresSerializer(table="pg_swap", staging=True).serialize(table, dsn)
+        PostgresSerializer(table="pg_swap", staging=True).serialize(table, dsn)  # replaces it
+        conn = psycopg2.connect(dsn)
+        try:
+            cur = conn.cursor()
+            for name in ("pg_load", "pg_swap"):
+                cur.execute(f"SELECT * FROM {name} ORDER BY id")
+                _assert([dict(zip(table.columns, r)) for r in cur.fetchall()] == rows, name)
+            cur.execute(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = 'pg_load' ORDER BY ordinal_position"
+            )
+            types = [r[0] for r in cur.fetchall()]
+            _assert(types == ["bigint", "text", "double precision", "date"], f"{types}")
+            cur.execute("SELECT relpersistence FROM pg_class WHERE relname = 'pg_swap'")
+            _assert(cur.fetchone()[0] == "p", "swapped table still unlogged")
+        finally:
+            conn.close()
+
+        utc = datetime.datetime(2024, 1, 2, 3, tzinfo=datetime.UTC)
+        drift = [
+            TableModel.from_columns(["t", "n", "x"], {"t": [utc], "n": [1], "x": [None]}),
+            TableModel.from_columns(["t", "n", "x"], {"t": [None], "n": [2.5], "x": [7]}),
+            TableModel.from_columns(["t", "n", "x"], {"t": [None], "n": [3], "x": ["a"]}),
+        ]
+        PostgresSerializer(table="pg_drift").write_batches(drift, dsn)
+        conn = psycopg2.connect(dsn)
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT * FROM pg_drift")
+            got = cur.fetchall()
+            want = [(utc, 1.0, None), (None, 2.5, "7"), (None, 3.0, "a")]
+            _assert(got == want, f"{got}")
+        finally:
+            conn.close()
+
+
+def test_postgres_reader() -> None:
+    import datetime
+    import importlib.util
+    from decimal import Decimal
+
+    from shiftd.parsers.postgres_parser import _COPY_TYPES, PostgresParser
+
+    decoded = PostgresParser._copy_batch(
+        ["n", "s", "raw"],
+        [_COPY_TYPES[20], None, _COPY_TYPES[17]],
+        ["1\ta\\tb\t\\\\x01ff", "\\N\t\\N\t\\N"],
+    )
+    _assert(
+        decoded.rows
+        == [{"n": 1, "s": "a\tb", "raw": b"\x01\xff"}, {"n": None, "s": None, "raw": None}]
+    )
+    # Values Python's date/time types cannot hold are read as text, not an error.
+    day, clock = _COPY_TYPES[1082], _COPY_TYPES[1083]
+    edge = PostgresParser._copy_batch(
+        ["d", "t"],
+        [day, clock],
+        ["2024-01-02\t24:00:00", "infinity\t12:00:00", "0044-03-15 BC\t\\N"],
+    )
+    _assert(list(edge.column("d")) == [datetime.date(2024, 1, 2), "infinity", "0044-03-15 BC"])
+    _assert(list(edge.column("t")) == ["24:00:00", datetime.time(12), None], f"{edge.rows}")
+    if importlib.util.find_spec("psycopg2") is None:
+        print("  skipped: psycopg2 not installed")
+        return
+    with _local_postgres() as dsn:
+        if dsn is None:
+            print("  skipped: no PostgreSQL (set SHIFTD_TEST_POSTGRES_DSN or put initdb on PATH)")
+            return
+        import psycopg2
+
+        conn = psycopg2.connect(dsn)
+        try:
+            cur = conn.cursor()
+            cur.execute("DROP SCHEMA IF EXISTS sales CASCADE; CREATE SCHEMA sales")
+            cur.execute("CREATE TABLE sales.orders (id int, item text, price numeric, paid bool)")
+            cur.execute(
+                "INSERT INTO sales.orders SELECT i, 'item ' || i, i * 1.5, i % 2 = 0 "
+                "FROM generate_series(1, 2500) AS i"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        for copy in (False, True):
+            parser = PostgresParser(
+                "sales.orders", columns=["id", "paid"], where="id > %s", params=[2000], copy=copy
+            )
+            batches = list(parser.iter_batches(dsn, batch_size=200))
+            _assert([len(b.rows) for b in batches] == [200, 200, 100], f"copy={copy}")
+            _assert(batches[0].rows[0] == {"id": 2001, "paid": False}, f"{batches[0].rows[0]}")
+            t = PostgresParser("sales.orders", where="id = 3", copy=copy).parse(dsn)
+            _assert(t.rows == [{"id": 3, "item": "item 3", "price": Decimal("4.5"), "paid": False}])
+            _assert(len(PostgresParser("sales.orders", limit=7, copy=copy).parse(dsn).rows) == 7)
+
+
+def _mysql_dsn() -> str | None:
+    """DSN of a MySQL/MariaDB server for tests, from $SHIFTD_TEST_MYSQL_DSN (e.g. a CI service)."""
+    import importlib.util
+    import os
+
+    if importlib.util.find_spec("pymysql") is None:
+        print("  skipped: pymysql not installed")
+        return None
+    if dsn := os.environ.get("SHIFTD_TEST_MYSQL_DSN"):
+        return dsn
+    print("  skipped: no MySQL (set SHIFTD_TEST_MYSQL_DSN)")
+    return None
+
+
+def test_mysql_bulk_load() -> None:
+    import datetime
+
+    from shiftd.serializers.mysql_serializer import MySQLSerializer, _load_field, _typed
+
+    fields = [
+        _load_field(v) for v in (None, "a\tb\\", b"\x00\n", True, 1.5, datetime.timedelta(hours=30))
+    ]
+    _assert(
+        fields == [b"\\N", b"a\\tb\\\\", b"\\0\\n", b"1", b"1.5", b"30:00:00.000000"], f"{fields}"
+    )
+    rows = [
+        {
+            "id": i,
+            "name": f"n\t{i}",
+            "score": i / 2,
+            "day": datetime.date(2024, 1, i + 1),
+            "mixed": i or "a",
+        }
+        for i in range(5)
+    ]
+    table = TableModel(columns=list(rows[0]), rows=rows)
+    _assert(list(MySQLSerializer._rows([table], [False] * 4 + [True]))[1][4] == "1")
+    # Column types widen across batches: null takes the first type, int + float is DOUBLE,
+    # anything else TEXT.
+    drift = [
+        TableModel(columns=["n", "late"], rows=[{"n": 1, "late": None}]),
+        TableModel(columns=["n", "late"], rows=[{"n": 2.5, "late": None}]),
+        TableModel(columns=["n", "late"], rows=[{"n": "x", "late": 7}]),
+    ]
+    types = [t for t, _ in _typed(drift)]
+    _assert(types == [("BIGINT", None), ("DOUBLE", None), ("TEXT", "BIGINT")], f"{types}")
+    if (dsn := _mysql_dsn()) is None:
+        return
+    import pymysql
+
+    expected = [{**r, "mixed": str(r["mixed"])} for r in rows]
+    for name, serializer in (
+        ("my_insert", MySQLSerializer(table="my_insert", commit_every=2, packet_bytes=64)),
+        ("my_load", MySQLSerializer(table="my_load", load_data=True)),
+    ):
+        serializer.serialize(table, dsn)
+        conn = pymysql.connect(**MySQLSerializer._parse_dsn(dsn))
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT * FROM {name} ORDER BY id")
+                got = [dict(zip(table.columns, r)) for r in cur.fetchall()]
+                _assert(got == expected, f"{name}: {got}")
+                cur.execute(f"SHOW COLUMNS FROM {name}")
+                types = [r[1].lower() for r in cur.fetchall()]
+                _assert(types[:4] == ["bigint", "text", "double", "date"], f"{types}")
+        finally:
+            conn.close()
+    for load_data in (False, True):
+        MySQLSerializer(table="my_drift", load_data=load_data).write_batches(drift, dsn)
+        conn = pymysql.connect(**MySQLSerializer._parse_dsn(dsn))
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT n, late FROM my_drift")
+                got = sorted(cur.fetchall(), key=lambda r: r[0])
+                _assert(got == [("1", None), ("2.5", None), ("x", 7)], f"{load_data}: {got}")
+        finally:
+            conn.close()
+
+
+def test_mysql_reader() -> None:
+    from shiftd.parsers.mysql_parser import MySQLParser
+
+    parser = MySQLParser("shop.orders", columns=["id", "total"], where="total > %s", params=[5])
+    sql = parser._select("`shop`.`orders`", "`id` >= 1", "`id` < 10")
+    _assert(
+        sql
+        == "SELECT `id`, `total` FROM `shop`.`orders` WHERE (total > %s) AND `id` >= 1 AND `id` < 10",
+        sql,
+    )
+    if (dsn := _mysql_dsn()) is None:
+        return
+    import pymysql
+
+    conn = pymysql.connect(**MySQLParser._parse_dsn(dsn))
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE IF EXISTS my_orders")
+            cur.execute("CREATE TABLE my_orders (id BIGINT PRIMARY KEY, total INT, note TEXT)")
+            cur.executemany(
+                "INSERT INTO my_orders VALUES (%s, %s, %s)",
+                # Sparse keys: a range per key span would be mostly empty queries.
+                [(i * 10**12, i % 10, f"n{i}") for i in range(1, 1001)],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    expected = [{"id": i * 10**12, "total": i % 10} for i in range(1, 1001) if i % 10 > 5]
+    for workers in (1, 3):
+        parser = MySQLParser(
+            "my_orders",
+            columns=["id", "total"],
+            where="total > %s",
+            params=[5],
+            workers=workers,
+            chunk_keys=100,
+        )
+        batches = list(parser.iter_batches(dsn, batch_size=150))
+        _assert(max(len(b.rows) for b in batches) <= 150, f"workers={workers}")
+        _assert(TableModel.concat(batches).rows == expected, f"workers={workers}")
+    _assert(len(MySQLParser("my_orders", limit=3, workers=3).parse(dsn).rows) == 3)
+    # A text key with % in it is bound as a parameter, not pasted into the SQL.
+    codes = [f"c{i:03d}%{'s' if i % 2 else 'd'}" for i in range(50)]
+    conn = pymysql.connect(**MySQLParser._parse_dsn(dsn))
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DROP TABLE IF EXISTS my_codes")
+            cur.execute("CREATE TABLE my_codes (code VARCHAR(16) PRIMARY KEY, n INT)")
+            cur.executemany("INSERT INTO my_codes VALUES (%s, %s)", list(zip(codes, range(50))))
+        conn.commit()
+    finally:
+        conn.close()
+    for where, params in (("n >= %s", [10]), ("n >= %(low)s", {"low": 10})):
+        parser = MySQLParser("my_codes", where=where, params=params, workers=3, chunk_keys=7)
+        got = [r["code"] for r in parser.parse(dsn).rows]
+        _assert(got == codes[10:], f"{where}: {got}")
+
+
+def test_duckdb_bulk_load() -> None:
+    import datetime
+    import importlib.util
+
+    if importlib.util.find_spec("duckdb") is None:
+        print("  skipped: duckdb not installed")
+        return
+    import duckdb
+    from shiftd.serializers.duckdb_serializer import DuckDBSerializer
+
+    rows = [
+        {
+            "id": i,
+            "name": ["", 'a,"b\nc', None][i % 3],
+            "score": i / 2,
+            "day": datetime.date(2024, 1, i + 1),
+            "raw": b"\x00,x",
+            "mixed": i or "a",
+        }
+        for i in range(5)
+    ]
+    table = TableModel(columns=list(rows[0]), rows=rows)
+    expected = [(*r.values(),)[:5] + (str(r["mixed"]),) for r in rows] * 2
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        DuckDBSerializer().write_batches([table, table], tmp / "arrow.duckdb")
+        # The fallback used without pyarrow: a CSV spool loaded with COPY.
+        conn = duckdb.connect(str(tmp / "csv.duckdb"))
+        try:
+            DuckDBSerializer._load_rows(conn, "data", table, iter([table]))
+        finally:
+            conn.close()
+        for name in ("arrow.duckdb", "csv.duckdb"):
+            conn = duckdb.connect(str(tmp / name), read_only=True)
+            try:
+                types = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT data_type FROM information_schema.columns WHERE table_name = 'data'"
+                    ).fetchall()
+                ]
+                _assert(
+                    types == ["BIGINT", "VARCHAR", "DOUBLE", "DATE", "BLOB", "VARCHAR"],
+                    f"{name}: {types}",
+                )
+                _assert(conn.execute("SELECT * FROM data").fetchall() == expected, name)
+            finally:
+                conn.close()
+
+        # Types drift across batches: int then float, all-null then values, int then str.
+        drift = [
+            TableModel.from_columns(
+                ["n", "late", "clash"], {"n": [1, 2], "late": [None, None], "clash": [1, 2]}
+            ),
+            TableModel.from_columns(
+                ["n", "late", "clash"], {"n": [2.5, 3.7], "late": ["x", None], "clash": ["a", "b"]}
+            ),
+        ]
+        want = [(1.0, None, "1"), (2.0, None, "2"), (2.5, "x", "a"), (3.7, None, "b")]
+        DuckDBSerializer().write_batches(drift, tmp / "drift.duckdb")
+        conn = duckdb.connect(str(tmp / "drift_csv.duckdb"))
+        try:
+            DuckDBSerializer._load_rows(conn, "data", drift[0], iter(drift[1:]))
+        finally:
+            conn.close()
+        for name in ("drift.duckdb", "drift_csv.duckdb"):
+            conn = duckdb.connect(str(tmp / name), read_only=True)
+            try:
+                got = conn.execute("SELECT * FROM data").fetchall()
+                _assert(got == want, f"{name}: {got}")
+                types = [r[1] for r in conn.execute("DESCRIBE data").fetchall()]
+                _assert(types == ["DOUBLE", "VARCHAR", "VARCHAR"], f"{name}: {types}")
+            finally:
+                conn.close()
+
+
+def test_duckdb_reader() -> None:
+    import importlib.util
+
+    if importlib.util.find_spec("duckdb") is None:
+        print("  skipped: duckdb not installed")
+        return
+    import duckdb
+    from shiftd.parsers.duckdb_parser import DuckDBParser
+
+    with tempfile.TemporaryDirectory() as d:
+        db = Path(d) / "in.duckdb"
+        conn = duckdb.connect(str(db))
+        conn.execute("CREATE TABLE t AS SELECT range AS id, 'n' || range AS name FROM range(10)")
+        conn.execute("CREATE SCHEMA s")
+        conn.execute("CREATE TABLE s.u AS SELECT 1 AS a")
+        conn.close()
+
+        batches = list(DuckDBParser("t", where="id > ?", params=[2]).iter_batches(db, batch_size=3))
+        _assert([len(b.rows) for b in batches] == [3, 3, 1], f"{[len(b.rows) for b in batches]}")
+        _assert(TableModel.concat(batches).column("id")[0] == 3)
+        t = DuckDBParser(
+            query="SELECT name, id * 2 AS d FROM t",
+            columns=["d"],
+            where="d > $lo",
+            params={"lo": 15},
+        ).parse(db)
+        _assert(t.columns == ["d"] and list(t.column("d")) == [16, 18], f"{t.rows}")
+        _assert(len(DuckDBParser(query="SELECT * FROM t", limit=4).parse(db).rows) == 4)
+        _assert(DuckDBParser("s.u").parse(db).rows[0] == {"a": 1})
+        empty = list(DuckDBParser("t", where="false").iter_batches(db))
+        _assert(len(empty) == 1 and empty[0].columns == ["id", "name"] and not empty[0].rows)
+
+
+def test_query_pushdown() -> None:
+    from shiftd.cli import main
+    from shiftd.parsers.csv_parser import CSVParser
+    from shiftd.parsers.registry import is_query_parser
+    from shiftd.parsers.sqlite_parser import SQLiteParser
+    from shiftd.query import Expr, col, parse_where
+
+    expr = parse_where("age >= 18 and country in ('IT', 'FR') and not email is None")
+    _assert(expr.columns() == {"age", "country", "email"}, f"{expr.columns()}")
+    _assert(parse_where("1 < age <= 3") == ((col("age") > 1) & (col("age") <= 3)))
+    _assert(is_query_parser(SQLiteParser) and not is_query_parser(CSVParser))
+
+    class Partial(Expr):  # no to_sql/to_arrow/predicate
+        def columns(self) -> set[str]:
+            return set()
+
+    try:
+        Partial()  # type: ignore[abstract]
+        _assert(False, "Expected TypeError for an incomplete Expr")
+    except TypeError:
+        pass
+    for bad in ("age + 1 > 2", "f(age)", "age >= other"):
+        try:
+            parse_where(bad)
+            _assert(False, f"Expected ValueError for {bad!r}")
+        except ValueError:
+            pass
+
+    engine = Engine()
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        rows = [{"id": i, "age": 10 + i, "country": "IT" if i % 2 else "DE"} for i in range(20)]
+        csv_file = tmp / "people.csv"
+        engine.serialize(TableModel(columns=["id", "age", "country"], rows=rows), csv_file)
+        where = "age >= 18 and country == 'IT'"
+
+        # Streaming fallback: text cells are compared as numbers, the limit stops the read.
+        t = engine.parse(csv_file, columns=["country", "id"], where=where, limit=3)
+        _assert(t.columns == ["country", "id"], f"{t.columns}")
+        _assert([r["id"] for r in t.iter_dicts()] == ["9", "11", "13"], f"{t.rows}")
+        batches = list(engine.iter_batches(csv_file, batch_size=4, where="age > 99"))
+        _assert(len(batches) == 1 and batches[0].columns == ["id", "age", "country"])
+        try:
+            engine.parse(csv_file, columns=["nope"])
+            _assert(False, "Expected ValueError for unknown column")
+        except ValueError as e:
+            _assert("nope" in str(e), str(e))
+
+        # SQL semantics for nulls: a comparison with NULL is neither true nor false.
+        jsonl = tmp / "n.jsonl"
+        jsonl.write_text('{"a": 1}\n{"a": null}\n{"a": 3}\n', encoding="utf-8")
+        _assert(len(engine.parse(jsonl, where="not a == 1").rows) == 1)
+        _assert(len(engine.parse(jsonl, where=col("a").is_null()).rows) == 1)
+
+        typed = TableModel(columns=["id", "age", "country"], rows=rows)
+        db = tmp / "people.db"
+        engine.serialize(typed, db)
+        t = engine.parse(db, columns=["id"], where=col("age") >= 18, limit=2)
+        _assert([r["id"] for r in t.iter_dicts()] == [8, 9], f"{t.rows}")
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("  skipped: pyarrow not installed (Parquet/Arrow pushdown)")
+        else:
+            for fmt in ("parquet", "arrow"):
+                target = tmp / f"people.{fmt}"
+                engine.serialize(typed, target, format=fmt)
+                t = engine.parse(target, columns=["id"], where=where, limit=2)
+                _assert(t.is_arrow and list(t.column("id")) == [9, 11], f"{fmt}: {t.rows}")
+                empty = engine.parse(target, columns=["age", "id"], where="age > 99")
+                _assert(empty.columns == ["age", "id"] and not empty.rows, f"{fmt}: {empty}")
+
+        out = tmp / "adults.json"
+        old_argv = sys.argv
+        sys.argv = [
+            "shiftd",
+            "convert",
+            "--columns",
+            "id,country",
+            "--where",
+            "age >= 18 and country == 'IT'",
+            "--limit",
+            "1",
+            str(csv_file),
+            str(out),
+        ]
+        try:
+            main()
+        finally:
+            sys.argv = old_argv
+        _assert(json.loads(out.read_text()) == [{"id": "9", "country": "IT"}], out.read_text())
+
+
+def test_streaming_type_drift() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("  skipped: pyarrow not installed")
+        return
+    engine = Engine()
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        src = tmp / "drift.jsonl"
+        values = [None, None, 0, 1, 0.5, 2.5]
+        src.write_text("".join(json.dumps({"a": v}) + "\n" for v in values), encoding="utf-8")
+        clash = tmp / "clash.jsonl"
+        clash.write_text('{"a": 1}\n{"a": 2}\n{"a": "x"}\n', encoding="utf-8")
+        for fmt in ("parquet", "arrow"):
+            target = tmp / f"drift.{fmt}"
+            # Batches of two: all-null, then ints, then floats.
+            engine.convert(src, target, streaming=True, batch_size=2)
+            got = list(engine.parse(target).column("a"))
+            _assert(got == [None, None, 0.0, 1.0, 0.5, 2.5], f"{fmt}: {got}")
+            try:
+                engine.convert(clash, tmp / f"clash.{fmt}", streaming=True, batch_size=2)
+                _assert(False, f"{fmt}: expected ValueError for int then str")
+            except ValueError as e:
+                _assert("'a'" in str(e), str(e))
+
+
 # -- Runner -----------------------------------------------------------------
 
 
@@ -244,7 +1425,9 @@ def main_tests() -> None:
     test_convert_toml_to_json()
     test_convert_csv_to_tsv()
     test_convert_with_explicit_to()
+    test_convert_streaming()
     test_batch()
+    test_batch_parallel()
     test_parse_and_serialize()
     test_formats()
     test_cli_convert()
@@ -254,6 +1437,33 @@ def main_tests() -> None:
     test_table_model_extra_key()
     test_table_model_missing_key()
     test_table_model_duplicate_columns()
+    test_table_model_validation_levels()
+    test_table_model_from_columns()
+    test_columnar_behaviour()
+    test_record_rows()
+    test_csv_parse_columnar()
+    test_arrow_native_path()
+    test_csv_parallel()
+    test_infer_types()
+    test_json_streaming()
+    test_jsonl_parallel()
+    test_xml_streaming()
+    test_xml_serializer_streaming()
+    test_html_tables()
+    test_toon_codec()
+    test_excel_sheets()
+    test_yaml_streams()
+    test_sqlite_bulk_write()
+    test_sqlite_reader()
+    test_postgres_copy_stream()
+    test_postgres_bulk_load()
+    test_postgres_reader()
+    test_mysql_bulk_load()
+    test_mysql_reader()
+    test_duckdb_bulk_load()
+    test_duckdb_reader()
+    test_query_pushdown()
+    test_streaming_type_drift()
     print("All tests passed.")
 
 